@@ -466,6 +466,215 @@ def test_binaryfile_read_context(freyberg_model_path):
     assert str(e.value) == "seek of closed file", str(e.value)
 
 
+@pytest.fixture
+def layered_head_file(function_tmpdir):
+    nlay, nrow, ncol, ntimes = 3, 4, 5, 6
+    rng = np.random.default_rng(0)
+    data = rng.random((ntimes, nlay, nrow, ncol))
+    pth = function_tmpdir / "layered.hds"
+    with open(pth, "wb") as f:
+        for t in range(ntimes):
+            for k in range(nlay):
+                write_head(f, data[t, k], kper=t + 1, totim=float(t + 1), ilay=k + 1)
+    return pth, data
+
+
+def test_headfile_mmap(layered_head_file):
+    pth, data = layered_head_file
+    with HeadFile(pth) as hds, HeadFile(pth, mmap=True) as hds_mm:
+        # vectorized index matches the sequential index
+        np.testing.assert_array_equal(hds_mm.recordarray, hds.recordarray)
+        np.testing.assert_array_equal(hds_mm.iposarray, hds.iposarray)
+        assert hds_mm.times == hds.times
+        assert hds_mm.kstpkper == hds.kstpkper
+        assert hds_mm.nlay == 3
+        pd.testing.assert_frame_equal(hds_mm.headers, hds.headers)
+
+        # data are returned as read-only views
+        h = hds_mm.get_data(totim=3.0)
+        assert not h.flags.writeable
+        np.testing.assert_array_equal(h, data[2])
+        np.testing.assert_array_equal(hds_mm.get_data(idx=5, mflay=1), data[1, 1])
+        alldata = hds_mm.get_alldata(nodata=None)
+        assert not alldata.flags.writeable
+        np.testing.assert_array_equal(alldata, data)
+        np.testing.assert_array_equal(hds_mm.get_alldata(mflay=2), data[:, 2])
+        np.testing.assert_array_equal(hds_mm.get_ts((1, 2, 3)), hds.get_ts((1, 2, 3)))
+    assert hds_mm._mm is None
+
+
+@pytest.mark.parametrize("mmap", [False, True])
+def test_headfile_get_ts_many_cells(layered_head_file, mmap):
+    pth, data = layered_head_file
+    ntimes, nlay, nrow, ncol = data.shape
+    idx = [(k, i, j) for k in range(nlay) for i in range(nrow) for j in range(ncol)]
+    with HeadFile(pth, mmap=mmap) as hds:
+        ts = hds.get_ts(idx)
+        assert ts.shape == (ntimes, len(idx) + 1)
+        np.testing.assert_array_equal(ts[:, 0], np.arange(1, ntimes + 1))
+        np.testing.assert_array_equal(ts[:, 1:], data.reshape((ntimes, -1)))
+        ts = hds.get_ts([(2, 3, 4), (0, 0, 1)])
+        np.testing.assert_array_equal(ts[:, 1], data[:, 2, 3, 4])
+        np.testing.assert_array_equal(ts[:, 2], data[:, 0, 0, 1])
+
+
+@pytest.mark.parametrize("mmap", [False, True])
+def test_headfile_index_file(layered_head_file, monkeypatch, mmap):
+    pth, data = layered_head_file
+    with HeadFile(pth, mmap=mmap, cache_index=True) as hds:
+        headers = hds.headers
+        times = hds.times
+        kstpkper = hds.kstpkper
+    assert pth.with_suffix(".hds.idx").is_file()
+
+    with monkeypatch.context() as m:
+        m.setattr(HeadFile, "_scan_index", None)
+        m.setattr(HeadFile, "_build_index_mmap", None)
+        hds = HeadFile(pth, mmap=mmap, cache_index=True)
+    with hds:
+        pd.testing.assert_frame_equal(hds.headers, headers)
+        assert hds.times == times
+        assert hds.kstpkper == kstpkper
+        assert (hds.nlay, hds.nrow, hds.ncol) == data.shape[1:]
+        np.testing.assert_array_equal(hds.get_alldata(), data)
+        if mmap:
+            assert not hds.get_data().flags.writeable
+        hds.rebuild_index()
+        pd.testing.assert_frame_equal(hds.headers, headers)
+
+
+def test_headfile_index_file_text(function_tmpdir):
+    pth = function_tmpdir / "head_drawdown.hds"
+    with open(pth, "wb") as f:
+        write_head(f, np.ones((2, 3)), text="            HEAD")
+        write_head(f, -np.ones((2, 3)), text="        DRAWDOWN")
+    with HeadFile(pth, text="head", cache_index=True) as hds:
+        np.testing.assert_array_equal(hds.get_data(), 1.0)
+    # the index file of another text is not used
+    with HeadFile(pth, text="drawdown", cache_index=True) as hds:
+        np.testing.assert_array_equal(hds.get_data(), -1.0)
+
+    # a corrupt index file is rebuilt
+    idx = pth.with_suffix(".hds.idx")
+    idx.write_bytes(idx.read_bytes()[:100])
+    with HeadFile(pth, text="drawdown", cache_index=True) as hds:
+        np.testing.assert_array_equal(hds.get_data(), -1.0)
+    with HeadFile(pth, text="drawdown", cache_index=True) as hds:
+        np.testing.assert_array_equal(hds.get_data(), -1.0)
+    # no temporary index files are left behind
+    assert sorted(function_tmpdir.iterdir()) == sorted([pth, idx])
+
+
+@pytest.mark.parametrize("mmap", [False, True])
+def test_headfile_refresh(layered_head_file, function_tmpdir, mmap):
+    pth, data = layered_head_file
+    content = pth.read_bytes()
+    recordbytes = len(content) // 18
+
+    # open while the model is still writing the third time step
+    growing = function_tmpdir / "growing.hds"
+    growing.write_bytes(content[: 7 * recordbytes + 50])
+    with pytest.warns(UserWarning, match="incomplete record"):
+        hds = HeadFile(growing, precision="double", mmap=mmap)
+    with hds:
+        assert len(hds) == 7
+        assert hds.times == [1.0, 2.0, 3.0]
+        assert hds.refresh() == []
+
+        with open(growing, "ab") as f:
+            f.write(content[7 * recordbytes + 50 :])
+        assert hds.refresh() == [4.0, 5.0, 6.0]
+        assert len(hds) == 18
+        assert len(hds.headers) == 18
+        np.testing.assert_array_equal(hds.get_alldata(), data)
+        np.testing.assert_array_equal(hds.get_ts((2, 3, 4))[:, 1], data[:, 2, 3, 4])
+        assert list(hds.follow(poll_interval=0.0, timeout=0.0)) == hds.times
+
+
+@pytest.mark.parametrize("mmap", [False, True])
+@pytest.mark.parametrize("nbytes, nrecords", [(100, 0), (26703, 0), (40100, 1)])
+def test_headfile_incomplete_record(
+    example_data_path, function_tmpdir, mmap, nbytes, nrecords
+):
+    src = example_data_path / "mfusg_test/03B_conduit_unconfined/output/ex3B.hds"
+    content = src.read_bytes()
+    with HeadFile(src) as hds:
+        expected = hds.get_alldata()
+
+    # open before the first or second record has been completely written
+    growing = function_tmpdir / "growing.hds"
+    growing.write_bytes(content[:nbytes])
+    with pytest.warns(UserWarning, match="incomplete record"):
+        hds = HeadFile(growing, mmap=mmap)
+    with hds:
+        assert len(hds) == nrecords
+        assert hds.nlay == 1
+        hds.refresh()
+        assert len(hds) == nrecords
+
+        with open(growing, "ab") as f:
+            f.write(content[nbytes:])
+        hds.refresh()
+        assert len(hds) == 2
+        assert hds.nlay == 2
+        assert hds.times == [160.0]
+        np.testing.assert_array_equal(hds.get_alldata(), expected)
+
+
+@pytest.mark.parametrize("mmap", [False, True])
+@pytest.mark.parametrize("workers", [None, 3])
+def test_headfile_lazydata(layered_head_file, mmap, workers):
+    pth, data = layered_head_file
+    with HeadFile(pth, mmap=mmap) as hds:
+        heads = hds.get_lazydata(
+            nodata=None, time_chunk=4, layer_chunk=2, workers=workers
+        )
+        assert heads.shape == data.shape
+        assert len(heads) == 6
+        assert heads.chunks[:2] == [
+            (slice(0, 4), slice(0, 2)),
+            (slice(0, 4), slice(2, 3)),
+        ]
+        np.testing.assert_array_equal(np.asarray(heads), data)
+        np.testing.assert_array_equal(heads[2], data[2])
+        np.testing.assert_array_equal(heads[1:5, 2], data[1:5, 2])
+        np.testing.assert_array_equal(heads[[5, 0, 5], 1:, 3], data[[5, 0, 5], 1:, 3])
+        np.testing.assert_array_equal(heads[..., 4], data[..., 4])
+        np.testing.assert_array_equal(list(heads), list(data))
+        for key, chunk in heads.iter_chunks():
+            np.testing.assert_array_equal(chunk, data[key])
+
+        np.testing.assert_allclose(heads.min(), data.min(axis=0))
+        np.testing.assert_allclose(heads.max(), data.max(axis=0))
+        np.testing.assert_allclose(heads.mean(), data.mean(axis=0))
+        np.testing.assert_allclose(heads.mean(axis=None), data.mean())
+        assert heads.max(axis=None) == data.max()
+
+        layer = hds.get_lazydata(mflay=1, time_chunk=5, workers=workers)
+        assert layer.shape == data[:, 1].shape
+        np.testing.assert_array_equal(layer[:], hds.get_alldata(mflay=1))
+        np.testing.assert_allclose(layer.mean(), data[:, 1].mean(axis=0))
+
+
+def test_headufile_lazydata(example_data_path):
+    pth = example_data_path / "unstructured" / "headu.githds"
+    with HeadUFile(pth) as hds:
+        heads = hds.get_lazydata(nodata=None, time_chunk=1, layer_chunk=1, workers=2)
+        expected = np.concatenate(hds.get_data())
+        assert heads.shape == (len(hds.times), len(expected))
+        np.testing.assert_array_equal(heads[-1], expected)
+        np.testing.assert_array_equal(heads.max(), np.nanmax(heads[:], axis=0))
+
+
+def test_headufile_mmap(example_data_path):
+    # records have different sizes, so the index is built by scanning
+    pth = example_data_path / "unstructured" / "headu.githds"
+    with HeadUFile(pth) as hds, HeadUFile(pth, mmap=True) as hds_mm:
+        np.testing.assert_array_equal(hds_mm.iposarray, hds.iposarray)
+        for d, d_mm in zip(hds.get_data(), hds_mm.get_data()):
+            np.testing.assert_array_equal(d_mm, d)
+
+
 def test_binaryfile_reverse_mf6_dis(function_tmpdir):
     name = "reverse_dis"
     sim = flopy.mf6.MFSimulation(sim_name=name, sim_ws=function_tmpdir, exe_name="mf6")
@@ -761,7 +970,9 @@ def test_read_mf6_2sp(mf6_gwf_2sp_st_tr):
 
 @pytest.mark.parametrize("compact", [True, False])
 def test_read_mf2005_freyberg(example_data_path, function_tmpdir, compact):
-    m = flopy.modflow.Modflow.load(example_data_path / "freyberg" / "freyberg.nam")
+    m = flopy.modflow.Modflow.load(
+        example_data_path / "freyberg" / "freyberg.nam", check=False
+    )
     m.change_model_ws(function_tmpdir)
     oc = m.get_package("OC")
     oc.compact = compact
@@ -1,4 +1,5 @@
 import os
+import shutil
 
 import numpy as np
 import pandas as pd
@@ -6,7 +7,7 @@ import pytest
 
 from autotest.conftest import get_example_data_path
 from flopy.mf6.modflow.mfsimulation import MFSimulation
-from flopy.utils.binaryfile import CellBudgetFile
+from flopy.utils.binaryfile import CellBudgetFile, read_index_file
 
 # test low-level CellBudgetFile._build_index() method
 
@@ -328,6 +329,33 @@ def test_load_cell_budget_file_timeseries(example_data_path):
     assert ts.shape == (4, 2)
 
 
+def test_cellbudgetfile_get_ts_many_cells(example_data_path):
+    pth = example_data_path / "mf2005_test" / "test1tr.gitcbc"
+    with CellBudgetFile(pth) as cbc:
+        idx = [
+            (k, i, j)
+            for k in range(cbc.nlay)
+            for i in range(cbc.nrow)
+            for j in range(0, cbc.ncol, 3)
+        ]
+        kij = tuple(np.array(idx).T)
+        texts = [t.decode().strip() for t in cbc.get_unique_record_names()]
+        ts = cbc.get_ts(idx, text=texts)
+        assert list(ts) == texts
+        for text in texts:
+            assert ts[text].shape == (len(cbc.times), len(idx) + 1)
+            np.testing.assert_allclose(ts[text][:, 0], cbc.times)
+            for itim, kstpkper in enumerate(cbc.get_kstpkper()):
+                data = cbc.get_data(kstpkper=kstpkper, text=text, full3D=True)
+                arr = np.ma.asarray(data[0])
+                if arr.ndim == 2:
+                    # imeth 4 records hold layer 1 values
+                    arr = arr[np.newaxis]
+                expected = np.ma.filled(arr[kij], np.nan)
+                np.testing.assert_allclose(ts[text][itim, 1:], expected, equal_nan=True)
+        np.testing.assert_array_equal(cbc.get_ts(idx, text=texts[0]), ts[texts[0]])
+
+
 _example_data_path = get_example_data_path()
 
 
@@ -422,6 +450,76 @@ def test_cellbudgetfile_position(function_tmpdir, zonbud_model_path):
         CellBudgetFile(fname)
 
 
+# index file
+
+
+@pytest.mark.parametrize(
+    "name", ["mf6-freyberg/freyberg.cbc", "mt3d_test/mf2kmt3d/mnw/t5.cbc"]
+)
+def test_cellbudgetfile_index_file(
+    example_data_path, function_tmpdir, monkeypatch, name
+):
+    pth = function_tmpdir / "model.cbc"
+    shutil.copy(example_data_path / name, pth)
+    idx_pth = function_tmpdir / "model.cbc.idx"
+
+    with CellBudgetFile(pth) as cbc:
+        assert not idx_pth.exists()
+        expected = cbc.get_data(idx=len(cbc) - 1)[0]
+    with CellBudgetFile(pth, cache_index=True) as cbc:
+        assert idx_pth.is_file()
+        ref = {
+            name: getattr(cbc, name)
+            for name in ["times", "kstpkper", "textlist", "imethlist", "nlay"]
+        }
+        headers = cbc.headers
+
+    # index is loaded from the index file instead of scanning
+    with monkeypatch.context() as m:
+        m.setattr(CellBudgetFile, "_scan_index", None)
+        cbc = CellBudgetFile(pth, cache_index=True)
+    with cbc:
+        for name, value in ref.items():
+            assert getattr(cbc, name) == value
+        pd.testing.assert_frame_equal(cbc.headers, headers)
+        np.testing.assert_array_equal(cbc.get_data(idx=len(cbc) - 1)[0], expected)
+        cbc.rebuild_index()
+        pd.testing.assert_frame_equal(cbc.headers, headers)
+
+    # index file is invalidated when the budget file changes
+    with open(pth, "ab") as f:
+        f.write(b"\0")
+    assert read_index_file(pth, "CellBudgetFile") is None
+
+
+def test_cellbudgetfile_refresh(example_data_path, function_tmpdir):
+    src = example_data_path / "mf6/create_tests/test028_sfr/expected_output/test1tr.cbc"
+    content = src.read_bytes()
+    with CellBudgetFile(src) as cbc:
+        headers = cbc.headers
+        times = cbc.times
+        iposheader = cbc.iposheader
+        expected = cbc.get_data(idx=len(cbc) - 1)[0]
+
+    # open while the model is writing a record of the second time step
+    nbytes = iposheader[np.searchsorted(headers["totim"], times[1]) + 2] + 100
+    pth = function_tmpdir / "growing.cbc"
+    pth.write_bytes(content[:nbytes])
+    with pytest.warns(UserWarning, match="incomplete record"):
+        cbc = CellBudgetFile(pth)
+    with cbc:
+        assert cbc.times == times[:2]
+        assert len(cbc) < len(headers)
+        assert cbc.refresh() == []
+
+        with open(pth, "ab") as f:
+            f.write(content[nbytes:])
+        assert cbc.refresh() == times[2:]
+        pd.testing.assert_frame_equal(cbc.headers, headers)
+        np.testing.assert_array_equal(cbc.get_data(idx=len(cbc) - 1)[0], expected)
+        assert list(cbc.follow(poll_interval=0.0, timeout=0.0)) == times
+
+
 # read context
 
 
@@ -1,15 +1,19 @@
 import os
 import platform
+import warnings
+from io import StringIO
 from os import getcwd
 from os.path import relpath, splitdrive
 from pathlib import Path
 from shutil import which
 
+import numpy as np
 import pytest
 from modflow_devtools.markers import requires_exe
 from modflow_devtools.misc import set_dir
 
-from flopy.utils.flopy_io import line_parse, relpath_safe
+from flopy.modflow import Modflow, ModflowRiv
+from flopy.utils.flopy_io import line_parse, relpath_safe, ulstrd
 
 
 def test_line_parse():
@@ -20,6 +24,53 @@ def test_line_parse():
     assert line == ["Well-A", "-1"]
 
 
+@pytest.mark.parametrize("free_format", [True, False])
+def test_ulstrd(free_format):
+    rows = [
+        (1, 2, 3, 10.5, 100.0, 9.0),
+        (1, 4, 5, -2.25, 1.5e-3, -3.0),
+        (2, 6, 7, 0.0, 0.0, 0.0),
+    ]
+    if free_format:
+        lines = [
+            "1 2 3 10.5 100.0 9.0 extra\n",
+            "1\t4\t5 -2.25 1.5e-3 -3.0 # comment\n",
+            "2 6 7\n",
+        ]
+    else:
+        lines = [
+            "".join(f"{value:>10}" for value in rows[0]) + "   extra\n",
+            "".join(f"{value:>10}" for value in rows[1]) + "\n",
+            f"{2:>10}{6:>10}{7:>10}\n",
+        ]
+    texts = ["".join(lines)]
+    if free_format:
+        # lists with commas are read one line at a time
+        texts.append(texts[0].replace(" 2 3", " 2,3"))
+    for text in texts:
+        m = Modflow()
+        m.free_format_input = free_format
+        f = StringIO(f"{text}next line\n")
+        ra = ModflowRiv.get_empty(len(rows))
+        ra = ulstrd(f, len(rows), ra, m, ["cond"], None)
+        assert f.readline() == "next line\n"
+        expected = ModflowRiv.get_empty(len(rows))
+        for ii, row in enumerate(rows):
+            expected[ii] = row
+        assert np.array_equal(ra, expected)
+
+
+def test_ulstrd_blank_lines():
+    # lists of only blank or comment lines are read one line at a time
+    m = Modflow()
+    f = StringIO("\n# comment\n")
+    ra = ModflowRiv.get_empty(2)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        ra = ulstrd(f, 2, ra, m, [], None)
+    assert np.array_equal(ra, ModflowRiv.get_empty(2))
+
+
 @requires_exe("mf6")
 @pytest.mark.parametrize("scrub", [True, False])
 @pytest.mark.parametrize("use_paths", [True, False])
@@ -1,5 +1,7 @@
 import os
 import re
+import subprocess
+import sys
 from pathlib import Path
 
 import numpy as np
@@ -15,6 +17,26 @@ def test_import_and_version_string():
     Version(flopy.__version__)
 
 
+def test_lazy_imports():
+    # subpackages and mf6 package classes are imported on first access
+    script = (
+        "import sys, flopy\n"
+        "assert 'flopy.mf6' not in sys.modules\n"
+        "assert 'flopy.modflow' not in sys.modules\n"
+        "flopy.mf6.ModflowGwfchd\n"
+        "assert 'flopy.mf6.modflow.mfgwfchd' in sys.modules\n"
+        "assert 'flopy.mf6.modflow.mfgwfwel' not in sys.modules\n"
+        "from flopy.mf6 import ModflowGwfwel\n"
+        "assert 'flopy.mf6.modflow.mfgwfwel' in sys.modules\n"
+        "assert 'matplotlib.pyplot' not in sys.modules\n"
+        "flopy.mf6.modflow.mfims.ModflowIms\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)
+
+    assert "ModflowGwfchd" in dir(flopy.mf6)
+    assert flopy.mf6.ModflowGwfchd is flopy.mf6.modflow.mfgwfchd.ModflowGwfchd
+
+
 def test_modflow():
     import flopy
 
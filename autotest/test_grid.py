@@ -347,6 +347,34 @@ def test_structured_xyz_intersect(example_data_path):
             raise AssertionError("Structured grid intersection failed")
 
 
+def test_structured_intersect_arrays(example_data_path):
+    ml = Modflow.load(
+        "freyberg.nam",
+        model_ws=example_data_path / "freyberg_multilayer_transient",
+        check=False,
+    )
+    mg = ml.modelgrid
+
+    xc, yc, zc = mg.xyzcellcenters
+    k, i, j = np.indices(mg.shape).reshape(3, -1)
+    x, y, z = xc[i, j], yc[i, j], zc[k, i, j]
+
+    i2, j2 = mg.intersect(x, y)
+    assert np.array_equal(i2, i) and np.array_equal(j2, j)
+    k2, i2, j2 = mg.intersect(x, y, z)
+    assert np.array_equal(k2, k)
+    assert np.array_equal(i2, i) and np.array_equal(j2, j)
+
+    # points outside of the grid
+    x = np.append(x, xc.max() + 1e6)
+    y = np.append(y, yc.max() + 1e6)
+    with pytest.raises(Exception):
+        mg.intersect(x, y)
+    i2, j2 = mg.intersect(x, y, forgive=True)
+    assert np.array_equal(i2[:-1], i) and np.array_equal(j2[:-1], j)
+    assert np.isnan(i2[-1]) and np.isnan(j2[-1])
+
+
 def test_vertex_xyz_intersect(example_data_path):
     sim = MFSimulation.load(sim_ws=example_data_path / "mf6" / "test003_gwfs_disv")
     ml = sim.get_model(next(iter(sim.model_names)))
@@ -419,6 +447,31 @@ def test_unstructured_xyz_intersect(example_data_path):
             raise AssertionError("Unstructured grid intersection failed")
 
 
+def test_vertex_intersect_arrays(example_data_path):
+    sim = MFSimulation.load(sim_ws=example_data_path / "mf6" / "test003_gwfs_disv")
+    ml = sim.get_model(next(iter(sim.model_names)))
+    mg = ml.modelgrid
+
+    xc, yc, zc = mg.xyzcellcenters
+    icell = np.arange(mg.ncpl)
+    lay = icell % mg.nlay
+    x, y, z = xc[icell], yc[icell], zc[lay, icell]
+
+    assert np.array_equal(mg.intersect(x, y), icell)
+    lay1, icell1 = mg.intersect(x, y, z)
+    assert np.array_equal(lay1, lay)
+    assert np.array_equal(icell1, icell)
+
+    # points outside of the grid
+    x = np.append(x, xc.max() + 1e6)
+    y = np.append(y, yc.max() + 1e6)
+    with pytest.raises(Exception):
+        mg.intersect(x, y)
+    icell1 = mg.intersect(x, y, forgive=True)
+    assert np.array_equal(icell1[:-1], icell)
+    assert np.isnan(icell1[-1])
+
+
 @pytest.mark.parametrize("spc_file", ["grd.spc", "grdrot.spc"])
 def test_structured_from_gridspec(example_data_path, spc_file):
     fn = example_data_path / "specfile" / spc_file
@@ -1,5 +1,6 @@
 import os
 import platform
+import time
 from pathlib import Path
 from shutil import copytree, which
 
@@ -57,7 +58,12 @@ from flopy.mf6.coordinates.modeldimensions import (
     PackageDimensions,
 )
 from flopy.mf6.data.mffileaccess import MFFileAccessArray
-from flopy.mf6.data.mfstructure import MFDataItemStructure, MFDataStructure
+from flopy.mf6.data.mfstructure import (
+    MFDataItemStructure,
+    MFDataStructure,
+    MFStructure,
+)
+from flopy.mf6.mfbase import FlopyException, PackageContainer
 from flopy.mf6.mfsimbase import MFSimulationData
 from flopy.mf6.modflow import (
     mfgwf,
@@ -894,6 +900,246 @@ def test_binary_read(function_tmpdir):
     assert np.allclose(arr, arr2), "Binary read for Unstructured failed"
 
 
+def test_array_file_entry_format(function_tmpdir):
+    sim = MFSimulation(sim_ws=function_tmpdir)
+    gwf = ModflowGwf(sim, modelname="gwf")
+    ModflowGwfdis(gwf, nlay=1, nrow=2, ncol=5)
+    npf = ModflowGwfnpf(
+        gwf,
+        k=[[1.0, 2.5e6, 0.0005, 0.0, -3.5], [7, 1e-3, 1e5, 123.456789, -1e-12]],
+        icelltype=[[0, 1, 2, 3, 4], [5, 6, 7, 8, 9]],
+    )
+
+    # wrap at max_columns_of_data and at the end of each row
+    sim.simulation_data.max_columns_of_data = 3
+    assert npf.k.get_file_entry() == (
+        "  k\n"
+        "    INTERNAL  FACTOR  1.0\n"
+        "         1.00000000  2.50000000E+06  5.00000000E-04\n"
+        "         0.00000000      -3.50000000\n"
+        "         7.00000000       0.00100000  100000.00000000\n"
+        "       123.45678900  -1.00000000E-12\n"
+    )
+    assert npf.icelltype.get_file_entry() == (
+        "  icelltype\n"
+        "    INTERNAL  FACTOR  1\n"
+        "    0  1  2\n"
+        "    3  4\n"
+        "    5  6  7\n"
+        "    8  9\n"
+    )
+
+    # no wrapping
+    sim.simulation_data.wrap_multidim_arrays = False
+    assert npf.k.get_file_entry() == (
+        "  k\n"
+        "    INTERNAL  FACTOR  1.0\n"
+        "  1.00000000  2.50000000E+06  5.00000000E-04       0.00000000"
+        "      -3.50000000       7.00000000       0.00100000  100000.00000000"
+        "     123.45678900  -1.00000000E-12\n"
+    )
+
+
+def test_load_text_arrays(function_tmpdir):
+    sim = MFSimulation(sim_ws=function_tmpdir)
+    ModflowTdis(sim)
+    ModflowIms(sim)
+    gwf = ModflowGwf(sim, modelname="gwf")
+    nlay, nrow, ncol = 2, 4, 25
+    k = np.random.default_rng(0).uniform(0, 100, (nlay, nrow, ncol)).round(3)
+    ModflowGwfdis(gwf, nlay=nlay, nrow=nrow, ncol=ncol)
+    ModflowGwfnpf(
+        gwf,
+        k={"filename": "k.txt", "data": k},
+        k33=k * 2,
+        icelltype=[{"filename": "icelltype.txt", "data": 1}, 0],
+    )
+    sim.write_simulation()
+
+    # comments and comma delimited lines are read with the numbers
+    fpth = function_tmpdir / "k.txt"
+    lines = open(fpth).readlines()
+    lines.insert(3, "# comment\n")
+    lines[5] = ",".join(lines[5].split()) + "\n"
+    with open(fpth, "w") as f:
+        f.writelines(lines)
+
+    sim = MFSimulation.load(sim_ws=function_tmpdir)
+    npf = sim.get_model("gwf").npf
+    assert np.array_equal(npf.k.array, k)
+    assert np.array_equal(npf.k33.array, k * 2)
+    icelltype = npf.icelltype.array
+    assert icelltype.dtype == np.int32
+    assert np.array_equal(icelltype[0], np.ones((nrow, ncol)))
+    assert np.array_equal(icelltype[1], np.zeros((nrow, ncol)))
+
+
+def test_load_stress_period_list(function_tmpdir):
+    sim = MFSimulation(sim_ws=function_tmpdir)
+    ModflowTdis(sim, nper=2, perioddata=[(1.0, 1, 1.0), (1.0, 1, 1.0)])
+    ModflowIms(sim)
+    gwf = ModflowGwf(sim, modelname="gwf")
+    ModflowGwfdis(gwf, nlay=2, nrow=10, ncol=10)
+    rng = np.random.default_rng(0)
+    cellids = list(
+        zip(
+            rng.integers(0, 2, 50).tolist(),
+            rng.integers(0, 10, 50).tolist(),
+            rng.integers(0, 10, 50).tolist(),
+        )
+    )
+    rates = rng.uniform(-100, 100, 50).round(3).tolist()
+    spd = {
+        0: [(c, q, 2 * q, f"w{i}") for i, (c, q) in enumerate(zip(cellids, rates))],
+        1: [(cellids[0], "wrate", 1.0, "w0")]
+        + [(c, q, 1.0) for c, q in zip(cellids[1:], rates[1:])],
+    }
+    wel = ModflowGwfwel(
+        gwf,
+        auxiliary=["conc"],
+        boundnames=True,
+        maxbound=50,
+        stress_period_data=spd,
+    )
+    wel.ts.initialize(
+        filename="wel.ts",
+        timeseries=[(0.0, 1.0), (2.0, 2.0)],
+        time_series_namerecord="wrate",
+        interpolation_methodrecord="linear",
+    )
+    sim.write_simulation()
+
+    sim = MFSimulation.load(sim_ws=function_tmpdir)
+    spd = sim.get_model("gwf").wel.stress_period_data
+    data = spd.get_data(0)
+    assert data["cellid"].tolist() == cellids
+    assert np.allclose(data["q"].astype(float), rates)
+    assert np.allclose(data["conc"], np.array(rates) * 2)
+    assert data["boundname"].tolist() == [f"w{i}" for i in range(50)]
+    data = spd.get_data(1)
+    assert data["cellid"].tolist() == cellids
+    assert data["q"][0] == "wrate"
+    assert float(data["q"][1]) == rates[1]
+    assert data["boundname"][0] == "w0"
+
+
+def test_get_data_as_columns(function_tmpdir):
+    sim = MFSimulation(sim_ws=function_tmpdir)
+    ModflowTdis(sim, nper=2, perioddata=[(1.0, 1, 1.0), (1.0, 1, 1.0)])
+    gwf = ModflowGwf(sim, modelname="gwf")
+    ModflowGwfdis(gwf, nlay=2, nrow=10, ncol=10)
+    spd = {
+        0: [((0, 1, 2), -10.0), ((1, 3, 4), -20.0)],
+        1: [((1, 5, 6), -30.0)],
+    }
+    wel = ModflowGwfwel(gwf, stress_period_data=spd)
+
+    columns = wel.stress_period_data.get_data(0, as_columns=True)
+    assert list(columns) == ["cellid_layer", "cellid_row", "cellid_column", "q"]
+    assert columns["cellid_layer"].tolist() == [0, 1]
+    assert columns["cellid_row"].tolist() == [1, 3]
+    assert columns["cellid_column"].tolist() == [2, 4]
+    assert columns["q"].tolist() == [-10.0, -20.0]
+    assert not columns["q"].flags.writeable
+    columns = wel.stress_period_data.get_data(as_columns=True)
+    assert columns[1]["cellid_row"].tolist() == [5]
+
+    # tuple cellids are still available and the stored data is unchanged
+    data = wel.stress_period_data.get_data(0)
+    assert data["cellid"].tolist() == [(0, 1, 2), (1, 3, 4)]
+    df = wel.stress_period_data.get_dataframe(0)
+    assert "cellid" not in df.columns
+
+
+def test_stacked_transient_list(function_tmpdir):
+    nper = 6
+    sim = MFSimulation(sim_ws=function_tmpdir)
+    ModflowTdis(sim, nper=nper, perioddata=[(1.0, 1, 1.0)] * nper)
+    ModflowIms(sim)
+    gwf = ModflowGwf(sim, modelname="gwf")
+    ModflowGwfdis(gwf, nlay=2, nrow=10, ncol=10)
+    wells = [((0, 1, 2), -10.0), ((1, 3, 4), -20.0)]
+    spd = dict.fromkeys(range(4), wells)
+    spd[4] = [((1, 5, 6), -30.0)]
+    spd[5] = [((1, 5, 6), -30.0)]
+    ModflowGwfwel(gwf, stress_period_data=spd)
+    sim.write_simulation()
+
+    sim = MFSimulation.load(sim_ws=function_tmpdir)
+    spd = sim.get_model("gwf").wel.stress_period_data
+
+    # stress periods identical to the previous period share their data
+    storage = spd._data_storage
+    assert all(storage[k].internal_data is storage[0].internal_data for k in range(4))
+    assert storage[5].internal_data is storage[4].internal_data
+    assert storage[4].internal_data is not storage[3].internal_data
+
+    df = spd.get_dataframe(stacked=True)
+    assert df.columns[0] == "kper"
+    assert len(df) == 10
+    q = df.groupby("kper")["q"].sum()
+    assert q.tolist() == [-30.0] * 4 + [-30.0] * 2
+    assert df["cellid_row"].tolist()[-2:] == [5, 5]
+
+    # stacked dataframes can be used to set data for each stress period
+    df.loc[df["kper"] == 2, "q"] = -50.0
+    spd.set_data(df)
+    assert spd.get_data(2)["q"].tolist() == [-50.0, -50.0]
+    assert spd.get_data(1)["q"].tolist() == [-10.0, -20.0]
+    assert spd._data_storage[2].internal_data is not storage[1].internal_data
+
+    # writing a shared period leaves the stored data unchanged
+    sim.write_simulation()
+    assert spd.get_data(0)["cellid"].tolist() == [(0, 1, 2), (1, 3, 4)]
+    sim = MFSimulation.load(sim_ws=function_tmpdir)
+    spd = sim.get_model("gwf").wel.stress_period_data
+    assert spd.get_data(2)["q"].tolist() == [-50.0, -50.0]
+    assert spd.get_data(3)["q"].tolist() == [-10.0, -20.0]
+
+
+def test_write_simulation_workers(function_tmpdir):
+    def build(ws):
+        sim = MFSimulation(sim_ws=ws)
+        ModflowTdis(sim, nper=3)
+        ModflowIms(sim)
+        for name in ["gwf1", "gwf2"]:
+            gwf = ModflowGwf(sim, modelname=name)
+            ModflowGwfdis(gwf, nlay=3, nrow=10, ncol=10)
+            ModflowGwfnpf(gwf, k=np.arange(300.0).reshape((3, 10, 10)))
+            ModflowGwfic(gwf, strt=1.0)
+            ModflowGwfwel(
+                gwf,
+                stress_period_data={kper: [((0, kper, 2), -1.0)] for kper in range(3)},
+            )
+        sim.set_all_data_external(external_data_folder="data")
+        return sim
+
+    def read_files(ws):
+        # file contents without the flopy header
+        return {
+            path.relative_to(ws): [
+                line for line in open(path).readlines() if not line.startswith("#")
+            ]
+            for path in ws.rglob("*.*")
+        }
+
+    # files written concurrently match files written one at a time
+    build(function_tmpdir / "serial").write_simulation()
+    build(function_tmpdir / "threaded").write_simulation(workers=4)
+    serial = read_files(function_tmpdir / "serial")
+    assert Path("data/gwf2.npf_k_layer3.txt") in serial
+    assert serial == read_files(function_tmpdir / "threaded")
+
+    # remaining files are written before errors are raised
+    (function_tmpdir / "errors" / "gwf1.npf").mkdir(parents=True)
+    (function_tmpdir / "errors" / "gwf2.npf").mkdir()
+    sim = build(function_tmpdir / "errors")
+    with pytest.raises(FlopyException, match="2 errors occurred while writing files"):
+        sim.write_simulation(workers=4)
+    assert (function_tmpdir / "errors" / "gwf2.wel").is_file()
+    assert (function_tmpdir / "errors" / "mfsim.nam").is_file()
+
+
 @requires_exe("mf6")
 def test_props_and_write(function_tmpdir):
     # workspace as str
@@ -2288,6 +2534,159 @@ def test_namefile_creation(function_tmpdir):
     assert ex_happened
 
 
+def test_load_simulation_workers(example_data_path):
+    sim_ws = example_data_path / "mf6" / "test006_2models_mvr"
+    sim = MFSimulation.load(sim_ws=sim_ws)
+    sim_threaded = MFSimulation.load(sim_ws=sim_ws, workers=2)
+
+    # models and their packages are registered in the same order
+    assert sim_threaded.model_names == sim.model_names
+    for name in sim.model_names:
+        model = sim.get_model(name)
+        model_threaded = sim_threaded.get_model(name)
+        assert [p.path for p in model_threaded.packagelist] == [
+            p.path for p in model.packagelist
+        ]
+        assert np.array_equal(model_threaded.dis.idomain.array, model.dis.idomain.array)
+    assert (
+        sim_threaded.simulation_data.max_columns_of_data
+        == sim.simulation_data.max_columns_of_data
+    )
+    assert len(sim_threaded.sim_package_list) == len(sim.sim_package_list)
+
+    # load_only is applied to every model
+    sim_threaded = MFSimulation.load(sim_ws=sim_ws, load_only=["chd", "wel"], workers=2)
+    for name in sim.model_names:
+        package_types = {
+            p.package_type for p in sim_threaded.get_model(name).packagelist
+        }
+        assert "npf" not in package_types
+        assert "dis" in package_types
+
+
+def test_write_simulation_only_modified(function_tmpdir, example_data_path):
+    sim_ws = example_data_path / "mf6" / "test006_2models_mvr"
+    sim = MFSimulation.load(sim_ws=sim_ws)
+
+    # nothing has changed since loading
+    model = sim.get_model("parent")
+    assert not any(p.is_modified() for p in model.packagelist)
+    assert not sim.name_file.is_modified()
+
+    # packages are always modified relative to a new workspace
+    sim.set_sim_path(function_tmpdir)
+    assert all(p.is_modified() for p in model.packagelist)
+    sim.write_simulation(only_modified=True)
+    assert not any(p.is_modified() for p in model.packagelist)
+    mtimes = {path: path.stat().st_mtime_ns for path in function_tmpdir.iterdir()}
+
+    # only changed packages are written
+    model.npf.k.set_data(model.npf.k.array * 2.0)
+    assert model.npf.is_modified()
+    assert not model.dis.is_modified()
+    time.sleep(0.01)
+    sim.write_simulation(only_modified=True)
+    rewritten = [
+        path.name
+        for path in function_tmpdir.iterdir()
+        if path.stat().st_mtime_ns != mtimes[path]
+    ]
+    assert rewritten == ["model1.npf"]
+    assert not model.npf.is_modified()
+
+    sim = MFSimulation.load(sim_ws=function_tmpdir)
+    k = sim.get_model("parent").npf.k.array
+    assert np.allclose(k, model.npf.k.array)
+
+
+def test_structure_cache(function_tmpdir, monkeypatch):
+    cache_file = function_tmpdir / "cache" / "mf6_structure.pickle"
+    monkeypatch.setattr(
+        MFStructure, "_structure_cache_file", staticmethod(lambda: cache_file)
+    )
+
+    # building the structure writes the cache
+    monkeypatch.setattr(MFStructure, "_instance", None)
+    structure = MFStructure()
+    assert cache_file.is_file()
+
+    # the cached structure is used without processing the package classes
+    def package_list():
+        raise AssertionError("structure was rebuilt")
+
+    with monkeypatch.context() as m:
+        m.setattr(PackageContainer, "package_list", staticmethod(package_list))
+        m.setattr(MFStructure, "_instance", None)
+        cached = MFStructure()
+    assert cached.flopy_dict == structure.flopy_dict
+    assert list(cached.dimension_dict) == list(structure.dimension_dict)
+    assert cached.sim_struct.model_types == structure.sim_struct.model_types
+    for path in [
+        ("gwf6", "npf", "griddata", "k"),
+        ("gwf6", "wel", "period", "stress_period_data"),
+    ]:
+        data_struct = cached.sim_struct.get_data_structure(path)
+        assert data_struct.get_datatype() == (
+            structure.sim_struct.get_data_structure(path).get_datatype()
+        )
+
+    # an invalid cache is replaced
+    cache_file.write_bytes(b"invalid")
+    monkeypatch.setattr(MFStructure, "_instance", None)
+    MFStructure()
+    assert cache_file.stat().st_size > 7
+    sim = MFSimulation(sim_ws=function_tmpdir)
+    gwf = ModflowGwf(sim)
+    ModflowGwfnpf(gwf, k=2.0)
+    assert gwf.npf.k.get_data() == 2.0
+
+
+@pytest.mark.parametrize("memory_map", [False, True])
+def test_simulation_snapshot(function_tmpdir, example_data_path, memory_map):
+    sim_ws = example_data_path / "mf6" / "test005_advgw_tidal"
+    sim = MFSimulation.load(sim_ws=sim_ws)
+    snapshot = function_tmpdir / "sim.snapshot"
+    sim.save_snapshot(snapshot)
+
+    restored = MFSimulation.load_snapshot(snapshot, memory_map=memory_map)
+    gwf = sim.get_model()
+    restored_gwf = restored.get_model()
+    assert restored.model_names == sim.model_names
+    assert [p.path for p in restored_gwf.packagelist] == [
+        p.path for p in gwf.packagelist
+    ]
+    # package structure is shared with loaded simulations
+    assert restored_gwf.npf.structure is gwf.npf.structure
+    assert np.array_equal(restored_gwf.npf.k.array, gwf.npf.k.array)
+    assert restored_gwf.wel.stress_period_data.get_dataframe(1).equals(
+        gwf.wel.stress_period_data.get_dataframe(1)
+    )
+
+    # restored simulations write the same input files
+    sim.set_sim_path(function_tmpdir / "loaded")
+    sim.write_simulation()
+    restored.set_sim_path(function_tmpdir / "restored")
+    restored.write_simulation()
+    for path in (function_tmpdir / "loaded").iterdir():
+        lines = open(path).readlines()[1:]
+        restored_path = function_tmpdir / "restored" / path.name
+        assert open(restored_path).readlines()[1:] == lines
+
+    # restored simulations can be changed without changing the snapshot
+    k = gwf.npf.k.array
+    restored_gwf.npf.k.set_data(k * 2.0)
+    assert np.array_equal(
+        MFSimulation.load_snapshot(snapshot).get_model().npf.k.array, k
+    )
+    restored.save_snapshot(snapshot)
+    assert np.array_equal(restored_gwf.npf.k.array, k * 2.0)
+    restored = MFSimulation.load_snapshot(snapshot, memory_map=memory_map)
+    assert np.array_equal(restored.get_model().npf.k.array, k * 2.0)
+
+    with pytest.raises(FlopyException, match="is not a simulation snapshot"):
+        MFSimulation.load_snapshot(function_tmpdir / "loaded" / "mfsim.nam")
+
+
 def test_remove_model(function_tmpdir, example_data_path):
     # load a multi-model simulation
     sim_ws = str(example_data_path / "mf6" / "test006_2models_mvr")
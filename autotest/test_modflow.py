@@ -667,6 +667,80 @@ def test_mf2005_test_models_loadonly(example_data_path, namfile):
     ).load_fail
 
 
+@pytest.mark.parametrize("namfile", mf2005_model_namfiles())
+def test_mf2005_test_models_lazy_io(function_tmpdir, example_data_path, namfile):
+    model_ws = example_data_path / "mf2005_test"
+    ml = Modflow.load(namfile, model_ws=model_ws, version="mf2005", check=False)
+    lazy = Modflow.load(namfile, model_ws=model_ws, version="mf2005", lazy_io=True)
+    assert lazy.get_package("BAS6") is not None
+    loaded = [p.name[0] for p in lazy._packagelist]
+    assert "LPF" not in loaded and "WEL" not in loaded
+
+    # a package is read when it is accessed
+    last = ml.packagelist[-1].name[0]
+    assert type(lazy.get_package(last)) is type(ml.get_package(last))
+    assert lazy._lazy_loader is None or len(lazy._packagelist) > len(loaded)
+
+    # the package list reads the remaining packages, in name file order
+    assert [p.name for p in lazy.packagelist] == [p.name for p in ml.packagelist]
+    assert lazy._lazy_loader is None
+    assert lazy.load_fail == ml.load_fail
+
+    for model, ws in ((ml, "eager"), (lazy, "lazy")):
+        model.change_model_ws(function_tmpdir / ws)
+        model.write_input()
+    eager_files = sorted(p.name for p in (function_tmpdir / "eager").iterdir())
+    assert eager_files == sorted(p.name for p in (function_tmpdir / "lazy").iterdir())
+    for fname in eager_files:
+        assert (function_tmpdir / "eager" / fname).read_bytes() == (
+            function_tmpdir / "lazy" / fname
+        ).read_bytes()
+
+
+@pytest.mark.parametrize("namfile", ["swiex1.nam", "swiex2_strat.nam", "swiex3.nam"])
+def test_lazy_io_access_order(function_tmpdir, example_data_path, namfile):
+    # output files shared by packages are registered in name file order
+    model_ws = example_data_path / "mf2005_test"
+    ml = Modflow.load(namfile, model_ws=model_ws, check=False)
+    lazy = Modflow.load(namfile, model_ws=model_ws, check=False, lazy_io=True)
+    for name in reversed(ml.get_package_list()):
+        lazy.get_package(name)
+    assert lazy._lazy_loader is None
+    assert lazy.output_fnames == ml.output_fnames
+    assert lazy.output_packages == ml.output_packages
+
+    for model, ws in ((ml, "eager"), (lazy, "lazy")):
+        model.change_model_ws(function_tmpdir / ws)
+        model.write_input()
+    eager_files = sorted(p.name for p in (function_tmpdir / "eager").iterdir())
+    assert eager_files == sorted(p.name for p in (function_tmpdir / "lazy").iterdir())
+    for fname in eager_files:
+        assert (function_tmpdir / "eager" / fname).read_bytes() == (
+            function_tmpdir / "lazy" / fname
+        ).read_bytes()
+
+
+def test_lazy_io_change_model_ws(function_tmpdir):
+    # OPEN/CLOSE arrays of unread packages are read from the load workspace
+    model_ws = function_tmpdir / "model"
+    ml = Modflow("lazy", model_ws=model_ws, external_path="ext")
+    ModflowDis(ml, nlay=2, nrow=3, ncol=4)
+    ModflowBas(ml)
+    ModflowLpf(ml, hk=np.arange(24.0).reshape(2, 3, 4))
+    ml.write_input()
+
+    lazy = Modflow.load("lazy.nam", model_ws=model_ws, check=False, lazy_io=True)
+    lazy.change_model_ws(function_tmpdir / "new")
+    assert lazy._lazy_loader is None
+    lazy.write_input()
+    assert np.array_equal(lazy.lpf.hk.array, ml.lpf.hk.array)
+
+    lazy = Modflow.load("lazy.nam", model_ws=model_ws, check=False, lazy_io=True)
+    lazy.model_ws = function_tmpdir / "new"
+    assert lazy._lazy_loader is None
+    assert np.array_equal(lazy.lpf.hk.array, ml.lpf.hk.array)
+
+
 @pytest.mark.slow
 def test_write_irch(function_tmpdir, example_data_path):
     mpath = example_data_path / "freyberg_multilayer_transient"
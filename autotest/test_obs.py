@@ -257,6 +257,48 @@ def test_obs_single_time(function_tmpdir):
     assert data["obs02"][0] == 20.0, "obs02[0] != 20.0"
 
 
+@pytest.mark.parametrize("name", ["maw_obs.gitbin", "maw_obs.gitcsv"])
+def test_obs_refresh(function_tmpdir, example_data_path, name):
+    src = example_data_path / "mf6_obs" / name
+    isbinary = src.suffix == ".gitbin"
+    expected = Mf6Obs(src, isBinary=isbinary).get_data()
+    times = expected["totim"].tolist()
+    content = src.read_bytes()
+
+    # byte positions following the first and second observation records
+    if isbinary:
+        itemsize = expected.dtype.itemsize
+        pos1, pos2 = len(content) - 2 * itemsize, len(content) - itemsize
+    else:
+        pos1 = content.index(b"\n", content.index(b"\n") + 1) + 1
+        pos2 = content.index(b"\n", pos1) + 1
+
+    pth = function_tmpdir / name
+    pth.write_bytes(content[:pos1])
+    obs = Mf6Obs(pth, isBinary=isbinary)
+    assert obs.get_times() == times[:1]
+
+    # a partially written record is not read
+    with open(pth, "ab") as f:
+        f.write(content[pos1 : pos2 + 5])
+    assert obs.refresh() == times[1:2]
+    with open(pth, "ab") as f:
+        f.write(content[pos2 + 5 :])
+    assert obs.refresh() == times[2:]
+    assert obs.refresh() == []
+    for name in expected.dtype.names:
+        np.testing.assert_array_equal(obs.get_data()[name], expected[name])
+    assert list(obs.follow(poll_interval=0.0, timeout=0.0)) == times
+
+    # a partially written record is not read when the file is opened
+    pth.write_bytes(content[: pos1 + 5])
+    obs = Mf6Obs(pth, isBinary=isbinary)
+    assert obs.get_times() == times[:1]
+    with open(pth, "ab") as f:
+        f.write(content[pos1 + 5 :])
+    assert obs.refresh() == times[1:]
+
+
 @requires_exe("mf2005")
 def test_obs_create_and_write(function_tmpdir, example_data_path):
     """
@@ -1,4 +1,5 @@
 import os
+from io import StringIO
 
 import numpy as np
 import pandas as pd
@@ -10,6 +11,7 @@ from flopy.modflow import (
     ModflowBas,
     ModflowDis,
     ModflowLpf,
+    ModflowRch,
     ModflowRiv,
     ModflowWel,
 )
@@ -36,6 +38,17 @@ def test_transient2d():
     assert np.array_equal(m4d, m4d2)
 
 
+def test_transient2d_reuse():
+    ml = Modflow()
+    dis = ModflowDis(ml, nlay=1, nrow=10, ncol=10, nper=5)
+    t2d = Transient2d(
+        ml, (10, 10), np.float32, {1: 0.0, 2: 1.0, 3: np.ones((10, 10))}, "fake"
+    )
+    assert [t2d.get_kper_entry(kper)[0] for kper in range(5)] == [1, 1, 1, 1, -1]
+    itmps = [t2d.get_kper_entry(kper, reuse=True)[0] for kper in range(5)]
+    assert itmps == [1, -1, 1, -1, -1]
+
+
 def test_transient3d():
     nlay = 3
     nrow = 4
@@ -562,6 +575,107 @@ def test_mflist(function_tmpdir, example_data_path):
     assert df.groupby(["k", "i", "j"])["rbot"].count()[(1, 2, 4)] == 10
 
 
+def test_write_reused_periods(function_tmpdir):
+    ml = Modflow(model_ws=function_tmpdir, external_path="ref")
+    dis = ModflowDis(ml, nlay=1, nrow=5, ncol=5, nper=4)
+    bas = ModflowBas(ml)
+    rech = np.arange(25, dtype=np.float32).reshape((5, 5)) / 100.0
+    rch = ModflowRch(ml, rech={0: rech, 1: rech.copy(), 2: 0.01, 3: rech})
+    well = [0, 1, 1, -5.0]
+    spd = {0: [well], 1: [well], 2: [[0, 2, 2, -1.0]], 3: [well]}
+    wel = ModflowWel(ml, stress_period_data=spd)
+    ml.write_input()
+
+    # identical consecutive periods are reused, identical arrays and lists
+    # share an external file
+    for ext in ("rch", "wel"):
+        lines = (function_tmpdir / f"{ml.name}.{ext}").read_text().lower()
+        lines = lines.splitlines()
+        itmps = [line.split()[0] for line in lines if "stress period" in line]
+        assert itmps == ["1", "-1", "1", "1"]
+        files = [line.split()[1] for line in lines if "open/close" in line]
+        assert len(files) == 3 and files[0] == files[2] != files[1]
+    assert not (function_tmpdir / "ref" / "rech_3.ref").exists()
+    assert not (function_tmpdir / "ref" / "WEL_0003.dat").exists()
+
+    ml2 = Modflow.load(f"{ml.name}.nam", model_ws=function_tmpdir, check=False)
+    for kper in range(ml.nper):
+        assert np.array_equal(ml2.rch.rech[kper].array, rch.rech[kper].array)
+        assert np.array_equal(
+            ml2.wel.stress_period_data[kper], wel.stress_period_data[kper]
+        )
+
+
+@pytest.mark.parametrize("free", [True, False])
+def test_mflist_write_text(function_tmpdir, free):
+    ml = Modflow(model_ws=function_tmpdir)
+    dis = ModflowDis(ml, nlay=1, nrow=10, ncol=10)
+    bas = ModflowBas(ml, ifrefm=free)
+    data = ModflowWel.get_empty(6)
+    data["i"] = np.arange(6)
+    data["j"] = [0, 1, 1, 2, 3, 9]
+    data["flux"] = [-1.0, 0.1, -0.0, 1.0e-12, 12345678.0, np.nan]
+    wel = ModflowWel(ml, stress_period_data={0: data})
+    wel.write_file()
+
+    expected = StringIO()
+    data = data.copy()
+    for name in ("k", "i", "j"):
+        data[name] += 1
+    np.savetxt(expected, data, fmt=wel.stress_period_data.fmt_string, delimiter="")
+    lines = (function_tmpdir / f"{ml.name}.wel").read_text().splitlines()
+    assert lines[3:] == expected.getvalue().splitlines()
+
+
+def test_mflist_write_binary(function_tmpdir):
+    ml = Modflow(model_ws=function_tmpdir)
+    dis = ModflowDis(ml, nlay=1, nrow=5, ncol=5, nper=3)
+    bas = ModflowBas(ml)
+    spd = {
+        0: [[0, 1, 1, -1.0], [0, 2, 2, -2.0], [0, 3, 3, -3.5]],
+        1: [[0, 4, 4, 7.0]],
+        2: [[0, 0, 0, 1.0], [0, 1, 0, 2.0], [0, 2, 0, 3.0]],
+    }
+    # only periods with at least 3 wells are written to binary files
+    wel = ModflowWel(ml, stress_period_data=spd, binary=3)
+    ml.write_input()
+    assert sorted(p.name for p in function_tmpdir.glob("WEL_*")) == [
+        "WEL_0000.bin",
+        "WEL_0002.bin",
+    ]
+
+    ml2 = Modflow.load(f"{ml.name}.nam", model_ws=function_tmpdir, check=False)
+    for kper in range(ml.nper):
+        assert np.array_equal(
+            ml2.wel.stress_period_data[kper], wel.stress_period_data[kper]
+        )
+
+    # 0 writes all periods to text files
+    ml.remove_package("WEL")
+    wel = ModflowWel(ml, stress_period_data=spd, binary=0)
+    assert not wel.stress_period_data.binary
+    assert wel.stress_period_data.get_filename(0) == "WEL_0000.dat"
+    with pytest.raises(ValueError):
+        ModflowWel(ml, stress_period_data=spd, binary=-1)
+
+
+@pytest.mark.slow
+def test_mflist_write_time(function_tmpdir, benchmark):
+    ml = Modflow(model_ws=function_tmpdir)
+    dis = ModflowDis(ml, nlay=3, nrow=500, ncol=500, nper=10)
+    rng = np.random.default_rng(0)
+    spd = {}
+    for kper in range(ml.nper):
+        data = ModflowWel.get_empty(100000)
+        data["k"] = rng.integers(0, 3, len(data))
+        data["i"] = rng.integers(0, 500, len(data))
+        data["j"] = rng.integers(0, 500, len(data))
+        data["flux"] = rng.normal(size=len(data))
+        spd[kper] = data
+    wel = ModflowWel(ml, stress_period_data=spd)
+    benchmark(lambda: wel.write_file())
+
+
 def test_how(function_tmpdir):
     ml = Modflow(model_ws=function_tmpdir)
     ml.array_free_format = False
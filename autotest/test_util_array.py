@@ -85,6 +85,33 @@ def test_load_txt_fixed():
     np.testing.assert_equal(fa, a)
     assert fa.dtype == a.dtype
 
+    # blank values are skipped, values after the array are not read
+    a = np.array([[1.5, -2.0, 3.25], [4.0, 5.0e-3, 6.0]], np.float32)
+    fp = StringIO(
+        "       1.5                -2.0\n"
+        "      3.25   4.0E+00\n"
+        "    5.0E-3       6.0 not a value\n"
+        "next line\n"
+    )
+    fa = Util2d.load_txt(a.shape, fp, a.dtype, "(3F10.4)")
+    np.testing.assert_equal(fa, a)
+    assert fa.dtype == a.dtype
+    assert fp.readline() == "next line\n"
+
+
+def test_load_txt_file(function_tmpdir):
+    a = np.array([[0.5, 1.0, 1.0, 1.0], [1.0, 1.5, 2.0, 2.5]], np.float32)
+    fpath = function_tmpdir / "array.txt"
+    for fmtin, text in (
+        ("(FREE)", "0.5 1.0,\n3*1.0 1.5 2.0\n2.5 extra\n"),
+        ("(8F5.2)", "".join(f"{v:5.2f}" for v in a.ravel()) + "\n"),
+        ("(4F5.2)", "\n".join("".join(f"{v:5.2f}" for v in r) for r in a)),
+    ):
+        fpath.write_text(text)
+        fa = Util2d.load_txt(a.shape, fpath, a.dtype, fmtin)
+        np.testing.assert_equal(fa, a)
+        assert fa.dtype == a.dtype
+
 
 def test_load_block():
     a = np.ones((2, 5), dtype=np.int32) * 4
@@ -201,6 +201,29 @@ def test_get_budget(cbc_f, zon_f):
     zb.get_budget(net=True)
 
 
+def test_zonbud_batch_size(cbc_f, zon_f):
+    zon = ZoneBudget.read_zone_file(zon_f)
+    totim = [1.0, 2.0, 1095.0, 1096.0, 1097.0]
+    zb = ZoneBudget(cbc_f, zon, totim=totim)
+    zb_batch = ZoneBudget(cbc_f, zon, totim=totim, batch_size=3)
+    bud, bud_batch = zb.get_budget(), zb_batch.get_budget()
+    assert np.array_equal(bud["name"], bud_batch["name"])
+    assert np.array_equal(bud["totim"], np.repeat(totim, len(bud) // len(totim)))
+    for name in zb._zonenamedict.values():
+        np.testing.assert_array_equal(bud[name], bud_batch[name])
+
+
+def test_zonbud_workers(cbc_f, zon_f):
+    zon = ZoneBudget.read_zone_file(zon_f)
+    zb = ZoneBudget(cbc_f, zon)
+    zb_workers = ZoneBudget(cbc_f, zon, batch_size=2, workers=2)
+    bud, bud_workers = zb.get_budget(), zb_workers.get_budget()
+    assert np.array_equal(bud["name"], bud_workers["name"])
+    assert np.array_equal(bud["totim"], bud_workers["totim"])
+    for name in zb._zonenamedict.values():
+        np.testing.assert_array_equal(bud[name], bud_workers[name])
+
+
 def test_get_model_shape(cbc_f, zon_f):
     ZoneBudget(
         cbc_f,
@@ -24,21 +24,23 @@ contribute.
 __author__ = "FloPy Team"
 
 from .version import __version__  # isort:skip
-from . import (
-    discretization,
-    export,
-    mf6,
-    mfusg,
-    modflow,
-    modflowlgr,
-    modpath,
-    mt3d,
-    pest,
-    plot,
-    seawat,
-    utils,
-)
-from .mbase import run_model, which
+import importlib
+
+# subpackages are imported on first use, see __getattr__
+_submodules = [
+    "discretization",
+    "export",
+    "mf6",
+    "mfusg",
+    "modflow",
+    "modflowlgr",
+    "modpath",
+    "mt3d",
+    "pest",
+    "plot",
+    "seawat",
+    "utils",
+]
 
 __all__ = [
     "__author__",
@@ -58,3 +60,18 @@ __all__ = [
     "utils",
     "which",
 ]
+
+
+def __getattr__(name):
+    if name in _submodules:
+        return importlib.import_module(f".{name}", __name__)
+    if name in ("run_model", "which"):
+        from . import mbase
+
+        value = globals()[name] = getattr(mbase, name)
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -36,6 +36,214 @@ class CachedData:
         self.out_of_date = False
 
 
+class CellIndex:
+    """
+    Spatial index to find the cells that contain points.
+
+    The cells are sorted into a regular grid of bins by their bounding
+    boxes, so each point is only tested against the cells of its bin.
+
+    Parameters
+    ----------
+    xvertices : list of array_like
+        x-coordinates of the vertices of each cell
+    yvertices : list of array_like
+        y-coordinates of the vertices of each cell
+    tolerance : float
+        distance from a cell edge within which a point is in the cell
+        (default is 1e-9)
+
+    """
+
+    def __init__(self, xvertices, yvertices, tolerance=1e-9):
+        self.tolerance = tolerance
+        self.ncells = len(xvertices)
+        nvert = np.array([len(xv) for xv in xvertices], dtype=int)
+
+        # pad the vertices of each cell with its first vertex, which closes
+        # the cell and only adds edges of zero length
+        self.xv = np.zeros((self.ncells, max(nvert.max(initial=0), 1)))
+        self.yv = np.zeros(self.xv.shape)
+        for icell, (xv, yv) in enumerate(zip(xvertices, yvertices)):
+            self.xv[icell, : nvert[icell]] = xv
+            self.yv[icell, : nvert[icell]] = yv
+            self.xv[icell, nvert[icell] :] = self.xv[icell, 0]
+            self.yv[icell, nvert[icell] :] = self.yv[icell, 0]
+
+        # cell bounding boxes
+        self.xmin = self.xv.min(axis=1) - tolerance
+        self.xmax = self.xv.max(axis=1) + tolerance
+        self.ymin = self.yv.min(axis=1) - tolerance
+        self.ymax = self.yv.max(axis=1) + tolerance
+
+        # about one cell per bin
+        self.nbin = max(int(np.sqrt(self.ncells)), 1)
+        self.x0, self.y0 = self.xmin.min(initial=0), self.ymin.min(initial=0)
+        self.dx = max(self.xmax.max(initial=0) - self.x0, tolerance) / self.nbin
+        self.dy = max(self.ymax.max(initial=0) - self.y0, tolerance) / self.nbin
+
+        # bins overlapped by each cell, as (bin, cell) pairs sorted by bin
+        # and cell
+        ix0, ix1 = self._xbin(self.xmin), self._xbin(self.xmax)
+        iy0, iy1 = self._ybin(self.ymin), self._ybin(self.ymax)
+        nx = ix1 - ix0 + 1
+        count = nx * (iy1 - iy0 + 1)
+        cells = np.repeat(np.arange(self.ncells), count)
+        k = np.arange(count.sum()) - np.repeat(np.cumsum(count) - count, count)
+        bins = (iy0[cells] + k // nx[cells]) * self.nbin + ix0[cells] + k % nx[cells]
+        order = np.lexsort((cells, bins))
+        self.bincells = cells[order]
+        self.binstart = np.searchsorted(
+            bins[order], np.arange(self.nbin * self.nbin + 1)
+        )
+
+    def _xbin(self, x):
+        return np.clip(((x - self.x0) // self.dx).astype(int), 0, self.nbin - 1)
+
+    def _ybin(self, y):
+        return np.clip(((y - self.y0) // self.dy).astype(int), 0, self.nbin - 1)
+
+    def query(self, x, y, chunksize=100000):
+        """
+        Find all of the cells that contain each point.
+
+        Parameters
+        ----------
+        x : array_like
+            x-coordinates of the points
+        y : array_like
+            y-coordinates of the points
+        chunksize : int
+            number of (point, cell) pairs tested at once (default is 100000)
+
+        Returns
+        -------
+        ipoint, icell : np.ndarray
+            point and cell indices of each point in a cell, sorted by point
+            and cell
+
+        """
+        x = np.ravel(x).astype(float)
+        y = np.ravel(y).astype(float)
+        valid = (
+            (x >= self.x0)
+            & (x <= self.x0 + self.nbin * self.dx)
+            & (y >= self.y0)
+            & (y <= self.y0 + self.nbin * self.dy)
+        )
+        ibin = np.where(valid, self._ybin(y) * self.nbin + self._xbin(x), 0)
+        start = self.binstart[ibin]
+        count = np.where(valid, self.binstart[ibin + 1] - start, 0)
+
+        ipoints = []
+        icells = []
+        end = np.cumsum(count)
+        i0 = 0
+        while i0 < len(x):
+            # points of this chunk
+            i1 = max(np.searchsorted(end, end[i0] - count[i0] + chunksize), i0 + 1)
+            i1 = min(i1, len(x))
+            n = count[i0:i1]
+            ipt = np.repeat(np.arange(i0, i1), n)
+            k = np.arange(n.sum()) - np.repeat(np.cumsum(n) - n, n)
+            icell = self.bincells[np.repeat(start[i0:i1], n) + k]
+            mask = self._contains(icell, x[ipt], y[ipt])
+            ipoints.append(ipt[mask])
+            icells.append(icell[mask])
+            i0 = i1
+        if len(ipoints) == 0:
+            return np.zeros(0, dtype=int), np.zeros(0, dtype=int)
+        return np.concatenate(ipoints), np.concatenate(icells)
+
+    def _contains(self, icell, x, y):
+        """
+        Test whether each point is in the cell paired with it.
+
+        """
+        mask = (
+            (x >= self.xmin[icell])
+            & (x <= self.xmax[icell])
+            & (y >= self.ymin[icell])
+            & (y <= self.ymax[icell])
+        )
+        icell, x, y = icell[mask], x[mask, np.newaxis], y[mask, np.newaxis]
+        xa, ya = self.xv[icell], self.yv[icell]
+        xb, yb = np.roll(xa, -1, axis=1), np.roll(ya, -1, axis=1)
+        dx, dy = xb - xa, yb - ya
+
+        # ray casting
+        with np.errstate(divide="ignore", invalid="ignore"):
+            xcross = xa + dx * (y - ya) / dy
+        crossing = ((ya > y) != (yb > y)) & (x < xcross)
+        inside = crossing.sum(axis=1) % 2 == 1
+
+        # points on the cell edges
+        length2 = dx * dx + dy * dy
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = np.where(length2 > 0, ((x - xa) * dx + (y - ya) * dy) / length2, 0.0)
+        t = np.clip(t, 0.0, 1.0)
+        dist2 = (xa + t * dx - x) ** 2 + (ya + t * dy - y) ** 2
+        inside |= np.any(dist2 <= self.tolerance**2, axis=1)
+
+        mask[mask] = inside
+        return mask
+
+
+def first_pair(npoints, ipoint):
+    """
+    Get the first (point, cell) pair of each point from pairs sorted by
+    point and cell, as returned by CellIndex.query.
+
+    Parameters
+    ----------
+    npoints : int
+        number of points
+    ipoint : np.ndarray
+        point index of each pair
+
+    Returns
+    -------
+    ipair : np.ndarray
+        index of the first pair of each point, -1 for points without pairs
+
+    """
+    ipair = np.full(npoints, -1, dtype=int)
+    if len(ipoint) > 0:
+        first = np.ones(len(ipoint), dtype=bool)
+        first[1:] = ipoint[1:] != ipoint[:-1]
+        ipair[ipoint[first]] = np.flatnonzero(first)
+    return ipair
+
+
+def pair_values(values, ipair, shape):
+    """
+    Get the value of the pair of each point from the index of the pair
+    returned by first_pair.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        value of each (point, cell) pair
+    ipair : np.ndarray
+        index of the pair of each point, -1 for points without pairs
+    shape : tuple
+        shape of the points
+
+    Returns
+    -------
+    values : np.ndarray
+        integer array of the values of the points, or float array with
+        NaNs for points without pairs
+
+    """
+    found = ipair >= 0
+    if np.all(found):
+        return values[ipair].reshape(shape)
+    result = np.full(len(ipair), np.nan)
+    result[found] = values[ipair[found]]
+    return result.reshape(shape)
+
+
 def _get_epsg_from_crs_or_proj4(crs, proj4=None):
     """Try to get EPSG identifier from a crs object."""
     if isinstance(crs, int):
@@ -1194,6 +1402,25 @@ class Grid:
         else:
             return yul - (np.cos(self.angrot_radians) * yext)
 
+    def _get_cell_index(self, ncells):
+        """
+        Get the spatial index of the first ncells cells of xyzvertices,
+        building it if it does not exist or is out of date.
+
+        """
+        cache_index = "cellindex"
+        if (
+            cache_index not in self._cache_dict
+            or self._cache_dict[cache_index].out_of_date
+        ):
+            self._copy_cache = False
+            xv, yv = self.xyzvertices[:2]
+            self._copy_cache = True
+            self._cache_dict[cache_index] = CachedData(
+                CellIndex(xv[:ncells], yv[:ncells])
+            )
+        return self._cache_dict[cache_index].data_nocopy
+
     def _require_cache_updates(self):
         for cache_data in self._cache_dict.values():
             cache_data.out_of_date = True
@@ -876,13 +876,13 @@ class StructuredGrid(Grid):
 
         Parameters
         ----------
-        x : float
-            The x-coordinate of the requested point
-        y : float
-            The y-coordinate of the requested point
-        z : float
-            Optional z-coordinate of the requested point (will return layer,
-            row, column) if supplied
+        x : float or array_like
+            The x-coordinate(s) of the requested point(s)
+        y : float or array_like
+            The y-coordinate(s) of the requested point(s)
+        z : float or array_like
+            Optional z-coordinate(s) of the requested point(s) (will return
+            layer, row, column) if supplied
         local: bool (optional)
             If True, x and y are in local coordinates (defaults to False)
         forgive: bool (optional)
@@ -891,15 +891,21 @@ class StructuredGrid(Grid):
 
         Returns
         -------
-        row : int
-            The row number
-        col : int
-            The column number
+        row : int or np.ndarray
+            The row number(s)
+        col : int or np.ndarray
+            The column number(s)
+
+        Arrays of points return arrays, which are float arrays with NaNs
+        for points outside the model grid if forgive is True.
 
         """
         # transform x and y to local coordinates
         x, y = super().intersect(x, y, local, forgive)
 
+        if np.ndim(x) > 0 or np.ndim(y) > 0:
+            return self._intersect_arrays(x, y, z, forgive)
+
         # get the cell edges in local coordinates
         xe, ye = self.xyedges
 
@@ -945,6 +951,40 @@ class StructuredGrid(Grid):
 
         return lay, row, col
 
+    def _intersect_arrays(self, x, y, z=None, forgive=False):
+        """
+        Get the (layer,) row and column of arrays of points in local
+        coordinates, see intersect().
+
+        """
+        x, y = np.broadcast_arrays(np.asarray(x, float), np.asarray(y, float))
+
+        # get the cell edges in local coordinates
+        self._copy_cache = False
+        xe, ye = self.xyedges
+        self._copy_cache = True
+
+        # number of edges left of and above each point
+        nx = np.searchsorted(xe, x, side="left")
+        ny = len(ye) - np.searchsorted(ye[::-1], y, side="right")
+        row, col = ny - 1, nx - 1
+        inside = (nx > 0) & (nx < len(xe)) & (ny > 0) & (ny < len(ye))
+        indices = [row, col]
+
+        if z is not None:
+            z = np.broadcast_to(z, x.shape)
+            irow, icol = np.where(inside, row, 0), np.where(inside, col, 0)
+            top_botm = self.top_botm[:, irow, icol]
+            inlay = (top_botm[:-1] >= z) & (z >= top_botm[1:])
+            inside &= inlay.any(axis=0)
+            indices.insert(0, inlay.argmax(axis=0))
+
+        if not np.all(inside):
+            if not forgive:
+                raise Exception("point given is outside of the model area")
+            indices = [np.where(inside, idx, np.nan) for idx in indices]
+        return tuple(indices)
+
     def _cell_vert_list(self, i, j):
         """Get vertices for a single cell or sequence of i, j locations."""
         self._copy_cache = False
@@ -3,10 +3,9 @@ import os
 from typing import Union
 
 import numpy as np
-from matplotlib.path import Path
 
-from ..utils.geometry import is_clockwise, transform
-from .grid import CachedData, Grid
+from ..utils.geometry import transform
+from .grid import CachedData, Grid, first_pair, pair_values
 
 
 class UnstructuredGrid(Grid):
@@ -726,12 +725,12 @@ class UnstructuredGrid(Grid):
 
         Parameters
         ----------
-        x : float
-            The x-coordinate of the requested point
-        y : float
-            The y-coordinate of the requested point
-        z : float, None
-            optional, z-coordiante of the requested point
+        x : float or array_like
+            The x-coordinate(s) of the requested point(s)
+        y : float or array_like
+            The y-coordinate(s) of the requested point(s)
+        z : float, array_like or None
+            optional, z-coordiante(s) of the requested point(s)
         local: bool (optional)
             If True, x and y are in local coordinates (defaults to False)
         forgive: bool (optional)
@@ -740,51 +739,49 @@ class UnstructuredGrid(Grid):
 
         Returns
         -------
-        icell2d : int
-            The CELL2D number
+        icell2d : int or np.ndarray
+            The CELL2D number(s). Arrays of points return arrays, which are
+            float arrays with NaNs for points outside the model grid if
+            forgive is True.
 
         """
         if local:
             # transform x and y to real-world coordinates
             x, y = super().get_coords(x, y)
-        xv, yv, zv = self.xyzvertices
+        scalar = np.ndim(x) == 0 and np.ndim(y) == 0
+        x, y = np.broadcast_arrays(x, y)
 
         if self.grid_varies_by_layer:
             ncpl = self.nnodes
         else:
             ncpl = self.ncpl[0]
 
-        for icell2d in range(ncpl):
-            xa = np.array(xv[icell2d])
-            ya = np.array(yv[icell2d])
-            # x and y at least have to be within the bounding box of the cell
-            if (
-                np.any(x <= xa)
-                and np.any(x >= xa)
-                and np.any(y <= ya)
-                and np.any(y >= ya)
-            ):
-                if is_clockwise(xa, ya):
-                    radius = -1e-9
-                else:
-                    radius = 1e-9
-                path = Path(np.stack((xa, ya)).transpose())
-                # use a small radius, so that the edge of the cell is included
-                if path.contains_point((x, y), radius=radius):
-                    if z is None:
-                        return icell2d
-
-                    for lay in range(self.nlay):
-                        if lay != 0 and not self.grid_varies_by_layer:
-                            icell2d += self.ncpl[lay - 1]
-                        if zv[0, icell2d] >= z >= zv[1, icell2d]:
-                            return icell2d
-
-        if forgive:
-            icell2d = np.nan
-            return icell2d
-
-        raise Exception("point given is outside of the model area")
+        # find the cells that contain each point, using the spatial index
+        ipoint, icell = self._get_cell_index(ncpl).query(x, y)
+        if z is not None:
+            # keep the nodes with a z range that contains the point
+            z = np.broadcast_to(z, x.shape).ravel()[ipoint]
+            self._copy_cache = False
+            zv = self.xyzvertices[2]
+            self._copy_cache = True
+            if self.grid_varies_by_layer:
+                nodes = icell[np.newaxis]
+            else:
+                offset = np.cumsum(self.ncpl) - self.ncpl
+                nodes = icell + offset[:, np.newaxis]
+            inlay = (zv[0][nodes] >= z) & (z >= zv[1][nodes])
+            found = inlay.any(axis=0)
+            icell = nodes[inlay.argmax(axis=0), np.arange(len(icell))][found]
+            ipoint = ipoint[found]
+
+        ipair = first_pair(x.size, ipoint)
+        if np.any(ipair < 0) and not forgive:
+            raise Exception("point given is outside of the model area")
+        if scalar:
+            if ipair[0] < 0:
+                return np.nan
+            return int(icell[ipair[0]])
+        return pair_values(icell, ipair, x.shape)
 
     @property
     def top_botm(self):
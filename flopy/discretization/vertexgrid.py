@@ -2,10 +2,9 @@ import copy
 import os
 
 import numpy as np
-from matplotlib.path import Path
 
-from ..utils.geometry import is_clockwise, transform
-from .grid import CachedData, Grid
+from ..utils.geometry import transform
+from .grid import CachedData, Grid, first_pair, pair_values
 
 
 class VertexGrid(Grid):
@@ -286,6 +285,8 @@ class VertexGrid(Grid):
         -------
             list of Polygon objects
         """
+        from matplotlib.path import Path
+
         cache_index = "xyzgrid"
         if (
             cache_index not in self._cache_dict
@@ -353,12 +354,12 @@ class VertexGrid(Grid):
 
         Parameters
         ----------
-        x : float
-            The x-coordinate of the requested point
-        y : float
-            The y-coordinate of the requested point
-        z : float, None
-            optional, z-coordiante of the requested point will return
+        x : float or array_like
+            The x-coordinate(s) of the requested point(s)
+        y : float or array_like
+            The y-coordinate(s) of the requested point(s)
+        z : float, array_like or None
+            optional, z-coordiante(s) of the requested point(s) will return
             (lay, icell2d)
         local: bool (optional)
             If True, x and y are in local coordinates (defaults to False)
@@ -368,50 +369,51 @@ class VertexGrid(Grid):
 
         Returns
         -------
-        icell2d : int
-            The CELL2D number
+        icell2d : int or np.ndarray
+            The CELL2D number(s). Arrays of points return arrays, which are
+            float arrays with NaNs for points outside the model grid if
+            forgive is True.
 
         """
         if local:
             # transform x and y to real-world coordinates
             x, y = super().get_coords(x, y)
-        xv, yv, zv = self.xyzvertices
-        for icell2d in range(self.ncpl):
-            xa = np.array(xv[icell2d])
-            ya = np.array(yv[icell2d])
-            # x and y at least have to be within the bounding box of the cell
-            if (
-                np.any(x <= xa)
-                and np.any(x >= xa)
-                and np.any(y <= ya)
-                and np.any(y >= ya)
-            ):
-                path = Path(np.stack((xa, ya)).transpose())
-                # use a small radius, so that the edge of the cell is included
-                if is_clockwise(xa, ya):
-                    radius = -1e-9
-                else:
-                    radius = 1e-9
-                if path.contains_point((x, y), radius=radius):
-                    if z is None:
-                        return icell2d
-
-                    for lay in range(self.nlay):
-                        if (
-                            self.top_botm[lay, icell2d]
-                            >= z
-                            >= self.top_botm[lay + 1, icell2d]
-                        ):
-                            return lay, icell2d
-
-        if forgive:
-            icell2d = np.nan
-            if z is not None:
-                return np.nan, icell2d
-
+        scalar = np.ndim(x) == 0 and np.ndim(y) == 0
+        x, y = np.broadcast_arrays(x, y)
+
+        # find the cells that contain each point, using the spatial index
+        ipoint, icell = self._get_cell_index(self.ncpl).query(x, y)
+        lay = None
+        if z is not None:
+            # keep the cells with a layer that contains the point
+            z = np.broadcast_to(z, x.shape).ravel()[ipoint]
+            top_botm = self.top_botm
+            inlay = (top_botm[:-1, icell] >= z) & (z >= top_botm[1:, icell])
+            found = inlay.any(axis=0)
+            ipoint, icell = ipoint[found], icell[found]
+            lay = inlay[:, found].argmax(axis=0)
+
+        ipair = first_pair(x.size, ipoint)
+        outside = ipair < 0
+        if np.any(outside) and not forgive:
+            raise Exception("point given is outside of the model area")
+        if scalar:
+            if outside[0]:
+                icell2d = np.nan
+                if z is not None:
+                    return np.nan, icell2d
+                return icell2d
+            icell2d = int(icell[ipair[0]])
+            if z is None:
+                return icell2d
+            return int(lay[ipair[0]]), icell2d
+
+        icell2d = pair_values(icell, ipair, x.shape)
+        if lay is not None:
+            lay = pair_values(lay, ipair, x.shape)
+        if z is None:
             return icell2d
-
-        raise Exception("point given is outside of the model area")
+        return lay, icell2d
 
     def get_cell_vertices(self, cellid):
         """
@@ -7,6 +7,7 @@ mbase module
 
 import abc
 import copy
+import hashlib
 import os
 import queue as Queue
 import shutil
@@ -394,6 +395,10 @@ class BaseModel(ModelInterface):
         self.namefile_ext = namefile_ext or ""
         self._namefile = self.__name + "." + self.namefile_ext
         self._packagelist = []
+        # reads packages when they are first accessed, see Modflow.load
+        self._lazy_loader = None
+        # external files written by write_input, keyed on their content
+        self._shared_files = None
         self.heading = ""
         self.exe_name = (
             "mf2005" if exe_name is None else resolve_exe(exe_name, forgive=True)
@@ -475,6 +480,8 @@ class BaseModel(ModelInterface):
 
     @property
     def packagelist(self):
+        if self._lazy_loader is not None:
+            self._lazy_loader.load_all()
         return self._packagelist
 
     @packagelist.setter
@@ -495,6 +502,9 @@ class BaseModel(ModelInterface):
 
     @model_ws.setter
     def model_ws(self, model_ws: Union[str, os.PathLike]):
+        # unread packages are read from the workspace they were loaded from
+        if self._lazy_loader is not None:
+            self._lazy_loader.load_all()
         self._model_ws = str(Path(model_ws).expanduser().absolute())
 
     @property
@@ -574,6 +584,34 @@ class BaseModel(ModelInterface):
         self._next_ext_unit += 1
         return next_unit
 
+    def _shared_file_path(self, model_file_path, *content):
+        """
+        Get the path of an external file with the given content that was
+        already written by write_input, so that packages can refer to it
+        instead of writing the same file again.
+
+        Parameters
+        ----------
+        model_file_path : str
+            Path, relative to the name file, the content would be written to
+        *content : bytes or str
+            Content of the file, and anything else (formats, data types)
+            that the file depends on
+
+        Returns
+        -------
+        str
+            Path of the existing file, or model_file_path if the content
+            needs to be written to it
+
+        """
+        if self._shared_files is None:
+            return model_file_path
+        key = hashlib.sha256()
+        for part in content:
+            key.update(part if isinstance(part, bytes) else str(part).encode())
+        return self._shared_files.setdefault(key.digest(), model_file_path)
+
     def export(self, f: Union[str, os.PathLike], **kwargs):
         """
         Method to export a model to netcdf or shapefile based on the
@@ -715,7 +753,7 @@ class BaseModel(ModelInterface):
                 return None
 
         # to avoid infinite recursion
-        if item == "_packagelist" or item == "packagelist" or item == "mfnam_packages":
+        if item in ("_packagelist", "packagelist", "mfnam_packages", "_lazy_loader"):
             raise AttributeError(item)
         pckg = self.get_package(item)
         if pckg is not None or item in self.mfnam_packages:
@@ -1209,7 +1247,9 @@ class BaseModel(ModelInterface):
         if not name:
             raise ValueError("invalid package name")
         name = name.upper()
-        for pp in self.packagelist:
+        if self._lazy_loader is not None:
+            self._lazy_loader.load(name)
+        for pp in self._packagelist:
             if pp.name[0].upper() == name:
                 return pp
         return None
@@ -1275,6 +1315,10 @@ class BaseModel(ModelInterface):
             except:
                 raise OSError(f"{new_pth} not valid, workspace-folder")
 
+        # unread packages are read from the workspace they were loaded from
+        if self._lazy_loader is not None:
+            self._lazy_loader.load_all()
+
         # --reset the model workspace
         old_pth = self._model_ws
         self._model_ws = new_pth
@@ -1425,31 +1469,37 @@ class BaseModel(ModelInterface):
         if self.verbose:
             print("\nWriting packages:")
 
-        if SelPackList is False:
-            for p in self.packagelist:
-                if self.verbose:
-                    print("   Package: ", p.name[0])
-                # prevent individual package checks from running after
-                # model-level package check above
-                # otherwise checks are run twice
-                # or the model level check procedure would have to be split up
-                # or each package would need a check argument,
-                # or default for package level check would have to be False
-                try:
-                    p.write_file(check=False)
-                except TypeError:
-                    p.write_file()
-        else:
-            for pon in SelPackList:
-                for i, p in enumerate(self.packagelist):
-                    if pon in p.name:
-                        if self.verbose:
-                            print("   Package: ", p.name[0])
-                        try:
-                            p.write_file(check=False)
-                        except TypeError:
-                            p.write_file()
-                            break
+        # identical external arrays and lists written by the packages share
+        # a single file
+        self._shared_files = {}
+        try:
+            if SelPackList is False:
+                for p in self.packagelist:
+                    if self.verbose:
+                        print("   Package: ", p.name[0])
+                    # prevent individual package checks from running after
+                    # model-level package check above
+                    # otherwise checks are run twice
+                    # or the model level check procedure would have to be split up
+                    # or each package would need a check argument,
+                    # or default for package level check would have to be False
+                    try:
+                        p.write_file(check=False)
+                    except TypeError:
+                        p.write_file()
+            else:
+                for pon in SelPackList:
+                    for i, p in enumerate(self.packagelist):
+                        if pon in p.name:
+                            if self.verbose:
+                                print("   Package: ", p.name[0])
+                            try:
+                                p.write_file(check=False)
+                            except TypeError:
+                                p.write_file()
+                                break
+        finally:
+            self._shared_files = None
         if self.verbose:
             print(" ")
         # write name file
@@ -1,5 +1,29 @@
-from . import coordinates, data, utils
+from . import coordinates, data, modflow, utils
 from .data import mfdataarray, mfdatalist, mfdatascalar
 from .mfbase import ExtFileAction
 from .mfmodel import MFModel
-from .modflow import *
+from .modflow import MFSimulation
+
+__all__ = [
+    "coordinates",
+    "data",
+    "modflow",
+    "utils",
+    "mfdataarray",
+    "mfdatalist",
+    "mfdatascalar",
+    "ExtFileAction",
+    "MFModel",
+] + modflow.__all__
+
+
+def __getattr__(name):
+    # generated package classes are imported on first use
+    if name in modflow._class_modules:
+        value = globals()[name] = getattr(modflow, name)
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -85,6 +85,7 @@ class MFTransient:
             self._verify_sp(transient_key)
 
     def update_transient_key(self, old_transient_key, new_transient_key):
+        self._modified = True
         if old_transient_key in self._data_storage:
             # replace dictionary key
             self._data_storage[new_transient_key] = self._data_storage[
@@ -237,6 +238,8 @@ class MFData(DataInterface):
         # initialize
         self._current_key = None
         self._valid = True
+        # whether data has changed since it was last loaded or written
+        self._modified = False
         self._simulation_data = sim_data
         self._model_or_sim = model_or_sim
         self.structure = structure
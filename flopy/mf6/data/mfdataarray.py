@@ -130,7 +130,9 @@ class MFArray(MFMultiDimVar):
     def __setattr__(self, name, value):
         if name == "__setstate__":
             raise AttributeError(name)
-        elif name == "fname":
+        if name in ("fname", "factor", "iprn", "binary"):
+            self._modified = True
+        if name == "fname":
             self._get_storage_obj().layer_storage.first_item().fname = value
         elif name == "factor":
             self._get_storage_obj().layer_storage.first_item().factor = value
@@ -245,6 +247,7 @@ class MFArray(MFMultiDimVar):
                     )
 
     def __setitem__(self, k, value):
+        self._modified = True
         storage = self._get_storage_obj()
         self._resync()
         if storage.layered:
@@ -379,6 +382,7 @@ class MFArray(MFMultiDimVar):
             Whether data is layered or not.
 
         """
+        self._modified = True
         if layered_data is True and self.structure.layered is False:
             if (
                 self.data_dimensions.get_model_grid().grid_type()
@@ -409,6 +413,7 @@ class MFArray(MFMultiDimVar):
 
     def make_layered(self):
         """Changes the data to be stored by layer instead of as a single array."""
+        self._modified = True
 
         if self.supports_layered():
             try:
@@ -486,6 +491,7 @@ class MFArray(MFMultiDimVar):
                 Verify data prior to storing
 
         """
+        self._modified = True
         storage = self._get_storage_obj()
         if storage is None:
             self._set_storage_obj(self._new_storage(False, True))
@@ -596,6 +602,7 @@ class MFArray(MFMultiDimVar):
             check_data : bool
                 Verify data prior to storing
         """
+        self._modified = True
         storage = self._get_storage_obj()
         if storage is None:
             self._set_storage_obj(self._new_storage(False, True))
@@ -820,6 +827,7 @@ class MFArray(MFMultiDimVar):
             layers (keys) with a dictionary of data record information for each
             layer (values).
         """
+        self._modified = True
         self._set_record(data_record)
 
     def _set_record(self, data_record):
@@ -893,6 +901,7 @@ class MFArray(MFMultiDimVar):
             Data layer that is being set
 
         """
+        self._modified = True
         self._set_data(data, multiplier, layer)
 
     def _set_data(
@@ -1638,6 +1647,7 @@ class MFTransientArray(MFArray, MFTransient):
                 Zero-based stress period
 
         """
+        self._modified = True
         if transient_key in self._data_storage:
             del self._data_storage[transient_key]
 
@@ -1884,6 +1894,7 @@ class MFTransientArray(MFArray, MFTransient):
                 stress period.  How to define the dictionary of data and
                 metadata is described in the MFData class's set_record method.
         """
+        self._modified = True
         self._set_data_record(data_record, is_record=True)
 
     def set_data(self, data, multiplier=None, layer=None, key=None):
@@ -1908,6 +1919,7 @@ class MFTransientArray(MFArray, MFTransient):
                 Zero based stress period to assign data too.  Does not apply
                 if `data` is a dictionary.
         """
+        self._modified = True
         self._set_data_record(data, multiplier, layer, key)
 
     def _set_data_record(
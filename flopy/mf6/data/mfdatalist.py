@@ -201,6 +201,7 @@ class MFList(mfdata.MFMultiDimVar, DataListInterface):
                 Verify data prior to storing
 
         """
+        self._modified = True
         # only store data externally (do not subpackage info)
         if self.structure.construct_package is None:
             storage = self._get_storage_obj()
@@ -244,6 +245,7 @@ class MFList(mfdata.MFMultiDimVar, DataListInterface):
                 Verify data prior to storing
 
         """
+        self._modified = True
         storage = self._get_storage_obj()
         # check if data is already stored external
         if (
@@ -568,6 +570,7 @@ class MFList(mfdata.MFMultiDimVar, DataListInterface):
                 Whether to verify the data
 
         """
+        self._modified = True
         self._set_data(data, autofill, check_data=check_data)
 
     def set_record(self, data_record, autofill=False, check_data=True):
@@ -586,6 +589,7 @@ class MFList(mfdata.MFMultiDimVar, DataListInterface):
                 Whether to verify the data
 
         """
+        self._modified = True
         self._set_record(data_record, autofill, check_data)
 
     def _set_record(self, data_record, autofill=False, check_data=True):
@@ -618,6 +622,7 @@ class MFList(mfdata.MFMultiDimVar, DataListInterface):
                 Data to append.
 
         """
+        self._modified = True
         try:
             self._resync()
             if self._get_storage_obj() is None:
@@ -652,6 +657,7 @@ class MFList(mfdata.MFMultiDimVar, DataListInterface):
                 recarray.
 
         """
+        self._modified = True
         self._resync()
         try:
             # convert to tuple
@@ -690,6 +696,7 @@ class MFList(mfdata.MFMultiDimVar, DataListInterface):
                 Stress period key of record to update.  Only used in transient
                 data types.
         """
+        self._modified = True
         self.append_list_as_record(record)
 
     def search_data(self, search_term, col=None):
@@ -1601,6 +1608,7 @@ class MFTransientList(MFList, mfdata.MFTransient, DataListInterface):
         internally by FloPy and is not intended to the end user.
 
         """
+        self._modified = True
         if transient_key in self._data_storage:
             del self._data_storage[transient_key]
 
@@ -1796,6 +1804,7 @@ class MFTransientList(MFList, mfdata.MFTransient, DataListInterface):
         check_data : bool
             Whether to verify the data
         """
+        self._modified = True
         self._set_data_record(
             data_record,
             autofill=autofill,
@@ -1820,6 +1829,7 @@ class MFTransientList(MFList, mfdata.MFTransient, DataListInterface):
         autofill : bool
             Automatically correct data.
         """
+        self._modified = True
         self._set_data_record(data, key, autofill)
 
     def _set_data_record(
@@ -293,62 +293,60 @@ class MFPandasList(mfdata.MFMultiDimVar, DataListInterface):
 
         return data, multiplier, print_format, binary, data_file
 
+    @staticmethod
+    def _cellid_tuples(data, columns):
+        """build cellid tuples from the cellid columns of a DataFrame"""
+        return list(zip(*[data[column].tolist() for column in columns]))
+
+    def _get_cellid_columns(self, columns):
+        """
+        Get the names of the layer, row, column, cell, node columns that
+        make up the cellid for the model's discretization type.  Returns
+        None if "columns" does not contain them.
+        """
+        if isinstance(self._mg, StructuredGrid):
+            cellid_columns = ["cellid_layer", "cellid_row", "cellid_column"]
+        elif isinstance(self._mg, VertexGrid):
+            if "cellid_cell" in columns:
+                cellid_columns = ["cellid_layer", "cellid_cell"]
+            elif "ncpl" in columns:
+                cellid_columns = ["cellid_layer", "cellid_ncpl"]
+            else:
+                return None
+        elif isinstance(self._mg, UnstructuredGrid):
+            cellid_columns = ["cellid_node"]
+        else:
+            raise MFDataException(
+                "ERROR: Unrecognized model grid "
+                "{str(self._mg)} not supported by MFBasicList"
+            )
+        for column in cellid_columns:
+            if column not in columns:
+                return None
+        return cellid_columns
+
     def _add_cellid_fields(self, data, keep_existing=False):
         """
-        Add cellid fields to a Pandas DataFrame and drop the layer,
-        row, column, cell, node, fields that the cellid is based on
+        Return a copy of a Pandas DataFrame with cellid fields added as
+        the first column and the layer, row, column, cell, node, fields that
+        the cellid is based on dropped.  "data" is not modified.
         """
         for data_item in self.structure.data_item_structures:
             if data_item.type == DatumType.integer:
                 if data_item.name.lower() == "cellid":
-                    columns = data.columns.tolist()
-                    if isinstance(self._mg, StructuredGrid):
-                        if (
-                            "cellid_layer" in columns
-                            and "cellid_row" in columns
-                            and "cellid_column" in columns
-                        ):
-                            data["cellid"] = data[
-                                ["cellid_layer", "cellid_row", "cellid_column"]
-                            ].apply(tuple, axis=1)
-                            if not keep_existing:
-                                data = data.drop(
-                                    columns=[
-                                        "cellid_layer",
-                                        "cellid_row",
-                                        "cellid_column",
-                                    ]
-                                )
-                    elif isinstance(self._mg, VertexGrid):
-                        cell_2 = None
-                        if "cellid_cell" in columns:
-                            cell_2 = "cellid_cell"
-                        elif "ncpl" in columns:
-                            cell_2 = "cellid_ncpl"
-                        if cell_2 is not None and "cellid_layer" in columns:
-                            data["cellid"] = data[
-                                ["cellid_layer", cell_2]
-                            ].apply(tuple, axis=1)
-                            if not keep_existing:
-                                data = data.drop(
-                                    columns=["cellid_layer", cell_2]
-                                )
-                    elif isinstance(self._mg, UnstructuredGrid):
-                        if "cellid_node" in columns:
-                            data["cellid"] = data[["cellid_node"]].apply(
-                                tuple, axis=1
-                            )
-                            if not keep_existing:
-                                data = data.drop(columns=["cellid_node"])
+                    cellid_columns = self._get_cellid_columns(
+                        data.columns.tolist()
+                    )
+                    if cellid_columns is None:
+                        continue
+                    cellids = self._cellid_tuples(data, cellid_columns)
+                    if keep_existing:
+                        data = data.copy(deep=False)
                     else:
-                        raise MFDataException(
-                            "ERROR: Unrecognized model grid "
-                            "{str(self._mg)} not supported by MFBasicList"
-                        )
-                    # reorder columns
-                    column_headers = data.columns.tolist()
-                    column_headers.insert(0, column_headers.pop())
-                    data = data[column_headers]
+                        data = data.drop(columns=cellid_columns)
+                    if "cellid" in data.columns:
+                        data = data.drop(columns="cellid")
+                    data.insert(0, "cellid", cellids)
 
         return data
 
@@ -456,18 +454,14 @@ class MFPandasList(mfdata.MFMultiDimVar, DataListInterface):
     @staticmethod
     def _untuple_manually(pdata, loc, new_column_name, column_name, index):
         """
-        Loop through pandas DataFrame removing tuples from cellid columns.
-        Used when pandas "insert" method to perform the same task fails.
+        Insert a new column into pandas DataFrame "pdata" containing entry
+        "index" of the tuples in cellid column "column_name".  Values that
+        are not tuples are copied as is.
         """
-        # build new column list
-        new_column = []
-        for idx, row in pdata.iterrows():
-            if isinstance(row[column_name], tuple) or isinstance(
-                row[column_name], list
-            ):
-                new_column.append(row[column_name][index])
-            else:
-                new_column.append(row[column_name])
+        new_column = [
+            value[index] if isinstance(value, (tuple, list)) else value
+            for value in pdata[column_name].tolist()
+        ]
 
         # insert list as new column
         pdata.insert(
@@ -506,99 +500,26 @@ class MFPandasList(mfdata.MFMultiDimVar, DataListInterface):
         for field_idx, column_name in fields_to_correct:
             # add individual layer/row/column/cell/node columns
             if isinstance(self._mg, StructuredGrid):
-                try:
-                    pdata.insert(
-                        loc=field_idx,
-                        column=self._unique_column_name(pdata, "cellid_layer"),
-                        value=pdata.apply(lambda x: x[column_name][0], axis=1),
-                    )
-                except (ValueError, TypeError):
-                    self._untuple_manually(
-                        pdata,
-                        field_idx,
-                        self._unique_column_name(pdata, "cellid_layer"),
-                        column_name,
-                        0,
-                    )
-                try:
-                    pdata.insert(
-                        loc=field_idx + 1,
-                        column=self._unique_column_name(pdata, "cellid_row"),
-                        value=pdata.apply(lambda x: x[column_name][1], axis=1),
-                    )
-                except (ValueError, TypeError):
-                    self._untuple_manually(
-                        pdata,
-                        field_idx + 1,
-                        self._unique_column_name(pdata, "cellid_row"),
-                        column_name,
-                        1,
-                    )
-                try:
-                    pdata.insert(
-                        loc=field_idx + 2,
-                        column=self._unique_column_name(
-                            pdata, "cellid_column"
-                        ),
-                        value=pdata.apply(lambda x: x[column_name][2], axis=1),
-                    )
-                except (ValueError, TypeError):
-                    self._untuple_manually(
-                        pdata,
-                        field_idx + 2,
-                        self._unique_column_name(pdata, "cellid_column"),
-                        column_name,
-                        2,
-                    )
+                new_columns = ["cellid_layer", "cellid_row", "cellid_column"]
             elif isinstance(self._mg, VertexGrid):
-                try:
-                    pdata.insert(
-                        loc=field_idx,
-                        column=self._unique_column_name(pdata, "cellid_layer"),
-                        value=pdata.apply(lambda x: x[column_name][0], axis=1),
-                    )
-                except (ValueError, TypeError):
-                    self._untuple_manually(
-                        pdata,
-                        field_idx,
-                        self._unique_column_name(pdata, "cellid_layer"),
-                        column_name,
-                        0,
-                    )
-                try:
-                    pdata.insert(
-                        loc=field_idx + 1,
-                        column=self._unique_column_name(pdata, "cellid_cell"),
-                        value=pdata.apply(lambda x: x[column_name][1], axis=1),
-                    )
-                except (ValueError, TypeError):
-                    self._untuple_manually(
-                        pdata,
-                        field_idx + 1,
-                        self._unique_column_name(pdata, "cellid_cell"),
-                        column_name,
-                        1,
-                    )
+                new_columns = ["cellid_layer", "cellid_cell"]
             elif isinstance(self._mg, UnstructuredGrid):
+                new_columns = ["cellid_node"]
                 if column_name == "cellid_node":
                     # fixing a problem where node was specified as a tuple
                     # make sure new column is named properly
                     column_name = "cellid_node_2"
                     pdata = pdata.rename(columns={"cellid_node": column_name})
-                try:
-                    pdata.insert(
-                        loc=field_idx,
-                        column=self._unique_column_name(pdata, "cellid_node"),
-                        value=pdata.apply(lambda x: x[column_name][0], axis=1),
-                    )
-                except (ValueError, TypeError):
-                    self._untuple_manually(
-                        pdata,
-                        field_idx,
-                        self._unique_column_name(pdata, "cellid_node"),
-                        column_name,
-                        0,
-                    )
+            else:
+                new_columns = []
+            for index, new_column in enumerate(new_columns):
+                self._untuple_manually(
+                    pdata,
+                    field_idx + index,
+                    self._unique_column_name(pdata, new_column),
+                    column_name,
+                    index,
+                )
             # remove cellid tuple
             pdata = pdata.drop(column_name, axis=1)
         return pdata, len(fields_to_correct)
@@ -660,6 +581,7 @@ class MFPandasList(mfdata.MFMultiDimVar, DataListInterface):
                 Append to existing data
 
         """  # (re)build data header
+        self._modified = True
         self._build_data_header()
         if isinstance(data, dict) and not self.has_data():
             MFPandasList.set_record(self, data)
@@ -855,6 +777,7 @@ class MFPandasList(mfdata.MFMultiDimVar, DataListInterface):
                 Whether to verify the data
 
         """
+        self._modified = True
         if isinstance(record, dict):
             data_storage = self._get_storage_obj()
             if "filename" in record:
@@ -913,6 +836,7 @@ class MFPandasList(mfdata.MFMultiDimVar, DataListInterface):
                 Data to append.
 
         """
+        self._modified = True
         try:
             self._resync()
             if self._get_storage_obj() is None:
@@ -968,6 +892,7 @@ class MFPandasList(mfdata.MFMultiDimVar, DataListInterface):
                 recarray.
 
         """
+        self._modified = True
         self._resync()
         try:
             # store
@@ -1002,6 +927,7 @@ class MFPandasList(mfdata.MFMultiDimVar, DataListInterface):
                 Stress period key of record to update.  Only used in transient
                 data types.
         """
+        self._modified = True
         self.append_list_as_record(record)
 
     def store_internal(
@@ -1016,6 +942,7 @@ class MFPandasList(mfdata.MFMultiDimVar, DataListInterface):
                 Verify data prior to storing
 
         """
+        self._modified = True
         storage = self._get_storage_obj()
         # check if data is already stored external
         if (
@@ -1061,6 +988,7 @@ class MFPandasList(mfdata.MFMultiDimVar, DataListInterface):
                 Verify data prior to storing
 
         """
+        self._modified = True
         # only store data externally (do not subpackage info)
         if self.structure.construct_package is None:
             storage = self._get_storage_obj()
@@ -1497,22 +1425,44 @@ class MFPandasList(mfdata.MFMultiDimVar, DataListInterface):
                             else:
                                 id_fields.append(data_item_struct.name)
 
+    @staticmethod
+    def _is_numeric_column(column):
+        return isinstance(column.dtype, np.dtype) and column.dtype.kind in "iuf"
+
     def _increment_id_fields(self, data_frame):
         """increment all id fields by 1 (reverse for negative values)"""
-        dtypes = data_frame.dtypes
         for id_field in self._get_id_fields(data_frame):
             if id_field in data_frame:
-                if id_field in dtypes and dtypes[id_field].str != "<i8":
-                    data_frame.astype({id_field: "<i8"})
-                data_frame.loc[data_frame[id_field].ge(-1), id_field] += 1
-                data_frame.loc[data_frame[id_field].lt(-1), id_field] -= 1
+                column = data_frame[id_field]
+                if self._is_numeric_column(column):
+                    values = column.to_numpy()
+                    data_frame[id_field] = np.where(
+                        values >= -1,
+                        values + 1,
+                        np.where(values < -1, values - 1, values),
+                    )
+                else:
+                    data_frame[id_field] = column.mask(
+                        column.ge(-1), column + 1
+                    ).mask(column.lt(-1), column - 1)
 
     def _decrement_id_fields(self, data_frame):
         """decrement all id fields by 1 (reverse for negative values)"""
         for id_field in self._get_id_fields(data_frame):
             if id_field in data_frame:
-                data_frame.loc[data_frame[id_field].le(-1), id_field] += 1
-                data_frame.loc[data_frame[id_field].gt(-1), id_field] -= 1
+                # -1 is left as is
+                column = data_frame[id_field]
+                if self._is_numeric_column(column):
+                    values = column.to_numpy()
+                    data_frame[id_field] = np.where(
+                        values > -1,
+                        values - 1,
+                        np.where(values < -1, values + 1, values),
+                    )
+                else:
+                    data_frame[id_field] = column.mask(
+                        column.lt(-1), column + 1
+                    ).mask(column.gt(-1), column - 1)
 
     def _resolve_ext_file_path(self, data_storage):
         """
@@ -1555,12 +1505,28 @@ class MFPandasList(mfdata.MFMultiDimVar, DataListInterface):
         return df_rec.to_records(index=False)
 
     def _get_data(self):
-        dataframe = self._get_dataframe()
+        # the recarray is built from a copy, so the stored dataframe does not
+        # need to be copied first
+        dataframe = self._get_dataframe(copy_data=False)
         if dataframe is None:
             return None
         return self._dataframe_to_recarray(dataframe)
 
-    def _get_dataframe(self):
+    def _get_columns(self):
+        dataframe = self._get_dataframe(copy_data=False)
+        if dataframe is None:
+            return None
+        columns = {}
+        for column_name in dataframe.columns:
+            column = dataframe[column_name].to_numpy()
+            if column.flags.writeable:
+                # views of the stored data must not be modified
+                column = column.view()
+                column.flags.writeable = False
+            columns[column_name] = column
+        return columns
+
+    def _get_dataframe(self, copy_data=True):
         """get and return dataframe for this list data"""
         data_storage = self._get_storage_obj()
         if data_storage is None or data_storage.data_storage_type is None:
@@ -1572,15 +1538,16 @@ class MFPandasList(mfdata.MFMultiDimVar, DataListInterface):
                 return pandas.DataFrame(columns=self._header_names)
             else:
                 return None
-        if data_storage.data_storage_type == DataStorageType.internal_array:
-            data = copy.deepcopy(data_storage.internal_data)
+        if data_storage.internal_data is not None:
+            # latest data is in internal cache
+            data = data_storage.internal_data
+            if copy_data:
+                data = copy.deepcopy(data)
+        elif data_storage.data_storage_type == DataStorageType.internal_array:
+            data = None
         else:
-            if data_storage.internal_data is not None:
-                # latest data is in internal cache
-                data = copy.deepcopy(data_storage.internal_data)
-            else:
-                # load data from file and return
-                data = self._load_external_data(data_storage)
+            # load data from file and return
+            data = self._load_external_data(data_storage)
         return data
 
     def get_dataframe(self):
@@ -1593,19 +1560,27 @@ class MFPandasList(mfdata.MFMultiDimVar, DataListInterface):
         """
         return self._get_dataframe()
 
-    def get_data(self, apply_mult=False, **kwargs):
+    def get_data(self, apply_mult=False, as_columns=False, **kwargs):
         """Returns the list's data as a recarray.
 
         Parameters
         ----------
             apply_mult : bool
                 Whether to apply a multiplier.
+            as_columns : bool
+                Return a dictionary of read-only numpy arrays, one for each
+                column, instead of a recarray.  Cellids are returned as
+                separate integer columns (cellid_layer, cellid_row, ...).
+                Numeric columns are views of the stored data and are not
+                copied.
 
         Returns
         -------
-            data : recarray
+            data : recarray or dict
 
         """
+        if as_columns:
+            return self._get_columns()
         return self._get_data()
 
     def get_record(self, data_frame=False):
@@ -1652,8 +1627,7 @@ class MFPandasList(mfdata.MFMultiDimVar, DataListInterface):
             if "data" not in record:
                 record["data"] = self._get_data()
             elif record["data"] is not None:
-                data = copy.deepcopy(record["data"])
-                record["data"] = self._dataframe_to_recarray(data)
+                record["data"] = self._dataframe_to_recarray(record["data"])
         else:
             if "data" not in record:
                 record["data"] = self._get_dataframe()
@@ -1755,6 +1729,9 @@ class MFPandasList(mfdata.MFMultiDimVar, DataListInterface):
             or not data_storage.binary
             or fd_data_file is None
         ):
+            # write from a copy, the stored data may be shared with other
+            # stress periods
+            data = data.copy()
             # add spacer column
             if "leading_space" not in data:
                 data.insert(loc=0, column="leading_space", value="")
@@ -1801,7 +1778,6 @@ class MFPandasList(mfdata.MFMultiDimVar, DataListInterface):
                     )
                     # clean up
                     data_storage.modified = False
-                    self._decrement_id_fields(data)
                 if (
                     data_storage.data_storage_type
                     == DataStorageType.external_file
@@ -2024,6 +2000,7 @@ class MFPandasTransientList(
         internally by FloPy and is not intended to the end user.
 
         """
+        self._modified = True
         if transient_key in self._data_storage:
             del self._data_storage[transient_key]
 
@@ -2178,10 +2155,58 @@ class MFPandasTransientList(
         else:
             return None
 
-    def get_dataframe(self, key=None, apply_mult=False):
+    def get_dataframe(self, key=None, apply_mult=False, stacked=False):
+        """Returns the data for stress period `key` as a pandas DataFrame.
+        If no key is specified returns a dictionary of DataFrames with
+        zero-based stress period numbers as keys.
+
+        Parameters
+        ----------
+            key : int
+                Zero-based stress period to return data from.
+            apply_mult : bool
+                Apply multiplier
+            stacked : bool
+                Return the data of all stress periods stacked in a single
+                DataFrame, with the zero-based stress period in a leading
+                "kper" column.  Stress periods that reuse the data of an
+                earlier stress period without defining a block are not
+                repeated.
+
+        Returns
+        -------
+            data : DataFrame or dict
+
+        """
+        if stacked:
+            return self._get_stacked_dataframe()
         return self.get_data(key, apply_mult, dataframe=True)
 
-    def get_data(self, key=None, apply_mult=False, dataframe=False, **kwargs):
+    def _get_stacked_dataframe(self):
+        if self._data_storage is None or len(self._data_storage) == 0:
+            return None
+        keys = []
+        data_frames = []
+        for key in sorted(self._data_storage.keys()):
+            self.get_data_prep(key)
+            data_frame = super()._get_dataframe(copy_data=False)
+            if data_frame is not None:
+                keys.append(key)
+                data_frames.append(data_frame)
+        if len(data_frames) == 0:
+            return None
+        # concat copies the data, so stored dataframes are not modified
+        data = pandas.concat(data_frames, keys=keys, names=["kper", None])
+        return data.reset_index(level="kper").reset_index(drop=True)
+
+    def get_data(
+        self,
+        key=None,
+        apply_mult=False,
+        dataframe=False,
+        as_columns=False,
+        **kwargs,
+    ):
         """Returns the data for stress period `key`.
 
         Parameters
@@ -2192,6 +2217,9 @@ class MFPandasTransientList(
                 Apply multiplier
             dataframe : bool
                 Get as pandas dataframe
+            as_columns : bool
+                Get as a dictionary of read-only numpy arrays, one for each
+                column, with cellids stored as separate integer columns
 
         Returns
         -------
@@ -2223,14 +2251,16 @@ class MFPandasTransientList(
                             output[key] = super().get_dataframe()
                         else:
                             output[key] = super().get_data(
-                                apply_mult=apply_mult
+                                apply_mult=apply_mult, as_columns=as_columns
                             )
                     return output
             self.get_data_prep(key)
             if dataframe:
                 return super().get_dataframe()
             else:
-                return super().get_data(apply_mult=apply_mult)
+                return super().get_data(
+                    apply_mult=apply_mult, as_columns=as_columns
+                )
         else:
             return None
 
@@ -2250,6 +2280,7 @@ class MFPandasTransientList(
         check_data : bool
             Whether to verify the data
         """
+        self._modified = True
         self._set_data_record(
             record,
             autofill=autofill,
@@ -2270,10 +2301,26 @@ class MFPandasTransientList(
             stress period of data will be removed.
         key : int
             Zero based stress period to assign data too.  Does not apply
-            if `data` is a dictionary.
+            if `data` is a dictionary or a stacked DataFrame.
         autofill : bool
             Automatically correct data.
+
+        Notes
+        -----
+        A DataFrame with a "kper" column, like the one returned by
+        get_dataframe(stacked=True), sets the data of every stress period
+        in the "kper" column.
         """
+        self._modified = True
+        if (
+            key is None
+            and isinstance(data, pandas.DataFrame)
+            and "kper" in data.columns
+        ):
+            data = {
+                int(kper): group.drop(columns="kper").reset_index(drop=True)
+                for kper, group in data.groupby("kper", sort=True)
+            }
         self._set_data_record(data, key, autofill)
 
     def masked_4D_arrays_itr(self):
@@ -2330,6 +2377,7 @@ class MFPandasTransientList(
                                 autofill=autofill,
                                 check_data=check_data,
                             )
+                        self._share_repeated_data(self._current_key)
                 for key in del_keys:
                     del data_record[key]
             else:
@@ -2490,13 +2538,15 @@ class MFPandasTransientList(
 
         """
         self._load_prep(block_header)
-        return super().load(
+        result = super().load(
             first_line,
             file_handle,
             block_header,
             pre_data_comments,
             external_file_info,
         )
+        self._share_repeated_data(self._current_key)
+        return result
 
     def append_list_as_record(self, record, key=0):
         """Appends the list `data` as a single record in this list's recarray
@@ -2532,6 +2582,28 @@ class MFPandasTransientList(
         self._update_record_prep(key)
         super().update_record(record, key_index)
 
+    def _share_repeated_data(self, key):
+        """
+        Store the data of stress period "key" in the same dataframe as the
+        previous stress period when both contain identical data.  Stored
+        dataframes are never modified in place, so they can be shared.
+        """
+        if not isinstance(key, int) or key - 1 not in self._data_storage:
+            return
+        storage = self._data_storage.get(key)
+        previous = self._data_storage[key - 1]
+        for sto in (storage, previous):
+            if (
+                sto is None
+                or sto.data_storage_type != DataStorageType.internal_array
+                or not isinstance(sto.internal_data, pandas.DataFrame)
+            ):
+                return
+        if storage.internal_data is not previous.internal_data and (
+            storage.internal_data.equals(previous.internal_data)
+        ):
+            storage.internal_data = previous.internal_data
+
     def _new_storage(self):
         return {}
 
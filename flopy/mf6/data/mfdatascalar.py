@@ -153,6 +153,7 @@ class MFScalar(mfdata.MFData):
                 Data to set
 
         """
+        self._modified = True
         self._resync()
         if self.structure.type == DatumType.record:
             if data is not None:
@@ -237,6 +238,7 @@ class MFScalar(mfdata.MFData):
 
     def add_one(self):
         """Adds one if this is an integer scalar"""
+        self._modified = True
         datum_type = self.structure.get_datum_type()
         if datum_type == int or datum_type == np.int32:
             if self._get_storage_obj().get_data() is None:
@@ -1758,7 +1758,7 @@ class DataStorage:
                     # make sure folder exists
                     file_path = os.path.split(fp)[0]
                     if not os.path.exists(file_path):
-                        os.makedirs(file_path)
+                        os.makedirs(file_path, exist_ok=True)
 
                     # create file
                     try:
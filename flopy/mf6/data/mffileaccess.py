@@ -1,5 +1,7 @@
 import inspect
+import re
 import sys
+import warnings
 from copy import deepcopy
 
 import numpy as np
@@ -11,6 +13,9 @@ from ..data.mfstructure import DataType, DatumType, MFDataStructure
 from ..mfbase import MFDataException, VerbosityLevel
 from .mfdatautil import MFComment, convert_data, to_string
 
+# a line of text array data with only numbers and whitespace
+_numeric_line = re.compile(r"[0-9eE+\-. \t\r\n]*")
+
 
 class MFFileAccess:
     def __init__(
@@ -488,6 +493,13 @@ class MFFileAccessArray(MFFileAccess):
                     jagged_def_path
                 ].array
 
+        # format numeric arrays in bulk
+        data_string = self._get_array_data_string(
+            data, data_type, data_indent, is_cellid, jagged_def
+        )
+        if data_string is not None:
+            return data_string
+
         for item, last_item, new_list, nesting_change in data_iter:
             # increment data/layer counts
             line_data_count += 1
@@ -543,6 +555,84 @@ class MFFileAccessArray(MFFileAccess):
         else:
             return "\n".join(layer_data_string)
 
+    def _get_array_data_string(
+        self, data, data_type, data_indent, is_cellid, jagged_def
+    ):
+        """
+        Format a numeric numpy array the same way as get_data_string, with
+        a single string formatting operation for all values. Returns None
+        if the data can not be formatted in bulk.
+        """
+        if (
+            not isinstance(data, np.ndarray)
+            or data.ndim == 0
+            or data.size == 0
+            or data.dtype.kind not in "biuf"
+            or data_type not in (DatumType.integer, DatumType.double_precision)
+        ):
+            return None
+        sim_data = self._simulation_data
+        indent_str = sim_data.indent_string.replace("%", "%%")
+        line_indent = str(data_indent).replace("%", "%%")
+        values = data.ravel()
+
+        # printf style format of each value
+        if data_type == DatumType.double_precision:
+            formats = []
+            for fmt_str in (sim_data.reg_format_str, sim_data.sci_format_str):
+                if not (fmt_str.startswith("{:") and fmt_str.endswith("}")):
+                    return None
+                formats.append(f"{indent_str}%{fmt_str[2:-1]}")
+            abs_val = np.abs(values)
+            with np.errstate(invalid="ignore"):
+                reg = (
+                    (abs_val > sim_data._sci_note_upper_thres)
+                    | (abs_val < sim_data._sci_note_lower_thres)
+                ) & (abs_val != 0)
+            item_formats = np.where(reg, formats[0], formats[1])
+        else:
+            if np.any(~np.isfinite(values)):
+                return None
+            if values.dtype.kind == "f":
+                values = values.astype(np.int64)
+            if is_cellid:
+                values = values + 1
+            item_formats = np.full(len(values), f"{indent_str}%d")
+
+        # items that end a line
+        if jagged_def is not None:
+            try:
+                line_sizes = np.ravel(jagged_def).astype(int)
+            except (TypeError, ValueError):
+                return None
+            if np.any(line_sizes < 1) or line_sizes.sum() < len(values):
+                return None
+            line_end = np.cumsum(line_sizes) - 1
+            line_end = line_end[line_end < len(values)]
+        elif sim_data.wrap_multidim_arrays:
+            max_columns = sim_data.max_columns_of_data
+            if not isinstance(max_columns, (int, np.integer)) or max_columns < 1:
+                return None
+            row_size = data.shape[-1]
+            position = np.arange(len(values)) % row_size
+            line_end = np.flatnonzero(
+                ((position + 1) % max_columns == 0) | (position == row_size - 1)
+            )
+        else:
+            line_end = np.zeros(0, dtype=int)
+        item_formats = item_formats.astype(object)
+        item_formats[line_end] += f"\n{line_indent}"
+
+        data_string = (line_indent + "".join(item_formats.tolist())) % tuple(
+            values.tolist()
+        )
+
+        # clean up the text at the end of the array
+        last_line = data_string.rfind("\n")
+        if last_line < 0:
+            return f"{data_indent}{data_string.strip()}\n"
+        return data_string[: last_line + 1] + data_string[last_line + 1 :].strip()
+
     def _read_binary_file_layer(
         self, fd, fname, header_dtype, numpy_type, data_size, data_shape
     ):
@@ -614,8 +704,22 @@ class MFFileAccessArray(MFFileAccess):
                 else:
                     PyListUtil.reset_delimiter_used()
         else:
-            while line != "" and len(data_raw) < data_size:
+            # lines with only numbers and whitespace are converted together
+            # after reading, other lines are split one at a time
+            numeric_lines = []
+            numeric_size = 0
+            while line != "" and len(data_raw) + numeric_size < data_size:
                 line = fd.readline()
+                if _numeric_line.fullmatch(line):
+                    arr_line = line.split()
+                    if line_size is None or len(arr_line) <= line_size:
+                        numeric_lines.append(line)
+                        numeric_size += len(arr_line)
+                        continue
+                for numeric_line in numeric_lines:
+                    data_raw += numeric_line.split()
+                numeric_lines = []
+                numeric_size = 0
                 arr_line = PyListUtil.split_data_line(line, True)
                 if not MFComment.is_comment(arr_line, True):
                     if line_size is not None:
@@ -623,6 +727,15 @@ class MFFileAccessArray(MFFileAccess):
                     data_raw += arr_line
                 else:
                     PyListUtil.reset_delimiter_used()
+            if len(data_raw) == 0:
+                data_out = self._convert_numeric_lines(
+                    numeric_lines, numeric_size, data_type
+                )
+                if data_out is not None:
+                    data_raw = data_out[:data_size]
+            if not isinstance(data_raw, np.ndarray):
+                for numeric_line in numeric_lines:
+                    data_raw += numeric_line.split()
 
         if len(data_raw) < data_size:
             message = (
@@ -657,7 +770,9 @@ class MFFileAccessArray(MFFileAccess):
         elif data_type == DatumType.integer:
             data_type = np.int32
 
-        if data_size < 0:
+        if isinstance(data_raw, np.ndarray):
+            data_out = data_raw.astype(data_type)
+        elif data_size < 0:
             data_out = np.fromiter(data_raw, dtype=data_type)
         else:
             data_out = np.fromiter(data_raw, dtype=data_type, count=data_size)
@@ -669,6 +784,31 @@ class MFFileAccessArray(MFFileAccess):
             data_out = np.reshape(data_out, data_dim)
         return data_out, current_size
 
+    @staticmethod
+    def _convert_numeric_lines(lines, size, data_type):
+        """
+        Convert lines with only numbers and whitespace to an array with a
+        single call. Returns None if the data are not integer or double
+        data or if not all of the numbers can be converted.
+        """
+        if data_type == DatumType.integer:
+            dtype = np.int64
+        elif data_type == DatumType.double_precision:
+            dtype = np.float64
+        else:
+            return None
+        with warnings.catch_warnings():
+            # fromstring warns when it stops at an invalid number
+            warnings.simplefilter("ignore", DeprecationWarning)
+            data = np.fromstring("".join(lines), dtype=dtype, sep=" ")
+        if len(data) != size:
+            return None
+        if dtype == np.int64 and size > 0:
+            info = np.iinfo(np.int32)
+            if data.min() < info.min or data.max() > info.max:
+                return None
+        return data
+
     def load_from_package(
         self,
         first_line,
@@ -7,12 +7,16 @@ mfstructure module.  Contains classes related to package structure
 import ast
 import keyword
 import os
+import pickle
+import sys
+import tempfile
 import warnings
 from enum import Enum
 from textwrap import TextWrapper
 
 import numpy as np
 
+from ...version import __version__
 from ..mfbase import PackageContainer, StructException
 
 numeric_index_text = (
@@ -2561,6 +2565,9 @@ class MFStructure:
                 self.sim_struct.process_dfn(DfnFile(file))
             self.sim_struct.tag_read_as_arrays()
         else:
+            cache_key = self.__structure_cache_key()
+            if self.__load_cached_structure(cache_key):
+                return True
             package_list = PackageContainer.package_list()
             for package in package_list:
                 # process header
@@ -2575,9 +2582,82 @@ class MFStructure:
                 # process each package
                 self.sim_struct.process_dfn(DfnPackage(package))
             self.sim_struct.tag_read_as_arrays()
+            self.__save_cached_structure(cache_key)
 
         return True
 
+    @staticmethod
+    def _structure_cache_file():
+        """Returns the path of the file that caches the structure built from
+        the generated package classes."""
+        if sys.platform.startswith("win"):
+            cache_dir = os.path.expandvars(r"%LOCALAPPDATA%\flopy\cache")
+        else:
+            cache_dir = os.path.join(
+                os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+                "flopy",
+            )
+        return os.path.join(cache_dir, f"mf6_structure_{__version__}.pickle")
+
+    @staticmethod
+    def __structure_cache_key():
+        # the cache is out of date when the python version, this module, or
+        # any of the generated package classes change
+        modflow_path = os.path.join(
+            os.path.dirname(os.path.dirname(os.path.realpath(__file__))),
+            "modflow",
+        )
+        files = [os.path.realpath(__file__)] + sorted(
+            os.path.join(modflow_path, file)
+            for file in os.listdir(modflow_path)
+            if file.endswith(".py")
+        )
+        file_stats = []
+        for file in files:
+            stat = os.stat(file)
+            file_stats.append(
+                (os.path.basename(file), stat.st_size, stat.st_mtime_ns)
+            )
+        return sys.version_info[:2], file_stats
+
+    def __load_cached_structure(self, cache_key):
+        # loading the cache is best effort, any problem with the cache file
+        # falls back to building the structure
+        try:
+            with open(self._structure_cache_file(), "rb") as fd_cache:
+                if pickle.load(fd_cache) != cache_key:
+                    return False
+                sim_struct, dimension_dict, flopy_dict = pickle.load(fd_cache)
+        except Exception:
+            return False
+        self.sim_struct = sim_struct
+        self.dimension_dict = dimension_dict
+        self.flopy_dict = flopy_dict
+        return True
+
+    def __save_cached_structure(self, cache_key):
+        cache_file = self._structure_cache_file()
+        temp_file = None
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            # write to a temporary file so concurrent processes never read a
+            # partially written cache
+            with tempfile.NamedTemporaryFile(
+                "wb", dir=os.path.dirname(cache_file), delete=False
+            ) as fd_cache:
+                temp_file = fd_cache.name
+                pickle.dump(cache_key, fd_cache, pickle.HIGHEST_PROTOCOL)
+                pickle.dump(
+                    (self.sim_struct, self.dimension_dict, self.flopy_dict),
+                    fd_cache,
+                    pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(temp_file, cache_file)
+        except Exception:
+            # the cache is optional
+            if temp_file is not None and os.path.exists(temp_file):
+                os.remove(temp_file)
+
     @staticmethod
     def __valid_line(line):
         if len(line.strip()) > 1 and line[0] != "#":
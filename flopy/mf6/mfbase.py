@@ -1,6 +1,7 @@
 """Base classes for Modflow 6"""
 
 import copy
+import importlib
 import inspect
 import os
 import sys
@@ -241,7 +242,7 @@ class MFFileMgmt:
                     if path_old != path_new:
                         new_folders = os.path.split(path_new)[0]
                         if not os.path.exists(new_folders):
-                            os.makedirs(new_folders)
+                            os.makedirs(new_folders, exist_ok=True)
                         try:
                             copyfile(path_old, path_new)
                         except:
@@ -467,6 +468,7 @@ class PackageContainer:
 
         Returns a list of MFPackage subclasses
         """
+        PackageContainer._import_modflow_modules()
         # all packages except "group" classes
         package_list = []
         for abbr, package in sorted(PackageContainer.packages_by_abbr.items()):
@@ -494,10 +496,14 @@ class PackageContainer:
 
         """
         package_abbr = f"{model_type}{package_type}"
-        factory = PackageContainer.packages_by_abbr.get(package_abbr)
+        factory = PackageContainer._get_modflow_class(
+            PackageContainer.packages_by_abbr, package_abbr
+        )
         if factory is None:
             package_utl_abbr = f"utl{package_type}"
-            factory = PackageContainer.packages_by_abbr.get(package_utl_abbr)
+            factory = PackageContainer._get_modflow_class(
+                PackageContainer.packages_by_abbr, package_utl_abbr
+            )
         return factory
 
     @staticmethod
@@ -516,7 +522,97 @@ class PackageContainer:
             model : MFModel subclass
 
         """
-        return PackageContainer.models_by_type.get(model_type)
+        return PackageContainer._get_modflow_class(
+            PackageContainer.models_by_type, model_type
+        )
+
+    @staticmethod
+    def _get_modflow_class(classes, abbr):
+        """Returns the package or model class registered under abbr in
+        classes, first importing the generated module that defines it if
+        needed.  For internal FloPy use only, not intended for end users.
+        """
+        if abbr not in classes:
+            # "group" classes are defined in their package's module
+            if abbr.endswith("packages"):
+                module_name = f"mf{abbr[: -len('packages')]}"
+            else:
+                module_name = f"mf{abbr}"
+            from . import modflow
+
+            if module_name in modflow._class_modules.values():
+                importlib.import_module(f"{modflow.__name__}.{module_name}")
+        return classes.get(abbr)
+
+    @staticmethod
+    def _import_modflow_modules():
+        """Imports all generated package and model modules, registering their
+        classes.  For internal FloPy use only, not intended for end users.
+        """
+        from . import modflow
+
+        for module_name in sorted(set(modflow._class_modules.values())):
+            importlib.import_module(f"{modflow.__name__}.{module_name}")
+
+    @staticmethod
+    def _run_jobs(jobs, verbose=False, workers=None, process="running jobs"):
+        """Calls each job in jobs, optionally using a pool of threads, and
+        returns the job results in order.  For internal FloPy use only, not
+        intended for end users.
+
+        Parameters
+        ----------
+            jobs : list
+                List of (message, job) tuples in order, where job is a
+                callable (for example one that writes or loads one file) and
+                message is printed before the job is called.  Either may be
+                None.
+            verbose : bool
+                Whether to print the job messages
+            workers : int
+                Number of threads used to call jobs.  Jobs are called one at
+                a time when workers is None or less than 2.
+            process : str
+                Description of the jobs, used in error messages
+
+        Returns
+        -------
+            results : list
+                Results of the jobs that are not None, in order
+
+        """
+        if workers is None or workers <= 1 or len(jobs) < 2:
+            results = []
+            for message, job in jobs:
+                if verbose and message is not None:
+                    print(message)
+                if job is not None:
+                    results.append(job())
+            return results
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        if verbose:
+            for message, _ in jobs:
+                if message is not None:
+                    print(message)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(job) for _, job in jobs if job is not None]
+        # report errors in order once all jobs have finished
+        errors = [
+            future.exception()
+            for future in futures
+            if future.exception() is not None
+        ]
+        if len(errors) == 1:
+            raise errors[0]
+        elif errors:
+            error_list = "\n".join(f"  {error}" for error in errors)
+            raise FlopyException(
+                f"{len(errors)} errors occurred while {process}:\n{error_list}",
+                process,
+            ) from errors[0]
+        return [future.result() for future in futures]
 
     @staticmethod
     def get_module_val(module, item, attrb):
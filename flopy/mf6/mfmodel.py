@@ -2,6 +2,7 @@ import inspect
 import os
 import sys
 import warnings
+from functools import partial
 from typing import Optional, Union
 
 import numpy as np
@@ -1299,7 +1300,12 @@ class MFModel(ModelInterface):
         else:
             return f",{data_entry}\n"
 
-    def write(self, ext_file_action=ExtFileAction.copy_relative_paths):
+    def write(
+        self,
+        ext_file_action=ExtFileAction.copy_relative_paths,
+        workers=None,
+        only_modified=False,
+    ):
         """
         Writes out model's package files.
 
@@ -1309,26 +1315,39 @@ class MFModel(ModelInterface):
             Defines what to do with external files when the simulation path has
             changed.  defaults to copy_relative_paths which copies only files
             with relative paths, leaving files defined by absolute paths fixed.
+        workers : int, optional
+            Number of threads used to write package files concurrently.  By
+            default (None) package files are written one at a time.
+        only_modified : bool, optional
+            Only write the name file and packages that have been modified
+            since they were loaded or last written (see
+            MFPackage.is_modified).
 
         """
-
-        # write name file
-        if (
+        PackageContainer._run_jobs(
+            self._get_file_writers(ext_file_action, only_modified),
             self.simulation_data.verbosity_level.value
-            >= VerbosityLevel.normal.value
-        ):
-            print("    writing model name file...")
-
-        self.name_file.write(ext_file_action=ext_file_action)
+            >= VerbosityLevel.normal.value,
+            workers,
+            "writing files",
+        )
 
-        # write packages
-        for pp in self.packagelist:
-            if (
-                self.simulation_data.verbosity_level.value
-                >= VerbosityLevel.normal.value
-            ):
-                print(f"    writing package {pp._get_pname()}...")
-            pp.write(ext_file_action=ext_file_action)
+    def _get_file_writers(self, ext_file_action, only_modified=False):
+        """Returns a list of (message, writer) tuples, one for each of the
+        model's files to write, in write order."""
+        writers = []
+        # name file and packages
+        for pp in [self.name_file] + self.packagelist:
+            if only_modified and not pp.is_modified():
+                continue
+            if pp is self.name_file:
+                message = "    writing model name file..."
+            else:
+                message = f"    writing package {pp._get_pname()}..."
+            writers.append(
+                (message, partial(pp.write, ext_file_action=ext_file_action))
+            )
+        return writers
 
     def get_grid_type(self):
         """
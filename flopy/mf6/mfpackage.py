@@ -1447,7 +1447,7 @@ class MFBlock:
         if fd_folder_path != "":
             if not os.path.exists(fd_folder_path):
                 # create new external data folder
-                os.makedirs(fd_folder_path)
+                os.makedirs(fd_folder_path, exist_ok=True)
         return fd_main, fd_file_path
 
     def _write_block(self, fd, block_header, ext_file_action):
@@ -1858,6 +1858,8 @@ class MFPackage(PackageInterface):
             self.container_type.append(PackageContainerType.package)
         # init variables that may be used later
         self.post_block_comments = None
+        # file path the package was last loaded from or written to
+        self._last_file_path = None
         self.last_error = None
         self.bc_color = "black"
         self.__inattr = False
@@ -2934,6 +2936,7 @@ class MFPackage(PackageInterface):
             raise ReadAsArraysException(err)
         # close file
         fd_input_file.close()
+        self._reset_modified()
 
         if self.simulation_data.auto_set_sizes:
             self._update_size_defs()
@@ -2941,6 +2944,32 @@ class MFPackage(PackageInterface):
         # return validity of file
         return self.is_valid()
 
+    def is_modified(self):
+        """Returns whether the package has changed since it was loaded or
+        last written.  Changes to package data made through FloPy (for
+        example with set_data) are tracked.  A package that has not been
+        loaded from or written to its current file path is always modified.
+
+        Returns
+        -------
+        is modified : bool
+
+        """
+        if self._last_file_path != self.get_file_path():
+            return True
+        for block in self.blocks.values():
+            for dataset in block.datasets.values():
+                if dataset._modified:
+                    return True
+        return False
+
+    def _reset_modified(self):
+        # mark the package as matching its file
+        self._last_file_path = self.get_file_path()
+        for block in self.blocks.values():
+            for dataset in block.datasets.values():
+                dataset._modified = False
+
     def is_valid(self):
         """Returns whether or not this package is valid.
 
@@ -3162,7 +3191,7 @@ class MFPackage(PackageInterface):
         package_file_path = self.get_file_path()
         package_folder = os.path.split(package_file_path)[0]
         if package_folder and not os.path.isdir(package_folder):
-            os.makedirs(os.path.split(package_file_path)[0])
+            os.makedirs(package_folder, exist_ok=True)
 
         # open file
         fd = open(package_file_path, "w")
@@ -3184,6 +3213,7 @@ class MFPackage(PackageInterface):
         self._write_blocks(fd, ext_file_action)
 
         fd.close()
+        self._reset_modified()
 
     def create_package_dimensions(self):
         """Creates a package dimensions object.  For internal FloPy library
@@ -3,12 +3,14 @@ import inspect
 import os.path
 import sys
 import warnings
+from functools import partial
 from pathlib import Path
 from typing import Optional, Union, cast
 
 import numpy as np
 
 from flopy.mbase import run_model
+from flopy.mf6 import mfsnapshot
 from flopy.mf6.data import mfdata, mfdatalist, mfstructure
 from flopy.mf6.data.mfdatautil import MFComment
 from flopy.mf6.data.mfstructure import DatumType
@@ -107,7 +109,9 @@ class SimulationDict(dict):
 
         """
         key_path_size = len(key_path)
-        for key, item in self.items():
+        # search a snapshot of the items, models may be loading in other
+        # threads
+        for key, item in list(self.items()):
             if key[:key_path_size] == key_path:
                 if key[-1] == key_leaf:
                     # found key_leaf as a key in the dictionary
@@ -780,6 +784,7 @@ class MFSimulationBase:
         write_headers=True,
         lazy_io=False,
         use_pandas=True,
+        workers=None,
     ):
         """
         Load an existing model. Do not call this method directly.  Should only
@@ -825,6 +830,12 @@ class MFSimulationBase:
             both off.
         use_pandas: bool
             Load/save data using pandas dataframes (for supported data)
+        workers: int
+            Number of threads used to load models concurrently, after the
+            simulation name file and tdis package are loaded.  The packages
+            of each model are loaded in order and models are added to the
+            simulation in name file order.  Models are loaded one at a time
+            by default (None).
 
         Returns
         -------
@@ -896,24 +907,39 @@ class MFSimulationBase:
         if models is None:
             return instance
 
+        model_loaders = []
         for item in models:
             # resolve model working folder and name file
             path, name_file = os.path.split(item[1])
             model_obj = PackageContainer.model_factory(item[0][:-1].lower())
             # load model
-            if verbosity_level.value >= VerbosityLevel.normal.value:
-                print(f"  loading model {item[0].lower()}...")
-            instance._models[item[2]] = model_obj.load(
-                instance,
-                instance.structure.model_struct_objs[item[0].lower()],
-                item[2],
-                name_file,
-                version,
-                exe_name,
-                strict,
-                path,
-                load_only,
+            model_loaders.append(
+                (
+                    f"  loading model {item[0].lower()}...",
+                    partial(
+                        model_obj.load,
+                        instance,
+                        instance.structure.model_struct_objs[item[0].lower()],
+                        item[2],
+                        name_file,
+                        version,
+                        exe_name,
+                        strict,
+                        path,
+                        load_only,
+                    ),
+                )
             )
+        loaded_models = PackageContainer._run_jobs(
+            model_loaders,
+            verbosity_level.value >= VerbosityLevel.normal.value,
+            workers,
+            "loading models",
+        )
+        for item, model in zip(models, loaded_models):
+            instance._models[item[2]] = model
+        if workers is not None and workers > 1:
+            instance._set_max_columns_of_data()
 
         # load exchange packages and dependent packages
         try:
@@ -1058,6 +1084,9 @@ class MFSimulationBase:
                     )
                 sln_package.load(strict)
 
+        # registering the loaded packages sets name file records to the
+        # values they were loaded with
+        instance.name_file._reset_modified()
         instance.simulation_data.mfpath.set_last_accessed_path()
         if verify_data:
             instance.check()
@@ -1663,8 +1692,26 @@ class MFSimulationBase:
         for package in self._exchange_files.values():
             package.set_all_data_internal(check_data)
 
+    def _set_max_columns_of_data(self):
+        """Sets the number of columns written per line of array data to
+        the number of columns of the last model with a dis package, unless
+        set by the user."""
+        sim_data = self.simulation_data
+        if not sim_data.max_columns_user_set:
+            # search for dis packages
+            for model in self._models.values():
+                dis = model.get_package("dis", type_only=True)
+                if dis is not None and hasattr(dis, "ncol"):
+                    sim_data.max_columns_of_data = dis.ncol.get_data()
+                    sim_data.max_columns_user_set = False
+                    sim_data.max_columns_auto_set = True
+
     def write_simulation(
-        self, ext_file_action=ExtFileAction.copy_relative_paths, silent=False
+        self,
+        ext_file_action=ExtFileAction.copy_relative_paths,
+        silent=False,
+        workers=None,
+        only_modified=False,
     ):
         """
         Write the simulation to files.
@@ -1677,80 +1724,157 @@ class MFSimulationBase:
                 by absolute paths fixed.
             silent : bool
                 Writes out the simulation in silent mode (verbosity_level = 0)
-
-        """
-        sim_data = self.simulation_data
-        if not sim_data.max_columns_user_set:
-            # search for dis packages
-            for model in self._models.values():
-                dis = model.get_package("dis", type_only=True)
-                if dis is not None and hasattr(dis, "ncol"):
-                    sim_data.max_columns_of_data = dis.ncol.get_data()
-                    sim_data.max_columns_user_set = False
-                    sim_data.max_columns_auto_set = True
+            workers : int, optional
+                Number of threads used to write package files (and the
+                external files they write) concurrently.  Files are written
+                one at a time by default (None).  Written files are the same
+                either way.  When writing concurrently, all files are
+                attempted before any errors are raised.
+            only_modified : bool, optional
+                Only write name files and packages (and the external files
+                they write) that have been modified since they were loaded or
+                last written, see MFPackage.is_modified.  Changes made to
+                data outside of FloPy, for example to an array returned by
+                get_data, are not tracked.  Defaults to False, which writes
+                every file.
+
+        """
+        self._set_max_columns_of_data()
 
         saved_verb_lvl = self.simulation_data.verbosity_level
         if silent:
             self.simulation_data.verbosity_level = VerbosityLevel.quiet
-
-        # write simulation name file
-        if (
+        verbose = (
             self.simulation_data.verbosity_level.value
             >= VerbosityLevel.normal.value
-        ):
+        )
+
+        # write simulation name file
+        if verbose:
             print("writing simulation...")
-            print("  writing simulation name file...")
-        self.name_file.write(ext_file_action=ext_file_action)
+        writers = []
+        if not only_modified or self.name_file.is_modified():
+            writers.append(
+                (
+                    "  writing simulation name file...",
+                    partial(
+                        self.name_file.write, ext_file_action=ext_file_action
+                    ),
+                )
+            )
 
         # write TDIS file
-        if (
-            self.simulation_data.verbosity_level.value
-            >= VerbosityLevel.normal.value
-        ):
-            print("  writing simulation tdis package...")
-        self._tdis_file.write(ext_file_action=ext_file_action)
+        if not only_modified or self._tdis_file.is_modified():
+            writers.append(
+                (
+                    "  writing simulation tdis package...",
+                    partial(
+                        self._tdis_file.write, ext_file_action=ext_file_action
+                    ),
+                )
+            )
 
         # write solution files
         for solution_file in self._solution_files.values():
-            if (
-                self.simulation_data.verbosity_level.value
-                >= VerbosityLevel.normal.value
-            ):
-                print(
+            if only_modified and not solution_file.is_modified():
+                continue
+            writers.append(
+                (
                     f"  writing solution package "
-                    f"{solution_file._get_pname()}..."
+                    f"{solution_file._get_pname()}...",
+                    partial(
+                        solution_file.write, ext_file_action=ext_file_action
+                    ),
                 )
-            solution_file.write(ext_file_action=ext_file_action)
+            )
 
         # write exchange files
         for exchange_file in self._exchange_files.values():
-            exchange_file.write()
+            if only_modified and not exchange_file.is_modified():
+                continue
+            writers.append((None, exchange_file.write))
 
         # write other packages
         for pp in self._other_files.values():
-            if (
-                self.simulation_data.verbosity_level.value
-                >= VerbosityLevel.normal.value
-            ):
-                print(f"  writing package {pp._get_pname()}...")
-            pp.write(ext_file_action=ext_file_action)
+            if only_modified and not pp.is_modified():
+                continue
+            writers.append(
+                (
+                    f"  writing package {pp._get_pname()}...",
+                    partial(pp.write, ext_file_action=ext_file_action),
+                )
+            )
 
         # FIX: model working folder should be model name file folder
 
         # write models
         for model in self._models.values():
-            if (
-                self.simulation_data.verbosity_level.value
-                >= VerbosityLevel.normal.value
-            ):
-                print(f"  writing model {model.name}...")
-            model.write(ext_file_action=ext_file_action)
+            writers.append((f"  writing model {model.name}...", None))
+            writers.extend(
+                model._get_file_writers(ext_file_action, only_modified)
+            )
+        PackageContainer._run_jobs(writers, verbose, workers, "writing files")
 
         self.simulation_data.mfpath.set_last_accessed_path()
 
         if silent:
             self.simulation_data.verbosity_level = saved_verb_lvl
 
+    def save_snapshot(self, path: Union[str, os.PathLike]):
+        """Saves the in-memory state of the simulation to a single snapshot
+        file that can be restored with load_snapshot.  Restoring a snapshot is
+        much faster than loading the simulation from its input files.
+
+        Array and list data are stored as raw binary, package structure is
+        referenced by FloPy version, so snapshots can only be loaded by the
+        FloPy version that saved them.  Data of a simulation loaded with
+        lazy_io that has not been accessed yet is not part of the snapshot
+        and is read from the input files when accessed.
+
+        Parameters
+        ----------
+        path : str or PathLike
+            Path of the snapshot file.
+
+        """
+        mfsnapshot.save_snapshot(self, path)
+
+    @staticmethod
+    def load_snapshot(path: Union[str, os.PathLike], memory_map=False):
+        """Restores a simulation saved with save_snapshot.
+
+        Warning
+        -------
+        Snapshots are read with pickle, which can execute arbitrary code
+        while loading. Only load snapshots from trusted sources.
+
+        Parameters
+        ----------
+        path : str or PathLike
+            Path of the snapshot file.
+        memory_map : bool
+            Memory-map the array and list data in the snapshot file instead of
+            reading it into memory.  Data is copy-on-write, changes to the
+            simulation do not change the snapshot file.
+
+        Returns
+        -------
+        sim : MFSimulation object
+
+        Examples
+        --------
+        >>> s = flopy.mf6.mfsimulation.load('my simulation')
+        >>> s.save_snapshot('my_simulation.snapshot')
+        >>> s2 = flopy.mf6.MFSimulation.load_snapshot('my_simulation.snapshot')
+
+        """
+        sim = mfsnapshot.load_snapshot(path, memory_map)
+        if not isinstance(sim, MFSimulationBase):
+            raise FlopyException(
+                f"Snapshot {path} does not contain a simulation", "load_snapshot"
+            )
+        return sim
+
     def set_sim_path(self, path: Union[str, os.PathLike]):
         """Return a list of output data keys.
 
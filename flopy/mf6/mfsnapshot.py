@@ -0,0 +1,218 @@
+"""
+mfsnapshot module.  Contains functions for saving and restoring the in-memory
+state of a MODFLOW 6 simulation.
+
+A snapshot file contains a fixed size header, a json description of its
+contents, a pickle of the simulation and the raw contents of the simulation's
+numpy arrays (including the columns of pandas data frames).  The array
+contents are stored outside of the pickle so that they can be read directly
+into memory or memory-mapped.  Package structure objects are not stored,
+they are referenced by their position in the package structure of the FloPy
+version that saved the snapshot.
+
+"""
+
+import io
+import json
+import mmap
+import os
+import pickle
+import struct
+
+from ..version import __version__
+from .data import mfstructure
+from .mfbase import FlopyException
+
+_snapshot_magic = b"FLOPYMF6SNAPSHOT"
+# magic string, format version, and length of the json description
+_snapshot_header = struct.Struct(f"<{len(_snapshot_magic)}sIQ")
+_snapshot_format = 1
+# array contents are aligned in the file for efficient memory-mapping
+_snapshot_alignment = 64
+
+_structure_classes = {
+    mfstructure.MFStructure,
+    mfstructure.MFSimulationStructure,
+    mfstructure.MFModelStructure,
+    mfstructure.MFInputFileStructure,
+    mfstructure.MFBlockStructure,
+    mfstructure.MFDataStructure,
+    mfstructure.MFDataItemStructure,
+}
+
+
+def _structure_objects():
+    # all package structure objects in a repeatable order
+    root = mfstructure.MFStructure()
+    objects = [root]
+    found = {id(root)}
+    stack = [root.sim_struct]
+    while stack:
+        item = stack.pop()
+        item_type = type(item)
+        if item_type in _structure_classes:
+            if id(item) not in found:
+                found.add(id(item))
+                objects.append(item)
+                stack.extend(reversed(list(vars(item).values())))
+        elif item_type is list or item_type is tuple:
+            stack.extend(reversed(item))
+        elif item_type is dict:
+            stack.extend(reversed(list(item.values())))
+    return objects
+
+
+class _SnapshotPickler(pickle.Pickler):
+    def __init__(self, file, buffers, structure_objects):
+        super().__init__(file, protocol=5, buffer_callback=buffers.append)
+        self._structure_ids = {
+            id(obj): index for index, obj in enumerate(structure_objects)
+        }
+
+    def persistent_id(self, obj):
+        if type(obj) in _structure_classes:
+            return self._structure_ids[id(obj)]
+        return None
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    def __init__(self, file, buffers, structure_objects):
+        super().__init__(file, buffers=buffers)
+        self._structure_objects = structure_objects
+
+    def persistent_load(self, pid):
+        return self._structure_objects[pid]
+
+
+def save_snapshot(simulation, path):
+    """
+    Saves the in-memory state of a simulation to a snapshot file.
+
+    Parameters
+    ----------
+    simulation : MFSimulationBase
+        Simulation to save
+    path : str or PathLike
+        Path of the snapshot file
+
+    """
+    structure_objects = _structure_objects()
+    buffers = []
+    sim_pickle = io.BytesIO()
+    _SnapshotPickler(sim_pickle, buffers, structure_objects).dump(simulation)
+    sim_pickle = sim_pickle.getbuffer()
+    buffers = [buffer.raw() for buffer in buffers]
+
+    offset = sim_pickle.nbytes
+    buffer_locations = []
+    for buffer in buffers:
+        offset += -offset % _snapshot_alignment
+        buffer_locations.append([offset, buffer.nbytes])
+        offset += buffer.nbytes
+    # locations are relative to the end of the description
+    description = json.dumps(
+        {
+            "flopy_version": __version__,
+            "structure_objects": len(structure_objects),
+            "pickle": [0, sim_pickle.nbytes],
+            "buffers": buffer_locations,
+        }
+    ).encode()
+    # pad the description so the arrays are aligned in the file
+    description += b" " * (
+        -(_snapshot_header.size + len(description)) % _snapshot_alignment
+    )
+
+    # replace the snapshot file only once it is complete, this also keeps
+    # any memory-mapped copy of a previous snapshot at this path valid
+    temp_path = f"{os.fspath(path)}.tmp"
+    try:
+        with open(temp_path, "wb") as fd:
+            fd.write(
+                _snapshot_header.pack(
+                    _snapshot_magic, _snapshot_format, len(description)
+                )
+            )
+            fd.write(description)
+            data_start = fd.tell()
+            fd.write(sim_pickle)
+            for buffer, (offset, _) in zip(buffers, buffer_locations):
+                fd.write(b"\0" * (data_start + offset - fd.tell()))
+                fd.write(buffer)
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def load_snapshot(path, memory_map=False):
+    """
+    Restores a simulation from a snapshot file written by save_snapshot.
+
+    Warning
+    -------
+    Snapshots are read with pickle, which can execute arbitrary code while
+    loading. Only load snapshots from trusted sources.
+
+    Parameters
+    ----------
+    path : str or PathLike
+        Path of the snapshot file
+    memory_map : bool
+        Memory-map the array contents of the snapshot instead of reading them
+        into memory.  Arrays are copy-on-write, changes to them are not
+        written to the snapshot file.
+
+    Returns
+    -------
+    simulation : MFSimulationBase
+
+    """
+    with open(path, "rb") as fd:
+        header = fd.read(_snapshot_header.size)
+        if (
+            len(header) != _snapshot_header.size
+            or header[: len(_snapshot_magic)] != _snapshot_magic
+        ):
+            raise FlopyException(
+                f"{path} is not a simulation snapshot", "load_snapshot"
+            )
+        _, file_format, description_size = _snapshot_header.unpack(header)
+        description = json.loads(fd.read(description_size))
+        structure_objects = _structure_objects()
+        if (
+            file_format != _snapshot_format
+            or description["flopy_version"] != __version__
+            or description["structure_objects"] != len(structure_objects)
+        ):
+            raise FlopyException(
+                f"Snapshot {path} was saved by FloPy version "
+                f"{description['flopy_version']} and can not be loaded by "
+                f"version {__version__}, load the simulation from its input "
+                "files instead",
+                "load_snapshot",
+            )
+
+        data_start = _snapshot_header.size + description_size
+        offset, size = description["pickle"]
+        fd.seek(data_start + offset)
+        sim_pickle = fd.read(size)
+        if memory_map and description["buffers"]:
+            file_map = memoryview(
+                mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_COPY)
+            )
+            buffers = [
+                file_map[data_start + offset : data_start + offset + size]
+                for offset, size in description["buffers"]
+            ]
+        else:
+            buffers = []
+            for offset, size in description["buffers"]:
+                buffer = bytearray(size)
+                fd.seek(data_start + offset)
+                fd.readinto(buffer)
+                buffers.append(buffer)
+
+    return _SnapshotUnpickler(
+        io.BytesIO(sim_pickle), buffers, structure_objects
+    ).load()
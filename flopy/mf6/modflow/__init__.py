@@ -1,105 +1,126 @@
-from .mfsimulation import MFSimulation  # isort:skip
-from .mfems import ModflowEms
-from .mfgnc import ModflowGnc
-from .mfgwe import ModflowGwe
-from .mfgweadv import ModflowGweadv
-from .mfgwecnd import ModflowGwecnd
-from .mfgwectp import ModflowGwectp
-from .mfgwedis import ModflowGwedis
-from .mfgwedisu import ModflowGwedisu
-from .mfgwedisv import ModflowGwedisv
-from .mfgweesl import ModflowGweesl
-from .mfgweest import ModflowGweest
-from .mfgwefmi import ModflowGwefmi
-from .mfgwegwe import ModflowGwegwe
-from .mfgweic import ModflowGweic
-from .mfgwelke import ModflowGwelke
-from .mfgwemve import ModflowGwemve
-from .mfgwemwe import ModflowGwemwe
-from .mfgwenam import ModflowGwenam
-from .mfgweoc import ModflowGweoc
-from .mfgwesfe import ModflowGwesfe
-from .mfgwessm import ModflowGwessm
-from .mfgweuze import ModflowGweuze
-from .mfgwf import ModflowGwf
-from .mfgwfapi import ModflowGwfapi
-from .mfgwfbuy import ModflowGwfbuy
-from .mfgwfchd import ModflowGwfchd
-from .mfgwfcsub import ModflowGwfcsub
-from .mfgwfdis import ModflowGwfdis
-from .mfgwfdisu import ModflowGwfdisu
-from .mfgwfdisv import ModflowGwfdisv
-from .mfgwfdrn import ModflowGwfdrn
-from .mfgwfevt import ModflowGwfevt
-from .mfgwfevta import ModflowGwfevta
-from .mfgwfghb import ModflowGwfghb
-from .mfgwfgnc import ModflowGwfgnc
-from .mfgwfgwe import ModflowGwfgwe
-from .mfgwfgwf import ModflowGwfgwf
-from .mfgwfgwt import ModflowGwfgwt
-from .mfgwfhfb import ModflowGwfhfb
-from .mfgwfic import ModflowGwfic
-from .mfgwflak import ModflowGwflak
-from .mfgwfmaw import ModflowGwfmaw
-from .mfgwfmvr import ModflowGwfmvr
-from .mfgwfnam import ModflowGwfnam
-from .mfgwfnpf import ModflowGwfnpf
-from .mfgwfoc import ModflowGwfoc
-from .mfgwfprt import ModflowGwfprt
-from .mfgwfrch import ModflowGwfrch
-from .mfgwfrcha import ModflowGwfrcha
-from .mfgwfriv import ModflowGwfriv
-from .mfgwfsfr import ModflowGwfsfr
-from .mfgwfsto import ModflowGwfsto
-from .mfgwfuzf import ModflowGwfuzf
-from .mfgwfvsc import ModflowGwfvsc
-from .mfgwfwel import ModflowGwfwel
-from .mfgwt import ModflowGwt
-from .mfgwtadv import ModflowGwtadv
-from .mfgwtapi import ModflowGwtapi
-from .mfgwtcnc import ModflowGwtcnc
-from .mfgwtdis import ModflowGwtdis
-from .mfgwtdisu import ModflowGwtdisu
-from .mfgwtdisv import ModflowGwtdisv
-from .mfgwtdsp import ModflowGwtdsp
-from .mfgwtfmi import ModflowGwtfmi
-from .mfgwtgwt import ModflowGwtgwt
-from .mfgwtic import ModflowGwtic
-from .mfgwtist import ModflowGwtist
-from .mfgwtlkt import ModflowGwtlkt
-from .mfgwtmst import ModflowGwtmst
-from .mfgwtmvt import ModflowGwtmvt
-from .mfgwtmwt import ModflowGwtmwt
-from .mfgwtnam import ModflowGwtnam
-from .mfgwtoc import ModflowGwtoc
-from .mfgwtsft import ModflowGwtsft
-from .mfgwtsrc import ModflowGwtsrc
-from .mfgwtssm import ModflowGwtssm
-from .mfgwtuzt import ModflowGwtuzt
-from .mfims import ModflowIms
-from .mfmvr import ModflowMvr
-from .mfmvt import ModflowMvt
-from .mfnam import ModflowNam
-from .mfprt import ModflowPrt
-from .mfprtdis import ModflowPrtdis
-from .mfprtdisv import ModflowPrtdisv
-from .mfprtfmi import ModflowPrtfmi
-from .mfprtmip import ModflowPrtmip
-from .mfprtnam import ModflowPrtnam
-from .mfprtoc import ModflowPrtoc
-from .mfprtprp import ModflowPrtprp
-from .mfpts import ModflowPts
-from .mfsimulation import MFSimulation
-from .mftdis import ModflowTdis
-from .mfutlats import ModflowUtlats
-from .mfutlhpc import ModflowUtlhpc
-from .mfutllaktab import ModflowUtllaktab
-from .mfutlncf import ModflowUtlncf
-from .mfutlobs import ModflowUtlobs
-from .mfutlsfrtab import ModflowUtlsfrtab
-from .mfutlspc import ModflowUtlspc
-from .mfutlspca import ModflowUtlspca
-from .mfutltas import ModflowUtltas
-from .mfutlts import ModflowUtlts
-from .mfutltvk import ModflowUtltvk
-from .mfutltvs import ModflowUtltvs
+import importlib
+
+# package classes are imported on first use, see __getattr__
+_class_modules = {
+    "MFSimulation": "mfsimulation",
+    "ModflowEms": "mfems",
+    "ModflowGnc": "mfgnc",
+    "ModflowGwe": "mfgwe",
+    "ModflowGweadv": "mfgweadv",
+    "ModflowGwecnd": "mfgwecnd",
+    "ModflowGwectp": "mfgwectp",
+    "ModflowGwedis": "mfgwedis",
+    "ModflowGwedisu": "mfgwedisu",
+    "ModflowGwedisv": "mfgwedisv",
+    "ModflowGweesl": "mfgweesl",
+    "ModflowGweest": "mfgweest",
+    "ModflowGwefmi": "mfgwefmi",
+    "ModflowGwegwe": "mfgwegwe",
+    "ModflowGweic": "mfgweic",
+    "ModflowGwelke": "mfgwelke",
+    "ModflowGwemve": "mfgwemve",
+    "ModflowGwemwe": "mfgwemwe",
+    "ModflowGwenam": "mfgwenam",
+    "ModflowGweoc": "mfgweoc",
+    "ModflowGwesfe": "mfgwesfe",
+    "ModflowGwessm": "mfgwessm",
+    "ModflowGweuze": "mfgweuze",
+    "ModflowGwf": "mfgwf",
+    "ModflowGwfapi": "mfgwfapi",
+    "ModflowGwfbuy": "mfgwfbuy",
+    "ModflowGwfchd": "mfgwfchd",
+    "ModflowGwfcsub": "mfgwfcsub",
+    "ModflowGwfdis": "mfgwfdis",
+    "ModflowGwfdisu": "mfgwfdisu",
+    "ModflowGwfdisv": "mfgwfdisv",
+    "ModflowGwfdrn": "mfgwfdrn",
+    "ModflowGwfevt": "mfgwfevt",
+    "ModflowGwfevta": "mfgwfevta",
+    "ModflowGwfghb": "mfgwfghb",
+    "ModflowGwfgnc": "mfgwfgnc",
+    "ModflowGwfgwe": "mfgwfgwe",
+    "ModflowGwfgwf": "mfgwfgwf",
+    "ModflowGwfgwt": "mfgwfgwt",
+    "ModflowGwfhfb": "mfgwfhfb",
+    "ModflowGwfic": "mfgwfic",
+    "ModflowGwflak": "mfgwflak",
+    "ModflowGwfmaw": "mfgwfmaw",
+    "ModflowGwfmvr": "mfgwfmvr",
+    "ModflowGwfnam": "mfgwfnam",
+    "ModflowGwfnpf": "mfgwfnpf",
+    "ModflowGwfoc": "mfgwfoc",
+    "ModflowGwfprt": "mfgwfprt",
+    "ModflowGwfrch": "mfgwfrch",
+    "ModflowGwfrcha": "mfgwfrcha",
+    "ModflowGwfriv": "mfgwfriv",
+    "ModflowGwfsfr": "mfgwfsfr",
+    "ModflowGwfsto": "mfgwfsto",
+    "ModflowGwfuzf": "mfgwfuzf",
+    "ModflowGwfvsc": "mfgwfvsc",
+    "ModflowGwfwel": "mfgwfwel",
+    "ModflowGwt": "mfgwt",
+    "ModflowGwtadv": "mfgwtadv",
+    "ModflowGwtapi": "mfgwtapi",
+    "ModflowGwtcnc": "mfgwtcnc",
+    "ModflowGwtdis": "mfgwtdis",
+    "ModflowGwtdisu": "mfgwtdisu",
+    "ModflowGwtdisv": "mfgwtdisv",
+    "ModflowGwtdsp": "mfgwtdsp",
+    "ModflowGwtfmi": "mfgwtfmi",
+    "ModflowGwtgwt": "mfgwtgwt",
+    "ModflowGwtic": "mfgwtic",
+    "ModflowGwtist": "mfgwtist",
+    "ModflowGwtlkt": "mfgwtlkt",
+    "ModflowGwtmst": "mfgwtmst",
+    "ModflowGwtmvt": "mfgwtmvt",
+    "ModflowGwtmwt": "mfgwtmwt",
+    "ModflowGwtnam": "mfgwtnam",
+    "ModflowGwtoc": "mfgwtoc",
+    "ModflowGwtsft": "mfgwtsft",
+    "ModflowGwtsrc": "mfgwtsrc",
+    "ModflowGwtssm": "mfgwtssm",
+    "ModflowGwtuzt": "mfgwtuzt",
+    "ModflowIms": "mfims",
+    "ModflowMvr": "mfmvr",
+    "ModflowMvt": "mfmvt",
+    "ModflowNam": "mfnam",
+    "ModflowPrt": "mfprt",
+    "ModflowPrtdis": "mfprtdis",
+    "ModflowPrtdisv": "mfprtdisv",
+    "ModflowPrtfmi": "mfprtfmi",
+    "ModflowPrtmip": "mfprtmip",
+    "ModflowPrtnam": "mfprtnam",
+    "ModflowPrtoc": "mfprtoc",
+    "ModflowPrtprp": "mfprtprp",
+    "ModflowPts": "mfpts",
+    "ModflowTdis": "mftdis",
+    "ModflowUtlats": "mfutlats",
+    "ModflowUtlhpc": "mfutlhpc",
+    "ModflowUtllaktab": "mfutllaktab",
+    "ModflowUtlncf": "mfutlncf",
+    "ModflowUtlobs": "mfutlobs",
+    "ModflowUtlsfrtab": "mfutlsfrtab",
+    "ModflowUtlspc": "mfutlspc",
+    "ModflowUtlspca": "mfutlspca",
+    "ModflowUtltas": "mfutltas",
+    "ModflowUtlts": "mfutlts",
+    "ModflowUtltvk": "mfutltvk",
+    "ModflowUtltvs": "mfutltvs",
+}
+
+__all__ = list(_class_modules)
+
+
+def __getattr__(name):
+    if name in _class_modules:
+        module = importlib.import_module(f".{_class_modules[name]}", __name__)
+        value = globals()[name] = getattr(module, name)
+        return value
+    if name in set(_class_modules.values()):
+        # package modules, e.g. flopy.mf6.modflow.mfims
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -81,7 +81,7 @@ class MFSimulation(mfsimbase.MFSimulationBase):
         exe_name : str or PathLike, sim_ws : str or PathLike, strict : bool,
         verbosity_level : int, load_only : list, verify_data : bool,
         write_headers : bool, lazy_io : bool, use_pandas : bool,
-        ) : MFSimulation
+        workers : int) : MFSimulation
         a class method that loads a simulation from files
     """
     def __init__(self, sim_name='sim', version='mf6',
@@ -120,9 +120,9 @@ class MFSimulation(mfsimbase.MFSimulationBase):
              sim_ws: Union[str, os.PathLike] = os.curdir,
              strict=True, verbosity_level=1, load_only=None,
              verify_data=False, write_headers=True,
-             lazy_io=False, use_pandas=True):
+             lazy_io=False, use_pandas=True, workers=None):
         return mfsimbase.MFSimulationBase.load(cls, sim_name, version, 
                                                exe_name, sim_ws, strict,
                                                verbosity_level, load_only,
                                                verify_data, write_headers, 
-                                               lazy_io, use_pandas)
+                                               lazy_io, use_pandas, workers)
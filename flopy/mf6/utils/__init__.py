@@ -3,5 +3,17 @@ from .binarygrid_util import MfGrdFile
 from .generate_classes import generate_classes
 from .lakpak_utils import get_lak_connections
 from .mfsimlistfile import MfSimulationList
-from .model_splitter import Mf6Splitter
 from .postprocessing import get_residuals, get_structured_faceflows
+
+
+def __getattr__(name):
+    # the model splitter imports flopy.plot, so it is imported on first use
+    if name == "Mf6Splitter":
+        from .model_splitter import Mf6Splitter
+
+        return Mf6Splitter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | {"Mf6Splitter"})
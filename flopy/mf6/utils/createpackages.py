@@ -442,7 +442,7 @@ def build_sim_load():
         "sim_ws : str or PathLike, strict : bool,\n        verbosity_level : "
         "int, load_only : list, verify_data : bool,\n        "
         "write_headers : bool, lazy_io : bool, use_pandas : bool,\n        "
-        ") : MFSimulation\n"
+        "workers : int) : MFSimulation\n"
         "        a class method that loads a simulation from files"
         '\n    """'
     )
@@ -454,14 +454,15 @@ def build_sim_load():
         "sim_ws: Union[str, os.PathLike] = os.curdir,\n             "
         "strict=True, verbosity_level=1, load_only=None,\n             "
         "verify_data=False, write_headers=True,\n             "
-        "lazy_io=False, use_pandas=True):\n        "
+        "lazy_io=False, use_pandas=True, workers=None):\n        "
         "return mfsimbase.MFSimulationBase.load(cls, sim_name, version, "
         "\n                                               "
         "exe_name, sim_ws, strict,\n"
         "                                               verbosity_level, "
         "load_only,\n                                               "
         "verify_data, write_headers, "
-        "\n                                               lazy_io, use_pandas)"
+        "\n                                               lazy_io, use_pandas,"
+        " workers)"
         "\n"
     )
     return sim_load, sim_load_c
@@ -568,8 +569,6 @@ def create_packages():
         "w",
         newline="\n",
     )
-    init_file.write("from .mfsimulation import MFSimulation  # isort:skip\n")
-
     nam_import_string = (
         "from .. import mfmodel\nfrom ..data.mfdatautil "
         "import ArrayTemplateGenerator, ListTemplateGenerator"
@@ -965,7 +964,7 @@ def create_packages():
         pb_file.close()
 
         init_file_imports.append(
-            f"from .mf{package_name} import Modflow{package_name.title()}\n"
+            (f"mf{package_name}", f"Modflow{package_name.title()}")
         )
 
         if package[0].dfn_type == mfstructure.DfnType.model_name_file:
@@ -1039,7 +1038,7 @@ def create_packages():
             md_file.write(package_string)
             md_file.close()
             init_file_imports.append(
-                f"from .mf{sim_name} import Modflow{sim_name.capitalize()}\n"
+                (f"mf{sim_name}", f"Modflow{sim_name.capitalize()}")
             )
         elif package[0].dfn_type == mfstructure.DfnType.sim_name_file:
             # build simulation file
@@ -1122,13 +1121,33 @@ def create_packages():
             )
             sim_file.write(package_string)
             sim_file.close()
-            init_file_imports.append(
-                "from .mfsimulation import MFSimulation\n"
-            )
+            init_file_imports.append(("mfsimulation", "MFSimulation"))
 
-    # Sort the imports
-    for line in sorted(init_file_imports, key=lambda x: x.split()[3]):
-        init_file.write(line)
+    # package classes are imported lazily by the generated __init__.py
+    init_file.write(
+        "import importlib\n\n"
+        "# package classes are imported on first use, see __getattr__\n"
+        "_class_modules = {\n"
+    )
+    for module_name, class_name in sorted(init_file_imports, key=lambda x: x[1]):
+        init_file.write(f'    "{class_name}": "{module_name}",\n')
+    init_file.write(
+        "}\n\n"
+        "__all__ = list(_class_modules)\n\n\n"
+        "def __getattr__(name):\n"
+        "    if name in _class_modules:\n"
+        '        module = importlib.import_module(f".{_class_modules[name]}", '
+        "__name__)\n"
+        "        value = globals()[name] = getattr(module, name)\n"
+        "        return value\n"
+        "    if name in set(_class_modules.values()):\n"
+        "        # package modules, e.g. flopy.mf6.modflow.mfims\n"
+        '        return importlib.import_module(f".{name}", __name__)\n'
+        '    raise AttributeError(f"module {__name__!r} has no attribute '
+        '{name!r}")\n\n\n'
+        "def __dir__():\n"
+        "    return sorted(set(globals()) | set(__all__))\n"
+    )
     init_file.close()
 
 
@@ -632,6 +632,7 @@ class Modflow(BaseModel):
         load_only=None,
         forgive=False,
         check=True,
+        lazy_io=False,
     ):
         """
         Load an existing MODFLOW model.
@@ -660,7 +661,18 @@ class Modflow(BaseModel):
             Option to raise exceptions on package load failure, which can be
             useful for debugging. Default False.
         check : boolean, optional
-            Check model input for common errors. Default True.
+            Check model input for common errors. Default True. Not done when
+            lazy_io is True.
+        lazy_io : bool, optional
+            Only read the packages in the name file when they are first
+            accessed, for example with ``ml.wel`` or ``ml.get_package("WEL")``.
+            DIS, BAS6 and parameter files are read when the model is loaded.
+            Accessing the model's package list (which writing, checking or
+            exporting the model does) reads all remaining packages, the
+            model is then the same as one loaded with lazy_io False. Changing
+            the model workspace also reads all remaining packages. The files
+            of name file entries that have not been read are kept open until
+            they are read. Default False.
 
         Returns
         -------
@@ -812,7 +824,7 @@ class Modflow(BaseModel):
             assert ml.pop_key_list.pop() == ext_pkg_d.get("MULT")
 
         # try loading packages in ext_unit_dict
-        for key, item in ext_unit_dict.items():
+        def load_unit(key, item):
             if item.package is not None:
                 if item.filetype in load_only:
                     package_load_args = getfullargspec(item.package.load)[0]
@@ -875,20 +887,31 @@ class Modflow(BaseModel):
             else:
                 raise KeyError(f"unhandled case: {key}, {item}")
 
-        # pop binary output keys and any external file units that are now
-        # internal
-        for key in ml.pop_key_list:
-            try:
-                ml.remove_external(unit=key)
-                item = ext_unit_dict.pop(key)
-                if hasattr(item.filehandle, "close"):
-                    item.filehandle.close()
-            except KeyError:
-                if ml.verbose:
-                    print(
-                        f"\nWARNING:\n    External file unit {key} does not "
-                        "exist in ext_unit_dict."
-                    )
+        def remove_loaded_units():
+            # pop binary output keys and any external file units that are now
+            # internal
+            for key in ml.pop_key_list:
+                try:
+                    ml.remove_external(unit=key)
+                    item = ext_unit_dict.pop(key)
+                    if hasattr(item.filehandle, "close"):
+                        item.filehandle.close()
+                except KeyError:
+                    if ml.verbose:
+                        print(
+                            f"\nWARNING:\n    External file unit {key} does not "
+                            "exist in ext_unit_dict."
+                        )
+
+        if lazy_io:
+            ml._lazy_loader = _LazyPackageLoader(
+                ml, ext_unit_dict, load_unit, remove_loaded_units
+            )
+            ml._lazy_loader.load("BAS6")
+        else:
+            for key, item in ext_unit_dict.items():
+                load_unit(key, item)
+            remove_loaded_units()
 
         # write message indicating packages that were successfully loaded
         if ml.verbose:
@@ -906,8 +929,184 @@ class Modflow(BaseModel):
                 )
                 for fname in files_not_loaded:
                     print(f"      {os.path.basename(fname)}")
-        if check:
+        if check and not lazy_io:
             ml.check(f=f"{ml.name}.chk", verbose=ml.verbose, level=0)
 
         # return model object
         return ml
+
+
+class _LazyPackageLoader:
+    """
+    Reads the entries of a MODFLOW name file when the packages they define
+    are first accessed, see the lazy_io option of Modflow.load.
+
+    Parameters
+    ----------
+    model : Modflow
+        Model the packages are loaded into
+    ext_unit_dict : dict
+        Name file entries of the model
+    load_unit : callable
+        Reads a name file entry, called with its unit number and entry
+    finish : callable
+        Called once all name file entries have been read
+
+    """
+
+    # parallel lists of the output and external files of the model
+    _file_registries = (
+        ("output_units", "output_fnames", "output_binflag", "output_packages"),
+        ("external_units", "external_fnames", "external_binflag", "external_output"),
+    )
+
+    def __init__(self, model, ext_unit_dict, load_unit, finish):
+        self._model = model
+        # name file entries that have not been read, in name file order
+        self._entries = list(ext_unit_dict.items())
+        self._pending = set(range(len(self._entries)))
+        self._load_unit = load_unit
+        self._finish = finish
+        # position of the name file entry that added each package, output
+        # file and external file
+        self._package_positions = {id(p): -1 for p in model._packagelist}
+        self._file_positions = dict.fromkeys(self._file_keys(), -1)
+        # positions of the name file entries that added the packages of
+        # each output file
+        self._output_package_positions = {
+            key: [-1] * len(packages)
+            for key, packages in self._output_packages().items()
+        }
+        # position of the name file entry that first read each data unit
+        self._unit_readers = {}
+        # positions of the entries being read
+        self._loading = []
+
+    def load(self, name):
+        """
+        Read the name file entry of a package, if it has not been read.
+
+        While an entry is read, only packages of entries before it in the
+        name file are read, any other package is not available as it would
+        not be when reading the whole name file.
+
+        Parameters
+        ----------
+        name : str
+            Name of the package, 'RIV', 'LPF', etc. (case-insensitive).
+
+        """
+        name = name.upper()
+        for pos in sorted(self._pending):
+            if self._loading and pos > self._loading[-1]:
+                return
+            item = self._entries[pos][1]
+            if item.package is None:
+                continue
+            ftype = getattr(item.package, "_ftype", None)
+            if name == item.filetype.upper() or (
+                callable(ftype) and name == ftype().upper()
+            ):
+                # data files of earlier entries are added to the model first
+                for data_pos in sorted(self._pending):
+                    data_item = self._entries[data_pos][1]
+                    if data_pos < pos and data_item.package is None:
+                        self._load_entry(data_pos)
+                self._load_entry(pos)
+                return
+
+    def load_all(self):
+        """
+        Read all remaining name file entries.
+        """
+        # a package being loaded only sees the packages loaded before it
+        if self._loading:
+            return
+        while self._pending:
+            self._load_entry(min(self._pending))
+
+    def _file_keys(self):
+        keys = []
+        for registry in self._file_registries:
+            units, fnames = (getattr(self._model, name) for name in registry[:2])
+            keys.extend(
+                (registry[0], unit, fname) for unit, fname in zip(units, fnames)
+            )
+        return keys
+
+    def _output_packages(self):
+        registry = self._file_registries[0]
+        units, fnames, _, packages = (getattr(self._model, name) for name in registry)
+        return {
+            (registry[0], unit, fname): package_list
+            for unit, fname, package_list in zip(units, fnames, packages)
+        }
+
+    def _data_file_positions(self):
+        positions = {}
+        for key, item in self._entries:
+            handle = item.filehandle
+            if item.package is None and not getattr(handle, "closed", True):
+                positions[key] = (handle, handle.tell())
+        return positions
+
+    def _load_entry(self, pos):
+        self._pending.remove(pos)
+        key, item = self._entries[pos]
+        start_positions = self._data_file_positions()
+        file_keys = set(self._file_keys())
+        npackages = {
+            key: len(packages) for key, packages in self._output_packages().items()
+        }
+        self._loading.append(pos)
+        try:
+            self._load_unit(key, item)
+        finally:
+            self._loading.pop()
+
+        # data files read by more than one package are read in name file
+        # order, which can not be done once a later package has read them
+        for unit, (handle, start) in start_positions.items():
+            if handle.closed or handle.tell() == start:
+                continue
+            reader = self._unit_readers.setdefault(unit, pos)
+            if reader > pos:
+                raise ValueError(
+                    f"unit {unit} is read by "
+                    f"{self._entries[reader][1].filetype} and by "
+                    f"{item.filetype}, which is before it in the name file, "
+                    "load the model without lazy_io"
+                )
+
+        # keep the packages in name file order
+        packages = self._model._packagelist
+        for package in packages:
+            self._package_positions.setdefault(id(package), pos)
+        packages.sort(key=lambda package: self._package_positions[id(package)])
+        # an output file shared by several packages is positioned by the
+        # earliest name file entry that adds it
+        for key in self._file_keys():
+            if key not in file_keys:
+                self._file_positions[key] = pos
+        for key, packages in self._output_packages().items():
+            positions = self._output_package_positions.setdefault(key, [])
+            if len(packages) > npackages.get(key, 0):
+                self._file_positions[key] = min(self._file_positions[key], pos)
+                positions.extend([pos] * (len(packages) - len(positions)))
+                order = sorted(range(len(packages)), key=positions.__getitem__)
+                packages[:] = [packages[i] for i in order]
+                positions[:] = [positions[i] for i in order]
+        for registry in self._file_registries:
+            lists = [getattr(self._model, name) for name in registry]
+            order = sorted(
+                range(len(lists[0])),
+                key=lambda i: self._file_positions[
+                    (registry[0], lists[0][i], lists[1][i])
+                ],
+            )
+            for values in lists:
+                values[:] = [values[i] for i in order]
+
+        if not self._pending and not self._loading:
+            self._model._lazy_loader = None
+            self._finish()
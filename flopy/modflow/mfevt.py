@@ -183,12 +183,12 @@ class ModflowEvt(Package):
                 f_evt.write(f"{mxndevt:10d}\n")
 
         for n in range(nper):
-            insurf, surf = self.surf.get_kper_entry(n)
-            inevtr, evtr = self.evtr.get_kper_entry(n)
-            inexdp, exdp = self.exdp.get_kper_entry(n)
+            insurf, surf = self.surf.get_kper_entry(n, reuse=True)
+            inevtr, evtr = self.evtr.get_kper_entry(n, reuse=True)
+            inexdp, exdp = self.exdp.get_kper_entry(n, reuse=True)
             inievt = 0
             if self.nevtop == 2:
-                inievt, file_entry_ievt = ievt.get_kper_entry(n)
+                inievt, file_entry_ievt = ievt.get_kper_entry(n, reuse=True)
                 if inievt >= 0 and not self.parent.structured:
                     inievt = self.ievt[n].array.size
             comment = f"Evapotranspiration dataset 5 for stress period {n + 1}"
@@ -308,9 +308,11 @@ class ModflowRch(Package):
                 f_rch.write(f"{mxndrch:10d}\n")
 
         for kper in range(nper):
-            inrech, file_entry_rech = self.rech.get_kper_entry(kper)
+            inrech, file_entry_rech = self.rech.get_kper_entry(kper, reuse=True)
             if self.nrchop == 2:
-                inirch, file_entry_irch = irch.get_kper_entry(kper)
+                inirch, file_entry_irch = irch.get_kper_entry(
+                    kper, reuse=self.parent.structured
+                )
                 if not self.parent.structured:
                     inirch = self.rech[kper].array.size
             else:
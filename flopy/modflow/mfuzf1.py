@@ -761,7 +761,7 @@ class ModflowUzf1(Package):
                     f_uzf.write(f"{comment}\n")
 
         def write_transient(name):
-            invar, var = self.__dict__[name].get_kper_entry(n)
+            invar, var = self.__dict__[name].get_kper_entry(n, reuse=True)
 
             comment = f" #{name} for stress period {n + 1}"
             f_uzf.write(f"{invar:10d}{comment:20s}\n")
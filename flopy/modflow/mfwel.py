@@ -66,6 +66,10 @@ class ModflowWel(Package):
         Filename extension (default is 'wel')
     options : list of strings
         Package options (default is None).
+    binary : bool or int
+        Write the stress period data to binary external files. If a
+        positive int, only stress periods with at least this many wells are
+        written to binary files, 0 is the same as False (default is False).
     unitnumber : int
         File unit number (default is None).
     filenames : str or list of str
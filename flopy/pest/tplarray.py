@@ -47,7 +47,7 @@ class Transient2dTpl:
                 self.params[kper].append(p)
         return
 
-    def get_kper_entry(self, kper):
+    def get_kper_entry(self, kper, reuse=False):
         # Set defaults
         parameterized = False
         multiplier = None
@@ -75,7 +75,10 @@ class Transient2dTpl:
             u2dtpl = Util2dTpl(chararray, u2d.name, multiplier, indexed_param)
             return (1, u2dtpl.get_file_entry())
         else:
-            return self.transient2d.get_kper_entry(kper)
+            # a parameterized array of the previous period is not reused
+            if kper - 1 in self.params or kper - 1 in self.multipliers:
+                reuse = False
+            return self.transient2d.get_kper_entry(kper, reuse=reuse)
 
 
 class Util3dTpl:
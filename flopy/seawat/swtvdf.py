@@ -304,7 +304,7 @@ class SeawatVdf(Package):
         if self.mtdnconc == 0:
             nrow, ncol, nlay, nper = self.parent.nrow_ncol_nlay_nper
             for kper in range(nper):
-                itmp, file_entry_dense = self.dense.get_kper_entry(kper)
+                itmp, file_entry_dense = self.dense.get_kper_entry(kper, reuse=True)
 
                 # item 6 (and possibly 7)
                 if itmp > 0:
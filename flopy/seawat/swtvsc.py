@@ -243,7 +243,7 @@ class SeawatVsc(Package):
         if self.mt3dmuflg == 0:
             nrow, ncol, nlay, nper = self.parent.nrow_ncol_nlay_nper
             for kper in range(nper):
-                itmp, file_entry_visc = self.visc.get_kper_entry(kper)
+                itmp, file_entry_visc = self.visc.get_kper_entry(kper, reuse=True)
 
                 # item 4 (and possibly 5)
                 if itmp > 0:
@@ -21,6 +21,7 @@ import pandas as pd
 
 from ..datafile import Header, LayerFile
 from ..gridutil import get_lni
+from ..utils_def import follow_times
 
 HEAD_TEXT = "            HEAD"
 
@@ -348,6 +349,106 @@ def join_struct_arrays(arrays):
     return newrecarray
 
 
+INDEX_FILE_VERSION = 2
+
+
+def get_index_file_path(filename: Union[str, os.PathLike]) -> Path:
+    """
+    Get the path of the index file for a binary output file, which is
+    the path of the output file with ".idx" appended.
+
+    Parameters
+    ----------
+    filename : str or PathLike
+        Path of binary MODFLOW output file.
+
+    Returns
+    -------
+    Path
+
+    """
+    return Path(f"{filename}.idx")
+
+
+def write_index_file(filename: Union[str, os.PathLike], kind, **arrays):
+    """
+    Write the record index of a binary output file to its index file.
+    The index file is keyed by the size and modification time of the
+    output file, so it is invalidated if the output file changes.  The
+    index file is written to a temporary file first, so a concurrent
+    reader never sees a partially written index.
+
+    Parameters
+    ----------
+    filename : str or PathLike
+        Path of binary MODFLOW output file.
+    kind : str
+        Name of the class that built the index.
+    **arrays : dict
+        Arrays making up the index.
+
+    """
+    stat = os.stat(filename)
+    path = get_index_file_path(filename)
+    temp_path = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=path.parent, prefix=f"{path.name}.", delete=False
+        ) as f:
+            temp_path = f.name
+            np.savez(
+                f,
+                version=INDEX_FILE_VERSION,
+                kind=kind,
+                filesize=stat.st_size,
+                mtime=stat.st_mtime_ns,
+                **arrays,
+            )
+        os.replace(temp_path, path)
+    except OSError as e:
+        warnings.warn(f"Could not write index file for {filename}: {e}")
+        if temp_path is not None and os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def read_index_file(filename: Union[str, os.PathLike], kind):
+    """
+    Read the record index of a binary output file from its index file.
+
+    Parameters
+    ----------
+    filename : str or PathLike
+        Path of binary MODFLOW output file.
+    kind : str
+        Name of the class that built the index.
+
+    Returns
+    -------
+    index : dict or None
+        Arrays making up the index, or None if there is no index file or
+        it is out of date.
+
+    """
+    path = get_index_file_path(filename)
+    if not path.is_file():
+        return None
+    stat = os.stat(filename)
+    try:
+        with np.load(path, allow_pickle=False) as f:
+            index = dict(f)
+    except Exception:
+        # a corrupt index file is rebuilt
+        return None
+    if (
+        index.get("version") != INDEX_FILE_VERSION
+        or index.get("kind") != kind
+        or index.get("filesize") != stat.st_size
+        or index.get("mtime") != stat.st_mtime_ns
+    ):
+        return None
+    return index
+
+
 def get_headfile_precision(filename: Union[str, os.PathLike]):
     """
     Determine precision of a MODFLOW head file.
@@ -430,18 +531,163 @@ class BinaryLayerFile(LayerFile):
     headers, which are record arrays of the modflow header information
     (kstp, kper, pertim, totim, text, nrow, ncol, ilay), and long ints
     pointing to the 1st byte of data for the corresponding data arrays.
+
+    If the file is opened with ``mmap=True``, the file is memory-mapped
+    and data arrays returned by :meth:`get_data` and :meth:`get_alldata`
+    are read-only views into the mapped file wherever possible, rather
+    than copies. For files in which every record has the same size, the
+    index is also built in a single vectorized pass over the mapped file.
+
+    If the file is opened with ``cache_index=True``, the index is saved to
+    an index file next to the binary file (the file name with ".idx"
+    appended) and loaded from it the next time the file is opened, as long
+    as the size and modification time of the binary file are unchanged.
     """
 
-    def __init__(self, filename: Union[str, os.PathLike], precision, verbose, **kwargs):
+    def __init__(
+        self,
+        filename: Union[str, os.PathLike],
+        precision,
+        verbose,
+        mmap=False,
+        cache_index=False,
+        **kwargs,
+    ):
+        self.mmap = mmap
+        self.cache_index = cache_index
+        self._mm = None
+        self._mmrecords = None
         super().__init__(filename, precision, verbose, **kwargs)
 
-    def _build_index(self):
+    def _build_index(self, use_index_file=True):
         """
         Build the recordarray and iposarray, which maps the header information
         to the position in the binary file.
 
+        Parameters
+        ----------
+        use_index_file : bool
+            Load the index from the index file if cache_index is set and
+            the index file is up to date (default is True).
+
+        """
+        if self.mmap:
+            self._mm = np.memmap(self.filename, dtype=np.uint8, mode="r")
+        if self.cache_index and use_index_file and self._load_index_file():
+            return
+        if self._mm is None or not self._build_index_mmap():
+            self._scan_index()
+        if self.cache_index:
+            self._write_index_file()
+
+    def _load_index_file(self):
+        """
+        Load the index from the index file.
+
+        Returns
+        -------
+        success : bool
+            False if there is no up-to-date index file.
+
+        """
+        index = read_index_file(self.filename, type(self).__name__)
+        # the header dtype depends on the precision, the index only holds
+        # the records that match text
+        if (
+            index is None
+            or index["recordarray"].dtype != self.header_dtype
+            or index.get("text") != self.text
+        ):
+            return False
+        self.recordarray = index["recordarray"]
+        self.iposarray = index["iposarray"]
+        self.times = list(index["times"])
+        self.kstpkper = [tuple(kstpkper) for kstpkper in index["kstpkper"]]
+        self.nrow = index["nrow"][()]
+        self.ncol = index["ncol"][()]
+        self.file.seek(0, 2)
+        self.totalbytes = self.file.tell()
+        if len(self.recordarray) > 0:
+            self._endpos = int(
+                self.iposarray[-1] + self.get_databytes(self.recordarray[-1])
+            )
+        if self._mm is not None:
+            self._update_mmrecords()
+        self._set_headers()
+        return True
+
+    def _write_index_file(self):
+        """
+        Write the index to the index file.
+
+        """
+        write_index_file(
+            self.filename,
+            type(self).__name__,
+            text=np.bytes_(self.text),
+            recordarray=self.recordarray,
+            iposarray=self.iposarray,
+            times=np.array(self.times, dtype=self.header_dtype["totim"]),
+            kstpkper=np.array(self.kstpkper, dtype=np.int32).reshape(-1, 2),
+            nrow=self.nrow,
+            ncol=self.ncol,
+        )
+
+    def _update_mmrecords(self):
+        """
+        Map the records of the memory-mapped file if they all have the
+        same size.
+
+        """
+        self._mmrecords = None
+        nrecords = len(self.recordarray)
+        if nrecords == 0:
+            return
+        header = self.recordarray[0]
+        hdrbytes = self.header_dtype.itemsize
+        stride = hdrbytes + int(self.get_databytes(header))
+        if (
+            np.all(self.recordarray["ncol"] == header["ncol"])
+            and np.all(self.recordarray["nrow"] == header["nrow"])
+            and np.array_equal(
+                self.iposarray, np.arange(nrecords, dtype=np.int64) * stride + hdrbytes
+            )
+        ):
+            self._mmrecords = self._map_records(header, nrecords)
+
+    def rebuild_index(self):
+        """
+        Rebuild the record index by scanning the binary file. If cache_index
+        is set, the index file is also rewritten.
+
+        """
+        self.nlay = 0
+        self.times = []
+        self.kstpkper = []
+        self.recordarray = []
+        self.iposarray = []
+        self._mmrecords = None
+        self._mm = None
+        self.file.seek(0, 0)
+        self._build_index(use_index_file=False)
+
+    def _scan_index(self):
+        """
+        Build the recordarray and iposarray by reading the file header by
+        header.
+
+        """
+        self.recordarray = np.empty(0, dtype=self.header_dtype)
+        self.iposarray = np.empty(0, dtype=np.int64)
+        self._endpos = 0
+        self._scan_records(warn_incomplete=True)
+        self._set_headers()
+
+    def _set_grid_size(self, header):
+        """
+        Set nrow, ncol and nlay from the first header in the file.
+
         """
-        header = self._get_header()
         self.nrow = header["nrow"]
         self.ncol = header["ncol"]
         if header["ilay"] > self.nlay:
@@ -456,33 +702,187 @@ class BinaryLayerFile(LayerFile):
                 f"Very large grid, ncol ({self.ncol}) * nrow ({self.nrow})"
                 f" > {warn_threshold}"
             )
+
+    def _scan_records(self, warn_incomplete=False):
+        """
+        Append the records following the last indexed record to the
+        recordarray and iposarray. A record that has not been completely
+        written yet, e.g. by a running model, is not indexed.
+
+        Parameters
+        ----------
+        warn_incomplete : bool
+            Warn if the file ends with a record that has not been
+            completely written (default is False).
+
+        """
         self.file.seek(0, 2)
         self.totalbytes = self.file.tell()
-        self.file.seek(0, 0)
-        ipos = 0
-        while ipos < self.totalbytes:
+        hdrbytes = self.header_dtype.itemsize
+        ipos = self._endpos
+        headers = []
+        iposarray = []
+        while ipos + hdrbytes <= self.totalbytes:
+            self.file.seek(ipos, 0)
             header = self._get_header()
-            self.recordarray.append(header)
-            if self.text.upper() not in header["text"]:
-                continue
             if ipos == 0:
-                self.times.append(header["totim"])
-                self.kstpkper.append((header["kstp"], header["kper"]))
-            else:
+                self._set_grid_size(header)
+            ipos += hdrbytes
+            databytes = int(self.get_databytes(header))
+            if ipos + databytes > self.totalbytes:
+                break
+            if self.text.upper() in header["text"]:
+                headers.append(header)
+                iposarray.append(ipos)
                 totim = header["totim"]
-                if totim != self.times[-1]:
+                if len(self.times) == 0 or totim != self.times[-1]:
                     self.times.append(totim)
                     self.kstpkper.append((header["kstp"], header["kper"]))
-            ipos = self.file.tell()
-            self.iposarray.append(ipos)
-            databytes = self.get_databytes(header)
-            self.file.seek(databytes, 1)
-            ipos = self.file.tell()
+            ipos += databytes
+            self._endpos = ipos
+        if warn_incomplete and self._endpos < self.totalbytes:
+            warnings.warn(
+                f"{self.filename} ends with an incomplete record, which is "
+                "not read; use refresh() to read it once it has been written"
+            )
 
         # self.recordarray contains a recordarray of all the headers.
-        self.recordarray = np.array(self.recordarray, dtype=self.header_dtype)
-        self.iposarray = np.array(self.iposarray, dtype=np.int64)
-        self.nlay = np.max(self.recordarray["ilay"])
+        self.recordarray = np.concatenate(
+            [self.recordarray, np.array(headers, dtype=self.header_dtype)]
+        )
+        self.iposarray = np.concatenate(
+            [self.iposarray, np.array(iposarray, dtype=np.int64)]
+        )
+
+    def refresh(self):
+        """
+        Update the index with records written to the file since it was
+        opened or last refreshed, e.g. while the model is still running.
+        Only the new part of the file is read.
+
+        Returns
+        -------
+        times : list of floats
+            Simulation times added to the file. Records for the last time
+            may not all have been written yet.
+
+        """
+        ntimes = len(self.times)
+        nrecords = len(self.recordarray)
+        self._scan_records()
+        if len(self.recordarray) > nrecords:
+            if self._mm is not None:
+                self._mm = np.memmap(self.filename, dtype=np.uint8, mode="r")
+                self._update_mmrecords()
+            self._set_headers()
+            if self.cache_index:
+                self._write_index_file()
+        return self.times[ntimes:]
+
+    def follow(self, poll_interval=1.0, timeout=None):
+        """
+        Iterate over the simulation times in the file, waiting for new
+        times to be written to the file, e.g. by a running model.
+
+        A time is yielded once the file contains records for a later time,
+        since until then more records may be written for it. The last time
+        is yielded when no new records have been written for timeout seconds.
+
+        Parameters
+        ----------
+        poll_interval : float
+            Seconds to wait between checks for new records (default is 1).
+        timeout : float
+            Stop iterating if no new records are written for this many
+            seconds. If None (default), iterate indefinitely.
+
+        Yields
+        ------
+        totim : float
+            Simulation time with all records written to the file.
+
+        """
+        return follow_times(
+            self.get_times, self.refresh, poll_interval, timeout, lag=True
+        )
+
+    def _build_index_mmap(self):
+        """
+        Build the recordarray and iposarray from the memory-mapped file in
+        a single vectorized pass. This is only possible if all records
+        have the same size, so that the header offsets can be computed
+        from the record stride.
+
+        Returns
+        -------
+        success : bool
+            False if the records in the file do not have a fixed size, in
+            which case the index must be built by scanning the file.
+
+        """
+        hdrbytes = self.header_dtype.itemsize
+        self.totalbytes = self._mm.size
+        if self.totalbytes < hdrbytes:
+            return False
+        header = self._mm[:hdrbytes].view(self.header_dtype)[0]
+        shp = self._get_record_shape(header)
+        if min(shp) < 0:
+            raise Exception("negative nrow, ncol")
+        stride = hdrbytes + int(self.get_databytes(header))
+        # map the file as an array of (header, data) records
+        nrecords = self.totalbytes // stride
+        if nrecords == 0:
+            return False
+        records = self._map_records(header, nrecords)
+        recordarray = np.array(records["header"])
+        if (
+            np.any(recordarray["ncol"] != header["ncol"])
+            or np.any(recordarray["nrow"] != header["nrow"])
+            or not np.all(np.char.find(recordarray["text"], self.text.upper()) >= 0)
+        ):
+            return False
+
+        self.nrow = header["nrow"]
+        self.ncol = header["ncol"]
+        totim = recordarray["totim"]
+        istime = np.ones(nrecords, dtype=bool)
+        istime[1:] = totim[1:] != totim[:-1]
+        self.times = list(totim[istime])
+        self.kstpkper = list(
+            zip(recordarray["kstp"][istime], recordarray["kper"][istime])
+        )
+        self.recordarray = recordarray
+        self.iposarray = np.arange(nrecords, dtype=np.int64) * stride + hdrbytes
+        self._mmrecords = records
+        self._endpos = nrecords * stride
+        if self._endpos < self.totalbytes:
+            # index any remaining records of a different size
+            self._scan_records(warn_incomplete=True)
+            self._update_mmrecords()
+        self._set_headers()
+        return True
+
+    def _map_records(self, header, nrecords):
+        """
+        Map the memory-mapped file as an array of nrecords (header, data)
+        records, each the size of the record described by header.
+
+        """
+        record_dtype = np.dtype(
+            [
+                ("header", self.header_dtype),
+                ("data", self.realtype, self._get_record_shape(header)),
+            ]
+        )
+        return np.ndarray((nrecords,), dtype=record_dtype, buffer=self._mm, offset=0)
+
+    def _set_headers(self):
+        """
+        Set nlay and the pandas headers frame from the recordarray.
+
+        """
+        # no records may have been completely written yet
+        self.nlay = np.max(self.recordarray["ilay"], initial=self.nlay)
 
         # provide headers as a pandas frame
         self.headers = pd.DataFrame(self.recordarray, index=self.iposarray)
@@ -511,8 +911,117 @@ class BinaryLayerFile(LayerFile):
         )
 
     def _read_data(self, shp):
+        if self._mm is not None:
+            # return a read-only view into the mapped file
+            ipos = self.file.tell()
+            data = np.ndarray(shp, dtype=self.realtype, buffer=self._mm, offset=ipos)
+            self.file.seek(data.nbytes, 1)
+            return data
         return binaryread(self.file, self.realtype, shape=shp)
 
+    def _get_record_reader(self):
+        """
+        Get a function that returns a read-only view of the data of a
+        record given the record number. The data are read from a memory
+        map of the file, so the function can be called from several threads
+        at once.
+
+        """
+        mm = self._mm
+        if mm is None:
+            mm = np.memmap(self.filename, dtype=np.uint8, mode="r")
+
+        def read_record(irec):
+            return np.ndarray(
+                self._get_record_shape(self.recordarray[irec]),
+                dtype=self.realtype,
+                buffer=mm,
+                offset=self.iposarray[irec],
+            )
+
+        return read_record
+
+    def _get_record_view(self, keyindices):
+        """
+        Get a zero-copy (nlay, nrow, ncol) view of the records given by
+        keyindices, or None if the records are not consecutive layers
+        1 through nlay of a memory-mapped file with fixed-size records.
+
+        """
+        if self._mmrecords is None or len(keyindices) != self.nlay:
+            return None
+        i0 = keyindices[0]
+        if np.any(np.diff(keyindices) != 1) or np.any(
+            self.recordarray["ilay"][keyindices] != np.arange(1, self.nlay + 1)
+        ):
+            return None
+        return self._mmrecords["data"][i0 : i0 + self.nlay]
+
+    def _get_data_array(self, totim=0.0):
+        """
+        Get the three dimensional data array for the specified totim value.
+        For memory-mapped files, a read-only view is returned if possible.
+
+        """
+        if self._mmrecords is not None and totim >= 0.0:
+            keyindices = np.asarray(self.recordarray["totim"] == totim).nonzero()[0]
+            if len(keyindices) > 0:
+                data = self._get_record_view(keyindices)
+                if data is not None:
+                    return data
+        return super()._get_data_array(totim)
+
+    def get_alldata(self, mflay=None, nodata=-9999):
+        """
+        Get all of the data from the file.
+
+        Parameters
+        ----------
+        mflay : integer
+           MODFLOW zero-based layer number to return.  If None, then all
+           all layers will be included. (Default is None.)
+
+        nodata : float or None
+           The nodata value in the data array.  All array values that have the
+           nodata value will be assigned np.nan. If None, values are returned
+           unchanged, which for memory-mapped files allows a read-only view
+           to be returned without copying the data.
+
+        Returns
+        -------
+        data : numpy array
+            Array has size (ntimes, nlay, nrow, ncol) if mflay is None or it
+            has size (ntimes, nrow, ncol) if mlay is specified.
+
+        """
+        ntimes = len(self.times)
+        if (
+            nodata is None
+            and self._mmrecords is not None
+            and self._mmrecords["data"].shape[1:] == (self.nrow, self.ncol)
+            and len(self) == ntimes * self.nlay
+            and np.array_equal(
+                self.recordarray["ilay"],
+                np.tile(np.arange(1, self.nlay + 1), ntimes),
+            )
+        ):
+            data = self._mmrecords["data"].reshape(
+                (ntimes, self.nlay, self.nrow, self.ncol)
+            )
+            if mflay is not None:
+                data = data[:, mflay]
+            return data
+        return super().get_alldata(mflay=mflay, nodata=nodata)
+
+    def close(self):
+        """
+        Close the file handle and release the memory map, if any.
+
+        """
+        self._mmrecords = None
+        self._mm = None
+        super().close()
+
     def _get_header(self):
         """
         Read the file header
@@ -557,23 +1066,36 @@ class BinaryLayerFile(LayerFile):
         # Initialize result array and put times in first column
         result = self._init_result(nstation)
 
-        istat = 1
-        for k, i, j in kijlist:
-            ioffset = (i * self.ncol + j) * self.realtype(1).nbytes
-            for irec, header in enumerate(self.recordarray):
-                ilay = header["ilay"] - 1  # change ilay from header to zero-based
-                if ilay != k:
-                    continue
-                ipos = self.iposarray[irec].item()
-
-                # Calculate offset necessary to reach intended cell
-                self.file.seek(ipos + int(ioffset), 0)
-
-                # Find the time index and then put value into result in the
-                # correct location.
-                itim = np.asarray(result[:, 0] == header["totim"]).nonzero()[0]
-                result[itim, istat] = binaryread(self.file, self.realtype)
-            istat += 1
+        kij = np.array(kijlist, dtype=np.int64).reshape(-1, 3)
+        cells = kij[:, 1] * self.ncol + kij[:, 2]
+        ilay = self.recordarray["ilay"].astype(np.int64) - 1
+        itim = self._get_time_indices(self.recordarray["totim"])
+
+        # map the file once and gather all values for a layer at a time,
+        # rather than seeking to every station in every record
+        mm = self._mm
+        if mm is None:
+            mm = np.memmap(self.filename, dtype=np.uint8, mode="r")
+        for k in np.unique(kij[:, 0]):
+            istat = np.asarray(kij[:, 0] == k).nonzero()[0]
+            irec = np.asarray((ilay == k) & (itim >= 0)).nonzero()[0]
+            if len(irec) == 0:
+                continue
+            if self._mmrecords is not None:
+                values = self._mmrecords["data"][
+                    irec[:, np.newaxis], kij[istat, 1], kij[istat, 2]
+                ]
+            else:
+                values = np.empty((len(irec), len(istat)), dtype=self.realtype)
+                for n, ipos in enumerate(self.iposarray[irec]):
+                    layer = np.ndarray(
+                        (self.nrow * self.ncol,),
+                        dtype=self.realtype,
+                        buffer=mm,
+                        offset=ipos,
+                    )
+                    values[n] = layer[cells[istat]]
+            result[itim[irec][:, np.newaxis], istat + 1] = values
         return result
 
 
@@ -598,6 +1120,12 @@ class HeadFile(BinaryLayerFile):
         which enables automatic detection of precision.
     verbose : bool
         Toggle logging output. Default is False.
+    mmap : bool
+        Memory-map the file and return data arrays as read-only views into
+        the mapped file instead of copies. Default is False.
+    cache_index : bool
+        Save the record index to an index file next to the binary file,
+        and load the index from it when it is up to date. Default is False.
 
     Examples
     --------
@@ -717,8 +1245,15 @@ class HeadFile(BinaryLayerFile):
 
         # if we rewrote the original file, reinitialize
         if inplace:
+            self.close()
             move(target, filename)
-            super().__init__(filename, self.precision, self.verbose)
+            super().__init__(
+                filename,
+                self.precision,
+                self.verbose,
+                mmap=self.mmap,
+                cache_index=self.cache_index,
+            )
 
 
 class UcnFile(BinaryLayerFile):
@@ -735,6 +1270,12 @@ class UcnFile(BinaryLayerFile):
         'auto', 'single' or 'double'.  Default is 'auto'.
     verbose : bool
         Write information to the screen.  Default is False.
+    mmap : bool
+        Memory-map the file and return data arrays as read-only views into
+        the mapped file instead of copies. Default is False.
+    cache_index : bool
+        Save the record index to an index file next to the binary file,
+        and load the index from it when it is up to date. Default is False.
 
     Attributes
     ----------
@@ -805,6 +1346,12 @@ class HeadUFile(BinaryLayerFile):
         enables precision to be automatically detected.
     verbose : bool
         Toggle logging output. Default is False.
+    mmap : bool
+        Memory-map the file and return data arrays as read-only views into
+        the mapped file instead of copies. Default is False.
+    cache_index : bool
+        Save the record index to an index file next to the binary file,
+        and load the index from it when it is up to date. Default is False.
 
     Notes
     -----
@@ -879,7 +1426,7 @@ class HeadUFile(BinaryLayerFile):
             if self.verbose:
                 print(f"Byte position in file: {ipos} for layer {ilay}")
             self.file.seek(ipos, 0)
-            data[ilay - 1] = binaryread(self.file, self.realtype, shape=(npl,))
+            data[ilay - 1] = self._read_data((npl,))
         return data
 
     def get_databytes(self, header):
@@ -903,6 +1450,45 @@ class HeadUFile(BinaryLayerFile):
         npl = nend - nstrt + 1
         return npl * np.int64(self.realtype(1).nbytes)
 
+    def _get_record_shape(self, header):
+        """
+        Shape of the data array following a header.
+
+        """
+        return (int(header["nrow"]) - int(header["ncol"]) + 1,)
+
+    def _get_layer_sizes(self):
+        """
+        Get the number of nodes in each layer.
+
+        """
+        sizes = np.zeros(self.nlay, dtype=np.int64)
+        ilay = self.recordarray["ilay"].astype(np.int64) - 1
+        sizes[ilay] = (
+            self.recordarray["nrow"].astype(np.int64)
+            - self.recordarray["ncol"].astype(np.int64)
+            + 1
+        )
+        return sizes
+
+    def _get_frame_shape(self, layers):
+        """
+        Shape of the data for a single time and the zero-based layers,
+        which are stored one after another in a one-dimensional array.
+
+        """
+        return (int(self._get_layer_sizes()[layers].sum()),)
+
+    def _get_layer_index(self, layers):
+        """
+        Get the slice of each of the zero-based layers in a data array
+        with shape _get_frame_shape(layers).
+
+        """
+        sizes = self._get_layer_sizes()[layers]
+        stops = np.cumsum(sizes)
+        return [slice(int(stop - n), int(stop)) for n, stop in zip(sizes, stops)]
+
     def get_ts(self, idx):
         """
         Get a time series from the binary HeadUFile
@@ -969,6 +1555,11 @@ class CellBudgetFile:
         values are 'single' or 'double'. Default is 'single'.
     verbose : bool
         Toggle logging output. Default is False.
+    cache_index : bool
+        Save the record index to an index file next to the budget file (the
+        file name with ".idx" appended), and load the index from it when it
+        is up to date. The index file is out of date if the size or
+        modification time of the budget file changes. Default is False.
 
     Examples
     --------
@@ -985,11 +1576,13 @@ class CellBudgetFile:
         filename: Union[str, os.PathLike],
         precision="auto",
         verbose=False,
+        cache_index=False,
         **kwargs,
     ):
         self.filename = Path(filename).expanduser().absolute()
         self.precision = precision
         self.verbose = verbose
+        self.cache_index = cache_index
         self.file = open(self.filename, "rb")
         # Get filesize to ensure this is not an empty file
         self.file.seek(0, 2)
@@ -1029,6 +1622,12 @@ class CellBudgetFile:
             args = ",".join(kwargs.keys())
             raise Exception(f"LayerFile error: unrecognized kwargs: {args}")
 
+        if precision == "auto" and cache_index:
+            # use the precision of an up-to-date index file
+            index = read_index_file(self.filename, type(self).__name__)
+            if index is not None:
+                precision = str(index["precision"])
+
         if precision == "auto":
             success = self._set_precision("single")
             if not success:
@@ -1062,6 +1661,22 @@ class CellBudgetFile:
     def __exit__(self, *exc):
         self.close()
 
+    def __getstate__(self):
+        """
+        Pickle the record index without the open file, so the file can be
+        read from other processes without indexing it again.
+        """
+        state = self.__dict__.copy()
+        state["file"] = None
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restore a pickled CellBudgetFile with its own handle to the file.
+        """
+        self.__dict__.update(state)
+        self.file = open(self.filename, "rb")
+
     def __len__(self):
         """
         Return the number of records (headers) in the file.
@@ -1172,10 +1787,102 @@ class CellBudgetFile:
         kstp_len = sum(kstp_len[: kstp + 1])
         return kper_len + kstp_len
 
-    def _build_index(self):
+    def _build_index(self, use_index_file=True):
         """
         Build the ordered dictionary, which maps the header information
         to the position in the binary file.
+
+        Parameters
+        ----------
+        use_index_file : bool
+            Load the index from the index file if cache_index is set and
+            the index file is up to date (default is True).
+
+        """
+        if self.cache_index and use_index_file and self._load_index_file():
+            return
+        self._scan_index()
+        if self.cache_index:
+            self._write_index_file()
+
+    def _write_index_file(self):
+        """
+        Write the index to the index file.
+
+        """
+        write_index_file(
+            self.filename,
+            type(self).__name__,
+            precision="single" if self.realtype == np.float32 else "double",
+            recordarray=self.recordarray,
+            iposheader=self.iposheader,
+            iposarray=self.iposarray,
+            times=np.array(self.times, dtype=self.header_dtype["totim"]),
+            kstpkper=np.array(self.kstpkper, dtype=np.int32).reshape(-1, 2),
+            textlist=np.array(self.textlist, dtype="S16"),
+            imethlist=np.array(self.imethlist, dtype=np.int32),
+            paknamlist_from=np.array(self.paknamlist_from, dtype="S16"),
+            paknamlist_to=np.array(self.paknamlist_to, dtype="S16"),
+            nrow=self.nrow,
+            ncol=self.ncol,
+            nlay=self.nlay,
+            compact=self.compact,
+        )
+
+    def _load_index_file(self):
+        """
+        Load the index from the index file.
+
+        Returns
+        -------
+        success : bool
+            False if there is no up-to-date index file.
+
+        """
+        index = read_index_file(self.filename, type(self).__name__)
+        if index is None or index["recordarray"].dtype != self.header_dtype:
+            return False
+        self.recordarray = index["recordarray"]
+        self.iposheader = index["iposheader"]
+        self.iposarray = index["iposarray"]
+        self.times = list(index["times"])
+        self.kstpkper = [tuple(kstpkper) for kstpkper in index["kstpkper"]]
+        self.textlist = list(index["textlist"])
+        self.imethlist = list(index["imethlist"])
+        self.paknamlist_from = list(index["paknamlist_from"])
+        self.paknamlist_to = list(index["paknamlist_to"])
+        self.nrow = index["nrow"][()]
+        self.ncol = index["ncol"][()]
+        self.nlay = index["nlay"][()]
+        self.compact = bool(index["compact"])
+        self.file.seek(0, 2)
+        self.totalbytes = self.file.tell()
+        self.recorddict = {
+            tuple(header): ipos
+            for header, ipos in zip(self.recordarray, self.iposarray)
+        }
+        # find the end of the last record
+        self._endpos = 0
+        if len(self.recordarray) > 0:
+            self.file.seek(self.iposheader[-1], 0)
+            self._skip_record(self._get_header())
+            self._endpos = self.file.tell()
+        self._set_headers()
+        return True
+
+    def rebuild_index(self):
+        """
+        Rebuild the record index by scanning the budget file. If cache_index
+        is set, the index file is also rewritten.
+
+        """
+        self.__reset()
+        self._build_index(use_index_file=False)
+
+    def _scan_index(self):
+        """
+        Build the index by reading the file record by record.
+
         """
         # read first record
         header = self._get_header()
@@ -1192,11 +1899,56 @@ class CellBudgetFile:
         self.totalbytes = self.file.tell()
         self.file.seek(0, 0)
         self.recorddict = {}
-        # read the remaining records
-        ipos = 0
+        self.recordarray = np.empty(0, dtype=self.header_dtype)
+        self.iposheader = np.empty(0, dtype=np.int64)
+        self.iposarray = np.empty(0, dtype=np.int64)
+        self._endpos = 0
+        self._scan_records()
+        if self._endpos < self.totalbytes:
+            warnings.warn(
+                f"{self.filename} ends with an incomplete record, which is "
+                "not read; use refresh() to read it once it has been written"
+            )
+        self._set_headers()
+
+    def _scan_records(self):
+        """
+        Append the records following the last indexed record to the index.
+        A record that has not been completely written yet, e.g. by a running
+        model, is not indexed.
+
+        """
+        self.file.seek(0, 2)
+        self.totalbytes = self.file.tell()
+        headers = []
+        iposheader = []
+        iposarray = []
+        ipos = self._endpos
         while ipos < self.totalbytes:
-            self.iposheader.append(ipos)
-            header = self._get_header()
+            # make sure the whole record has been written
+            self.file.seek(ipos, 0)
+            try:
+                header = self._get_header()
+                if header["text"] not in self.textlist:
+                    # check the precision of the file using text records
+                    tlist = [header["text"], header["modelnam"]]
+                    for text in tlist:
+                        if len(text) == 0:
+                            continue
+                        charbytes = list(text)
+                        if min(charbytes) < 32 or max(charbytes) > 126:
+                            # not in conventional ASCII range
+                            raise BudgetIndexError("Improper precision")
+                iposdata = self.file.tell()
+                self._skip_record(header)
+                iposnext = self.file.tell()
+            except EOFError:
+                iposnext = self.totalbytes + 1
+            if iposnext > self.totalbytes:
+                if len(self.recordarray) + len(headers) == 0:
+                    raise EOFError
+                break
+            iposheader.append(ipos)
             totim = header["totim"]
             # if old-style (non-compact) file,
             # compute totim from kstp and kper
@@ -1211,22 +1963,13 @@ class CellBudgetFile:
             if kstpkper not in self.kstpkper:
                 self.kstpkper.append(kstpkper)
             if header["text"] not in self.textlist:
-                # check the precision of the file using text records
-                tlist = [header["text"], header["modelnam"]]
-                for text in tlist:
-                    if len(text) == 0:
-                        continue
-                    charbytes = list(text)
-                    if min(charbytes) < 32 or max(charbytes) > 126:
-                        # not in conventional ASCII range
-                        raise BudgetIndexError("Improper precision")
                 self.textlist.append(header["text"])
                 self.imethlist.append(header["imeth"])
             if header["paknam"] not in self.paknamlist_from:
                 self.paknamlist_from.append(header["paknam"])
             if header["paknam2"] not in self.paknamlist_to:
                 self.paknamlist_to.append(header["paknam2"])
-            ipos = self.file.tell()
+            ipos = iposdata
 
             if self.verbose:
                 for itxt in [
@@ -1263,17 +2006,78 @@ class CellBudgetFile:
             self.recorddict[tuple(header)] = (
                 ipos  # store the position right after header2
             )
-            self.recordarray.append(header)
-            self.iposarray.append(ipos)  # store the position right after header2
+            headers.append(header)
+            iposarray.append(ipos)  # store the position right after header2
 
-            # skip over the data to the next record and set ipos
-            self._skip_record(header)
-            ipos = self.file.tell()
+            # move to the next record
+            ipos = iposnext
+            self._endpos = ipos
 
         # convert to numpy arrays
-        self.recordarray = np.array(self.recordarray, dtype=self.header_dtype)
-        self.iposheader = np.array(self.iposheader, dtype=np.int64)
-        self.iposarray = np.array(self.iposarray, dtype=np.int64)
+        self.recordarray = np.concatenate(
+            [self.recordarray, np.array(headers, dtype=self.header_dtype)]
+        )
+        self.iposheader = np.concatenate(
+            [self.iposheader, np.array(iposheader, dtype=np.int64)]
+        )
+        self.iposarray = np.concatenate(
+            [self.iposarray, np.array(iposarray, dtype=np.int64)]
+        )
+
+    def refresh(self):
+        """
+        Update the index with records written to the file since it was
+        opened or last refreshed, e.g. while the model is still running.
+        Only the new part of the file is read.
+
+        Returns
+        -------
+        times : list of floats
+            Simulation times added to the file. Records for the last time
+            may not all have been written yet.
+
+        """
+        ntimes = len(self.times)
+        nrecords = len(self.recordarray)
+        self._scan_records()
+        if len(self.recordarray) > nrecords:
+            self._set_headers()
+            if self.cache_index:
+                self._write_index_file()
+        return self.times[ntimes:]
+
+    def follow(self, poll_interval=1.0, timeout=None):
+        """
+        Iterate over the simulation times in the file, waiting for new
+        times to be written to the file, e.g. by a running model.
+
+        A time is yielded once the file contains records for a later time,
+        since until then more records may be written for it. The last time
+        is yielded when no new records have been written for timeout seconds.
+
+        Parameters
+        ----------
+        poll_interval : float
+            Seconds to wait between checks for new records (default is 1).
+        timeout : float
+            Stop iterating if no new records are written for this many
+            seconds. If None (default), iterate indefinitely.
+
+        Yields
+        ------
+        totim : float
+            Simulation time with all records written to the file.
+
+        """
+        return follow_times(
+            self.get_times, self.refresh, poll_interval, timeout, lag=True
+        )
+
+    def _set_headers(self):
+        """
+        Set nper and the pandas headers frame from the recordarray.
+
+        """
         self.nper = self.recordarray["kper"].max()
 
         # provide headers as a pandas frame
@@ -1736,17 +2540,20 @@ class CellBudgetFile:
             idx can be (layer, row, column) or it can be a list in the form
             [(layer, row, column), (layer, row, column), ...].  The layer,
             row, and column values must be zero based.
-        text : str
+        text : str or list of str
             The text identifier for the record.  Examples include
-            'RIVER LEAKAGE', 'STORAGE', 'FLOW RIGHT FACE', etc.
+            'RIVER LEAKAGE', 'STORAGE', 'FLOW RIGHT FACE', etc.  A list of
+            text identifiers can be provided to extract time series for
+            several budget terms in one call.
         times : iterable of floats
             List of times to from which to get time series.
 
         Returns
         -------
-        out : numpy array
+        out : numpy array or dict
             Array has size (ntimes, ncells + 1).  The first column in the
-            data array will contain time (totim).
+            data array will contain time (totim).  If text is a list, a
+            dictionary of these arrays keyed by text is returned.
 
         See Also
         --------
@@ -1757,6 +2564,12 @@ class CellBudgetFile:
         The layer, row, and column values must be zero-based, and must be
         within the following ranges: 0 <= k < nlay; 0 <= i < nrow; 0 <= j < ncol
 
+        Only the values for the requested cells are read from the file;
+        full grid arrays are never created.  Cells that are not included in
+        a list-style record are returned as NaN.  If several records with
+        the same text are written for a time step (for example, several
+        packages of the same type), their values are summed.
+
         Examples
         --------
 
@@ -1769,6 +2582,7 @@ class CellBudgetFile:
 
         kijlist = self._build_kijlist(idx)
         nstation = self._get_nstation(idx, kijlist)
+        kij = np.array(kijlist, dtype=np.int64).reshape(-1, 3)
 
         # Initialize result array and put times in first column
         result = self._init_result(nstation)
@@ -1791,47 +2605,100 @@ class CellBudgetFile:
         for idx, t in enumerate(timesint):
             result[idx, 0] = t
 
-        for itim, k in enumerate(kstpkper):
-            try:
-                v = self.get_data(kstpkper=k, text=text, full3D=True)
-                # skip missing data - required for storage
-                if len(v) > 0:
-                    v = v[0]
-                    istat = 1
-                    for k, i, j in kijlist:
-                        result[itim, istat] = v[k, i, j].copy()
-                        istat += 1
-            except ValueError:
-                v = self.get_data(kstpkper=k, text=text)
-                # skip missing data - required for storage
-                if len(v) > 0:
-                    if self.modelgrid is None:
-                        s = (
-                            "A modelgrid instance must be provided during "
-                            "instantiation to get IMETH=6 timeseries data"
-                        )
-                        raise AssertionError(s)
-
-                    if self.modelgrid.grid_type == "structured":
-                        ndx = [
-                            lrc[0] * (self.modelgrid.nrow * self.modelgrid.ncol)
-                            + lrc[1] * self.modelgrid.ncol
-                            + (lrc[2] + 1)
-                            for lrc in kijlist
-                        ]
-                    else:
-                        ndx = [
-                            lrc[0] * self.modelgrid.ncpl + (lrc[-1] + 1)
-                            for lrc in kijlist
-                        ]
-
-                    for vv in v:
-                        field = vv.dtype.names[2]
-                        dix = np.asarray(np.isin(vv["node"], ndx)).nonzero()[0]
-                        if len(dix) > 0:
-                            result[itim, 1:] = vv[field][dix]
+        # lookup from (zero-based) node number to station, shared by
+        # all list-style records
+        nodes = (kij[:, 0] * self.nrow + kij[:, 1]) * self.ncol + kij[:, 2]
+        unique_nodes, station = np.unique(nodes, return_inverse=True)
+
+        itims = {k: itim for itim, k in enumerate(self.kstpkper)}
+        mm = np.memmap(self.filename, dtype=np.uint8, mode="r")
+
+        texts = [text] if isinstance(text, (str, bytes)) else list(text)
+        results = {}
+        for txt in texts:
+            ts = result.copy()
+            for irec in self.get_indices(txt):
+                header = self.recordarray[irec]
+                itim = itims[(header["kstp"], header["kper"])]
+                values = self._get_ts_values(irec, kij, unique_nodes, station, mm)
+                current = ts[itim, 1:]
+                ts[itim, 1:] = np.where(
+                    np.isnan(current),
+                    values,
+                    np.where(np.isnan(values), current, current + values),
+                )
+            results[txt] = ts
+        del mm
 
-        return result
+        if isinstance(text, (str, bytes)):
+            return results[text]
+        return results
+
+    def _get_ts_values(self, irec, kij, unique_nodes, station, mm):
+        """
+        Get the values of a single budget record for a set of cells.
+
+        Parameters
+        ----------
+        irec : int
+            The zero-based record number.
+        kij : numpy array
+            Zero-based (layer, row, column) cell indices, shape (ncells, 3).
+        unique_nodes : numpy array
+            Sorted unique zero-based node numbers of the cells.
+        station : numpy array
+            Index into unique_nodes for each cell.
+        mm : numpy memmap
+            Memory map of the budget file.
+
+        Returns
+        -------
+        values : numpy array
+            Record values for each cell, NaN where the record has no value.
+
+        """
+        header = self.recordarray[irec]
+        imeth = header["imeth"]
+        nlay = abs(header["nlay"])
+        nrow = header["nrow"]
+        ncol = header["ncol"]
+        values = np.full(len(kij), np.nan, dtype=self.realtype)
+
+        if imeth in (0, 1):
+            # full arrays have a fixed layout, so only the requested
+            # values are read from their offsets in the record
+            data = np.ndarray(
+                shape=(nlay * nrow * ncol,),
+                dtype=self.realtype,
+                buffer=mm,
+                offset=self.iposarray[irec],
+            )
+            inode = (kij[:, 0] * nrow + kij[:, 1]) * ncol + kij[:, 2]
+            inside = (kij[:, 0] < nlay) & (kij[:, 1] < nrow) & (kij[:, 2] < ncol)
+            values[inside] = data[inode[inside]]
+        elif imeth == 3:
+            ilayer, data = self.get_record(irec)
+            inside = ilayer[kij[:, 1], kij[:, 2]] - 1 == kij[:, 0]
+            values[inside] = data[kij[inside, 1], kij[inside, 2]]
+        elif imeth == 4:
+            data = self.get_record(irec)
+            inside = kij[:, 0] == 0
+            values[inside] = data[kij[inside, 1], kij[inside, 2]]
+        elif imeth in (2, 5, 6):
+            data = self.get_record(irec)
+            node = data["node"].astype(np.int64) - 1
+            pos = np.searchsorted(unique_nodes, node)
+            pos[pos == len(unique_nodes)] = 0
+            match = unique_nodes[pos] == node
+            q = np.bincount(
+                pos[match], weights=data["q"][match], minlength=len(unique_nodes)
+            )
+            found = np.zeros(len(unique_nodes), dtype=bool)
+            found[pos[match]] = True
+            values[:] = np.where(found[station], q[station], np.nan)
+        else:
+            raise ValueError(f"invalid imeth value - {imeth}")
+        return values
 
     def _build_kijlist(self, idx):
         if isinstance(idx, list):
@@ -2343,4 +3210,6 @@ class CellBudgetFile:
         # if we rewrote the original file, reinitialize
         if inplace:
             move(target, filename)
-            self.__init__(filename, self.precision, self.verbose)
+            self.__init__(
+                filename, self.precision, self.verbose, cache_index=self.cache_index
+            )
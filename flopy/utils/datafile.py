@@ -14,6 +14,7 @@ abstract classes that should not be directly accessed.
 # pylint: disable=invalid-sequence-index
 
 import os
+import threading
 import warnings
 from pathlib import Path
 from typing import Union
@@ -173,6 +174,7 @@ class LayerFile:
         self.precision = precision
         self.verbose = verbose
         self.file = open(self.filename, "rb")
+        self._lock = threading.Lock()
         # Get filesize to ensure this is not an empty file
         self.file.seek(0, 2)
         totalbytes = self.file.tell()
@@ -489,6 +491,87 @@ class LayerFile:
             data[ilay - 1] = self._read_data(shp)
         return data
 
+    def _get_record_shape(self, header):
+        """
+        Shape of the data array following a header.
+
+        """
+        return (int(header["nrow"]), int(header["ncol"]))
+
+    def _get_time_indices(self, totim):
+        """
+        Get the index in times of each value in totim, or -1 if the
+        value is not one of the times in the file.
+
+        """
+        times = np.array(self.times, dtype=self.realtype)
+        sorter = np.argsort(times, kind="stable")
+        pos = np.searchsorted(times, totim, sorter=sorter)
+        pos = sorter[np.clip(pos, 0, len(times) - 1)]
+        return np.where(times[pos] == totim, pos, -1)
+
+    def _get_record_table(self):
+        """
+        Get an integer array of size (ntimes, nlay) with the record number
+        of the data for each time and layer, or -1 if it was not saved.
+
+        """
+        table = np.full((len(self.times), self.nlay), -1, dtype=np.int64)
+        itim = self._get_time_indices(self.recordarray["totim"])
+        ilay = self.recordarray["ilay"].astype(np.int64) - 1
+        valid = (itim >= 0) & (ilay >= 0)
+        table[itim[valid], ilay[valid]] = np.arange(len(self))[valid]
+        return table
+
+    def _get_frame_shape(self, layers):
+        """
+        Shape of the data for a single time and the zero-based layers.
+
+        """
+        return (len(layers), self.nrow, self.ncol)
+
+    def _get_layer_index(self, layers):
+        """
+        Get the index of each of the zero-based layers in a data array
+        with shape _get_frame_shape(layers).
+
+        """
+        return list(range(len(layers)))
+
+    def _get_record_reader(self):
+        """
+        Get a function that reads the data of a record given the record
+        number. The function can be called from several threads at once.
+
+        """
+
+        def read_record(irec):
+            with self._lock:
+                self.file.seek(self.iposarray[irec], 0)
+                return self._read_data(self._get_record_shape(self.recordarray[irec]))
+
+        return read_record
+
+    def _read_frames(self, records, layers):
+        """
+        Read the data for the zero-based layers of several times into a
+        new array. records is the part of _get_record_table() for the
+        times to read. Layers that were not saved are filled with nan.
+
+        """
+        data = np.full(
+            (len(records),) + self._get_frame_shape(layers),
+            np.nan,
+            dtype=self.realtype,
+        )
+        read_record = self._get_record_reader()
+        lindex = self._get_layer_index(layers)
+        for n, irecs in enumerate(records):
+            for index, irec in zip(lindex, irecs[layers]):
+                if irec >= 0:
+                    data[n][index] = read_record(irec)
+        return data
+
     def get_times(self):
         """
         Get a list of unique times in the file
@@ -603,6 +686,58 @@ class LayerFile:
         rv[rv == nodata] = np.nan
         return rv
 
+    def get_lazydata(
+        self, mflay=None, nodata=-9999, time_chunk=1, layer_chunk=None, workers=None
+    ):
+        """
+        Get a lazy, chunked view of all of the data in the file.
+
+        Data are only read from the file when the view is sliced, iterated
+        or reduced, a chunk at a time, so files that are larger than the
+        available memory can be processed.
+
+        Parameters
+        ----------
+        mflay : integer
+           MODFLOW zero-based layer number to return.  If None, then all
+           all layers will be included. (Default is None.)
+        nodata : float or None
+           The nodata value in the data array.  All array values that have the
+           nodata value will be assigned np.nan. (Default is -9999.)
+        time_chunk : int
+            Number of times in each chunk. (Default is 1.)
+        layer_chunk : int or None
+            Number of layers in each chunk. If None, all layers are included
+            in each chunk. (Default is None.)
+        workers : int or None
+            Number of threads used to read and reduce independent chunks. If
+            None, chunks are processed serially. (Default is None.)
+
+        Returns
+        -------
+        data : LazyLayerArray
+            Lazy array with the same shape as the array returned by
+            get_alldata().
+
+        Examples
+        --------
+
+        >>> hds = flopy.utils.HeadFile("model.hds")
+        >>> heads = hds.get_lazydata(time_chunk=10, workers=4)
+        >>> hmax = heads.max(axis=0)
+        >>> for key, chunk in heads.iter_chunks():
+        ...     pass
+
+        """
+        return LazyLayerArray(
+            self,
+            mflay=mflay,
+            nodata=nodata,
+            time_chunk=time_chunk,
+            layer_chunk=layer_chunk,
+            workers=workers,
+        )
+
     def _read_data(self, shp):
         """
         Read data from file
@@ -658,3 +793,307 @@ class LayerFile:
 
         """
         self.file.close()
+
+
+class LazyLayerArray:
+    """
+    Lazy, chunked array view of all of the data in a layered output file.
+    Use LayerFile.get_lazydata() to create instances.
+
+    The view has shape (ntimes, nlay, nrow, ncol), or (ntimes, nrow, ncol)
+    for a single layer, like get_alldata(). For unstructured head files the
+    shape is (ntimes, nnodes), with the layers in order along the last
+    axis. Data are read from the file in chunks of time_chunk times and
+    layer_chunk layers when the array is indexed, iterated or reduced.
+
+    Parameters
+    ----------
+    layerfile : LayerFile
+        Layered output file to read the data from.
+    mflay : integer
+       MODFLOW zero-based layer number to return.  If None, then all
+       all layers will be included. (Default is None.)
+    nodata : float or None
+       The nodata value in the data array.  All array values that have the
+       nodata value will be assigned np.nan. (Default is -9999.)
+    time_chunk : int
+        Number of times in each chunk. (Default is 1.)
+    layer_chunk : int or None
+        Number of layers in each chunk. If None, all layers are included in
+        each chunk. (Default is None.)
+    workers : int or None
+        Number of threads used to read and reduce independent chunks. If
+        None, chunks are processed serially. (Default is None.)
+
+    """
+
+    def __init__(
+        self,
+        layerfile,
+        mflay=None,
+        nodata=-9999,
+        time_chunk=1,
+        layer_chunk=None,
+        workers=None,
+    ):
+        if time_chunk < 1:
+            raise ValueError("time_chunk must be at least 1")
+        if layer_chunk is not None and layer_chunk < 1:
+            raise ValueError("layer_chunk must be at least 1 or None")
+        self.layerfile = layerfile
+        self.mflay = mflay
+        self.nodata = nodata
+        self.time_chunk = time_chunk
+        self.workers = workers
+        self._records = layerfile._get_record_table()
+
+        if mflay is None:
+            self._layers = np.arange(layerfile.nlay)
+        else:
+            self._layers = np.arange(layerfile.nlay)[[mflay]]
+        frame_shape = layerfile._get_frame_shape(self._layers)
+        self._layered = len(frame_shape) == 3
+        if self._layered and mflay is not None:
+            frame_shape = frame_shape[1:]
+        self.shape = (len(layerfile.times),) + tuple(int(n) for n in frame_shape)
+        self.dtype = np.dtype(layerfile.realtype)
+
+        # split the layers into chunks and find the range of each chunk
+        # along the second axis
+        if layer_chunk is None or mflay is not None:
+            layer_chunk = len(self._layers)
+        self._layer_chunks = []
+        start = 0
+        for i in range(0, len(self._layers), layer_chunk):
+            layers = self._layers[i : i + layer_chunk]
+            stop = start + layerfile._get_frame_shape(layers)[0]
+            self._layer_chunks.append((layers, slice(start, stop)))
+            start = stop
+
+    def __repr__(self):
+        return (
+            f"{type(self).__name__}(shape={self.shape}, dtype={self.dtype}, "
+            f"file={self.layerfile.filename.name!r})"
+        )
+
+    def __len__(self):
+        return self.shape[0]
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    @property
+    def size(self):
+        return int(np.prod(self.shape))
+
+    @property
+    def chunks(self):
+        """
+        List of the keys of the chunks, in the order they are read. Each
+        key is a tuple of slices that can be used to index the array.
+
+        """
+        keys = []
+        for t0 in range(0, self.shape[0], self.time_chunk):
+            tslice = slice(t0, min(t0 + self.time_chunk, self.shape[0]))
+            if len(self._layer_chunks) == 1:
+                keys.append((tslice,))
+            else:
+                keys.extend((tslice, lslice) for _, lslice in self._layer_chunks)
+        return keys
+
+    def _read(self, itimes, layers):
+        """
+        Read the data for the time indices and zero-based layers.
+
+        """
+        data = self.layerfile._read_frames(self._records[itimes], layers)
+        if self._layered and self.mflay is not None:
+            data = data[:, 0]
+        if self.nodata is not None:
+            data[data == self.nodata] = np.nan
+        return data
+
+    def _read_chunk(self, key):
+        """
+        Read the data for a chunk key.
+
+        """
+        itimes = np.arange(self.shape[0])[key[0]]
+        if len(key) == 1:
+            return self._read(itimes, self._layers)
+        for layers, lslice in self._layer_chunks:
+            if lslice == key[1]:
+                return self._read(itimes, layers)
+        raise ValueError(f"invalid chunk key: {key}")
+
+    def _map(self, func, keys):
+        """
+        Apply func to the chunks with the keys, in a thread pool if
+        workers was set, and return the results in order.
+
+        """
+        if self.workers is None or self.workers <= 1 or len(keys) < 2:
+            return [func(key) for key in keys]
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            return list(pool.map(func, keys))
+
+    def __getitem__(self, key):
+        if not isinstance(key, tuple):
+            key = (key,)
+        if any(k is Ellipsis for k in key):
+            i = [k is Ellipsis for k in key].index(True)
+            key = key[:i] + (slice(None),) * (self.ndim - len(key) + 1) + key[i + 1 :]
+        if len(key) == 0:
+            key = (slice(None),)
+        itimes = np.arange(self.shape[0])[key[0]]
+        scalar = np.ndim(itimes) == 0
+        rest = key[1:]
+
+        # only read the selected layers
+        layers = self._layers
+        if (
+            self._layered
+            and self.mflay is None
+            and len(rest) > 0
+            and isinstance(rest[0], (int, np.integer, slice))
+        ):
+            layers = np.atleast_1d(self._layers[rest[0]])
+            if isinstance(rest[0], slice):
+                rest = (slice(None),) + rest[1:]
+            else:
+                rest = (0,) + rest[1:]
+
+        utimes, inverse = np.unique(np.atleast_1d(itimes), return_inverse=True)
+        chunks = [
+            utimes[i : i + self.time_chunk]
+            for i in range(0, len(utimes), self.time_chunk)
+        ]
+        data = self._map(lambda chunk: self._read(chunk, layers), chunks)
+        if len(data) > 0:
+            data = np.concatenate(data)[inverse]
+        else:
+            data = np.empty((0,) + self.shape[1:], dtype=self.dtype)
+        if scalar:
+            return data[0][rest]
+        return data[(slice(None),) + rest]
+
+    def __array__(self, dtype=None, copy=None):
+        data = self[:]
+        if dtype is not None:
+            data = data.astype(dtype)
+        return data
+
+    def __iter__(self):
+        """
+        Iterate over the data of each time, reading a time chunk at a time.
+
+        """
+        for t0 in range(0, self.shape[0], self.time_chunk):
+            yield from self[t0 : t0 + self.time_chunk]
+
+    def iter_chunks(self):
+        """
+        Iterate over the chunks of the array, reading one chunk at a time.
+
+        Returns
+        -------
+        generator of (key, data) tuples, where key is a tuple of slices and
+        data is the array self[key]
+
+        """
+        for key in self.chunks:
+            yield key, self._read_chunk(key)
+
+    def _reduce(self, kind, axis):
+        """
+        Reduce the array over time (axis=0) or all axes (axis=None),
+        ignoring nan values.
+
+        """
+        if axis not in (0, None):
+            raise ValueError("reductions are only supported for axis=0 or None")
+
+        def reduce_chunk(key):
+            data = self._read_chunk(key)
+            if kind == "min":
+                return np.fmin.reduce(data, axis=0)
+            elif kind == "max":
+                return np.fmax.reduce(data, axis=0)
+            return (
+                np.nansum(data, axis=0, dtype=np.float64),
+                np.sum(~np.isnan(data), axis=0),
+            )
+
+        keys = self.chunks
+        results = self._map(reduce_chunk, keys)
+
+        # combine the reductions of the time chunks
+        if kind == "mean":
+            total = np.zeros(self.shape[1:], dtype=np.float64)
+            count = np.zeros(self.shape[1:], dtype=np.int64)
+            for key, (s, n) in zip(keys, results):
+                total[key[1:]] += s
+                count[key[1:]] += n
+            if axis is None:
+                total, count = total.sum(), count.sum()
+            with np.errstate(invalid="ignore", divide="ignore"):
+                return np.where(count > 0, total / count, np.nan)
+        func = np.fmin if kind == "min" else np.fmax
+        out = np.full(self.shape[1:], np.nan, dtype=self.dtype)
+        for key, r in zip(keys, results):
+            out[key[1:]] = func(out[key[1:]], r)
+        if axis is None:
+            return func.reduce(out, axis=None)
+        return out
+
+    def min(self, axis=0):
+        """
+        Minimum of the data, ignoring nan values.
+
+        Parameters
+        ----------
+        axis : int or None
+            Reduce over time (0) or over all values (None). (Default is 0.)
+
+        Returns
+        -------
+        out : numpy array or float
+
+        """
+        return self._reduce("min", axis)
+
+    def max(self, axis=0):
+        """
+        Maximum of the data, ignoring nan values.
+
+        Parameters
+        ----------
+        axis : int or None
+            Reduce over time (0) or over all values (None). (Default is 0.)
+
+        Returns
+        -------
+        out : numpy array or float
+
+        """
+        return self._reduce("max", axis)
+
+    def mean(self, axis=0):
+        """
+        Mean of the data, ignoring nan values.
+
+        Parameters
+        ----------
+        axis : int or None
+            Reduce over time (0) or over all values (None). (Default is 0.)
+
+        Returns
+        -------
+        out : numpy array or float
+
+        """
+        return self._reduce("mean", axis)
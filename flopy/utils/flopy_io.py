@@ -5,6 +5,7 @@ Module for input/output utilities
 import os
 import platform
 import sys
+import warnings
 from pathlib import Path
 from shutil import which
 from typing import Union
@@ -477,25 +478,11 @@ def ulstrd(f, nlist, ra, model, sfac_columns, ext_unit_dict):
 
     # else, read ascii
     else:
-        for ii in range(nlist):
-            # first line was already read
-            if ii != 0:
-                line = file_handle.readline()
-
-            if model.free_format_input:
-                # whitespace separated
-                t = line_parse(line)
-                if len(t) < ncol:
-                    t = t + (ncol - len(t)) * [0.0]
-                else:
-                    t = t[:ncol]
-                t = tuple(t)
-                ra[ii] = t
-            else:
-                # fixed format
-                t = read_fixed_var(line, ncol=ncol)
-                t = tuple(t)
-                ra[ii] = t
+        # first line was already read
+        lines = [line] if nlist > 0 else []
+        lines.extend(file_handle.readline() for ii in range(1, nlist))
+        if not _read_ascii_list(lines, ra, model.free_format_input):
+            _read_ascii_list_by_line(lines, ra, model.free_format_input)
 
     # scale the data and check
     for column_name in sfac_columns:
@@ -509,6 +496,93 @@ def ulstrd(f, nlist, ra, model, sfac_columns, ext_unit_dict):
     return ra
 
 
+def _read_ascii_list(lines, ra, free_format):
+    """
+    Fill a record array with the rows of an ascii list using numpy's
+    text reader.
+
+    Parameters
+    ----------
+    lines : list of str
+        lines of the list, one row per line
+    ra : np.recarray
+        record array with one record per line to fill
+    free_format : bool
+        whether the lines are free format (whitespace separated) or fixed
+        format (10 character columns)
+
+    Returns
+    -------
+    success : bool
+        False if the lines could not be read this way (for example rows
+        with missing values or commas), in which case ra must be filled
+        with _read_ascii_list_by_line
+
+    """
+    nlist = len(lines)
+    ncol = len(ra.dtype.names)
+    if nlist == 0:
+        return True
+    if free_format:
+        if any("," in line for line in lines):
+            return False
+        comments = [";", "#", "!!"]
+    else:
+        # split each line into 10 character columns separated by commas,
+        # blank columns are zero
+        width = 10 * ncol
+        text = [line.rstrip().ljust(width)[:width] for line in lines]
+        if any("," in line for line in text):
+            return False
+        values = np.array(text, dtype=f"U{width}").view("U10")
+        values[values == " " * 10] = "0"
+        columns = np.full((nlist, ncol, 11), ",", dtype="U1")
+        columns[:, :, :10] = values.view("U1").reshape(nlist, ncol, 10)
+        lines = columns.reshape(nlist, 11 * ncol).view(f"U{11 * ncol}").ravel().tolist()
+        comments = None
+    try:
+        with warnings.catch_warnings():
+            # loadtxt warns on lists of only blank or comment lines
+            warnings.simplefilter("ignore", UserWarning)
+            values = np.loadtxt(
+                lines,
+                dtype=ra.dtype,
+                delimiter=None if free_format else ",",
+                comments=comments,
+                usecols=range(ncol),
+                ndmin=1,
+            )
+    except (TypeError, ValueError):
+        return False
+    # blank and comment lines are skipped by loadtxt
+    if len(values) != nlist:
+        return False
+    ra[:] = values
+    return True
+
+
+def _read_ascii_list_by_line(lines, ra, free_format):
+    """
+    Fill a record array with the rows of an ascii list one line at a time.
+    """
+    ncol = len(ra.dtype.names)
+    for ii, line in enumerate(lines):
+        if free_format:
+            # whitespace separated
+            t = line_parse(line)
+            if len(t) < ncol:
+                t = t + (ncol - len(t)) * [0.0]
+            else:
+                t = t[:ncol]
+            t = tuple(t)
+            ra[ii] = t
+        else:
+            # fixed format
+            t = read_fixed_var(line, ncol=ncol)
+            t = tuple(t)
+            ra[ii] = t
+
+
 def get_ts_sp(line):
     """
     Reader method to get time step and stress period numbers from
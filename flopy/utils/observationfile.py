@@ -5,7 +5,7 @@ import pandas as pd
 
 from ..utils import import_optional_dependency
 from ..utils.flopy_io import get_ts_sp
-from ..utils.utils_def import FlopyBinaryData
+from ..utils.utils_def import FlopyBinaryData, follow_times
 
 
 class ObsFiles(FlopyBinaryData):
@@ -281,6 +281,7 @@ class Mf6Obs(ObsFiles):
         """
         super().__init__()
         # initialize class information
+        self.filename = filename
         self.verbose = verbose
 
         # check if this is a binary file
@@ -293,6 +294,7 @@ class Mf6Obs(ObsFiles):
                 else:
                     err = "Could not determine if file is binary or ascii"
                     raise ValueError(err)
+        self.isBinary = isBinary
         if isBinary:
             # --open binary head file
             self.file = open(filename, "rb")
@@ -321,18 +323,78 @@ class Mf6Obs(ObsFiles):
             # build index
             self._build_index()
 
-            self.data = None
-            self._read_data()
+            # read all complete records
+            self._endpos = self.file.tell()
+            self.data = np.empty(0, dtype=self.dtype)
+            self.refresh()
         else:
             # read ascii data
             csv = CsvFile(filename)
             self.obsnames = csv.obsnames
             self.nobs = csv.nobs
             self.data = csv.data
+            self._endpos = csv.endpos
 
     def _build_index(self):
         return
 
+    def refresh(self):
+        """
+        Read observations written to the file since it was opened or last
+        refreshed, e.g. while the model is still running. Only the new
+        part of the file is read, and a partially written record at the
+        end of the file is left for the next refresh.
+
+        Returns
+        -------
+        times : list of floats
+            Simulation times added to the file.
+
+        """
+        ntimes = self.get_ntimes()
+        if self.isBinary:
+            self.file.seek(0, 2)
+            count = (self.file.tell() - self._endpos) // self.dtype.itemsize
+            if count > 0:
+                self.file.seek(self._endpos, 0)
+                r = self.read_record(count=count)
+                self.data = np.hstack((self.data, r))
+                self._endpos += r.nbytes
+        else:
+            with open(self.filename, "rb") as f:
+                f.seek(self._endpos, 0)
+                text = f.read()
+            nbytes = text.rfind(b"\n") + 1
+            if nbytes > 0:
+                r = CsvFile.read_csv(
+                    io.StringIO(text[:nbytes].decode()), self.data.dtype
+                )
+                self.data = np.hstack((self.data, r)).view(np.recarray)
+                self._endpos += nbytes
+        return self.get_times()[ntimes:]
+
+    def follow(self, poll_interval=1.0, timeout=None):
+        """
+        Iterate over the simulation times in the file, waiting for new
+        observations to be written to the file, e.g. by a running model.
+
+        Parameters
+        ----------
+        poll_interval : float
+            Seconds to wait between checks for new observations (default
+            is 1).
+        timeout : float
+            Stop iterating if no new observations are written for this many
+            seconds. If None (default), iterate indefinitely.
+
+        Yields
+        ------
+        totim : float
+            Simulation time of observations written to the file.
+
+        """
+        return follow_times(self.get_times, self.refresh, poll_interval, timeout)
+
 
 class HydmodObs(ObsFiles):
     """
@@ -497,21 +559,33 @@ class CsvFile:
     """
 
     def __init__(self, csvfile, delimiter=",", deletechars="", replace_space=""):
-        with open(csvfile) as self.file:
+        with open(csvfile, "rb") as self.file:
             self.delimiter = delimiter
             self.deletechars = deletechars
             self.replace_space = replace_space
 
             # read header line
             line = self.file.readline()
-            self._header = line.rstrip().split(delimiter)
+            self._header = line.decode().rstrip().split(delimiter)
             self.__fix_duplicate_headings()
             self.floattype = "f8"
             self.dtype = _build_dtype(self._header, self.floattype)
 
-            self.data = self.read_csv(
-                self.file, self.dtype, delimiter, deletechars, replace_space
-            )
+            # a partially written line at the end of the file is not read
+            text = self.file.read()
+            nbytes = text.rfind(b"\n") + 1
+            if nbytes > 0:
+                self.data = self.read_csv(
+                    io.StringIO(text[:nbytes].decode()),
+                    self.dtype,
+                    delimiter,
+                    deletechars,
+                    replace_space,
+                )
+            else:
+                self.data = np.empty(0, dtype=self.dtype).view(np.recarray)
+            # position following the data that were read
+            self.endpos = len(line) + nbytes
 
     def __fix_duplicate_headings(self):
         """
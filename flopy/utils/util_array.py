@@ -1114,12 +1114,21 @@ class Transient3d(DataInterface):
                 arr[kper, k, :, :] = u3d[k].array
         return arr
 
-    def get_kper_entry(self, kper):
+    def get_kper_entry(self, kper, reuse=False):
         """
         get the file entry info for a given kper
         returns (itmp,file entry string from Util3d)
+
+        If reuse is True, (-1, '') is also returned if the array is the
+        same as the array of the previous stress period, so it is reused
+        instead of written again.
         """
         if kper in self.transient_3ds:
+            if reuse and kper > 0:
+                previous = self[kper - 1]
+                u3d = self.transient_3ds[kper]
+                if previous is u3d or np.array_equal(previous.array, u3d.array):
+                    return -1, ""
             s = ""
             for k in range(self.shape[0]):
                 s += self.transient_3ds[kper][k].get_file_entry()
@@ -1564,13 +1573,22 @@ class Transient2d(DataInterface):
 
         return export.utils.transient2d_export(f, self, **kwargs)
 
-    def get_kper_entry(self, kper):
+    def get_kper_entry(self, kper, reuse=False):
         """
         Get the file entry info for a given kper
         returns (itmp,file entry string from Util2d)
+
+        If reuse is True, (-1, '') is also returned if the array is the
+        same as the array of the previous stress period, so it is reused
+        instead of written again.
         """
         if kper in self.transient_2ds:
-            return (1, self.transient_2ds[kper].get_file_entry())
+            u2d = self.transient_2ds[kper]
+            if reuse and kper > 0:
+                previous = self[kper - 1]
+                if previous is u2d or np.array_equal(previous.array, u2d.array):
+                    return (-1, "")
+            return (1, u2d.get_file_entry())
         elif kper < min(self.transient_2ds.keys()):
             return (1, self.get_zero_2d(kper).get_file_entry())
         else:
@@ -2194,9 +2212,11 @@ class Util2d(DataInterface):
         else:
             return f"{self.cnstnt:15.6G}"
 
-    def get_openclose_cr(self):
+    def get_openclose_cr(self, model_file_path=None):
+        if model_file_path is None:
+            model_file_path = self.model_file_path
         cr = "OPEN/CLOSE  {:>30s} {:15} {:>10s} {:2.0f} {:<30s}\n".format(
-            self.model_file_path,
+            model_file_path,
             self.cnstnt_str,
             self.format.fortran,
             self.iprn,
@@ -2261,18 +2281,35 @@ class Util2d(DataInterface):
                 )
 
             # write a file if needed
+            model_file_path = self.model_file_path
             if self.vtype != str:
-                if self.format.binary:
-                    self.write_bin(
-                        self.shape, self.python_file_path, self._array, bintype="head"
-                    )
-                else:
-                    self.write_txt(
-                        self.shape,
-                        self.python_file_path,
-                        self._array,
-                        fortran_format=self.format.fortran,
+                # refer to the file of an identical array that was already
+                # written by the model instead of writing it again
+                if how == "openclose":
+                    array = np.ascontiguousarray(self._array)
+                    model_file_path = self._model._shared_file_path(
+                        model_file_path,
+                        self.format.binary,
+                        self.format.fortran,
+                        array.dtype.str,
+                        array.shape,
+                        array.tobytes(),
                     )
+                if model_file_path == self.model_file_path:
+                    if self.format.binary:
+                        self.write_bin(
+                            self.shape,
+                            self.python_file_path,
+                            self._array,
+                            bintype="head",
+                        )
+                    else:
+                        self.write_txt(
+                            self.shape,
+                            self.python_file_path,
+                            self._array,
+                            fortran_format=self.format.fortran,
+                        )
 
             elif self.__value != self.python_file_path:
                 if os.path.exists(self.python_file_path):
@@ -2300,7 +2337,7 @@ class Util2d(DataInterface):
             if how == "external":
                 return self.get_external_cr()
             else:
-                return self.get_openclose_cr()
+                return self.get_openclose_cr(model_file_path)
 
         elif how == "constant":
             if self.vtype not in [np.int32, np.float32]:
@@ -2377,17 +2414,16 @@ class Util2d(DataInterface):
         """
         if self.vtype == str:
             if self.__value_built is None:
-                file_in = open(self.__value, "r")
-
                 if self.format.binary:
+                    file_in = open(self.__value, "r")
                     header, self.__value_built = Util2d.load_bin(
                         self.shape, file_in, self._dtype, bintype="head"
                     )
+                    file_in.close()
                 else:
                     self.__value_built = Util2d.load_txt(
-                        self.shape, file_in, self._dtype, self.format.fortran
+                        self.shape, self.__value, self._dtype, self.format.fortran
                     ).astype(self._dtype)
-                file_in.close()
             return self.__value_built
         elif self.vtype != np.ndarray:
             if self.__value_built is None:
@@ -2419,8 +2455,8 @@ class Util2d(DataInterface):
                 f"Util2d.load_block(): expected 2 dimensions, found shape {shape}"
             )
         nrow, ncol = shape
-        data = np.ma.zeros(shape, dtype=dtype)
-        data.mask = True
+        data = np.zeros(shape, dtype=dtype)
+        covered = np.zeros(shape, dtype=bool)
         openfile = not hasattr(file_in, "read")
         if openfile:
             file_in = open(file_in, "r")
@@ -2436,11 +2472,12 @@ class Util2d(DataInterface):
             i1, i2 = int(raw[0]) - 1, int(raw[1])
             j1, j2 = int(raw[2]) - 1, int(raw[3])
             data[i1:i2, j1:j2] = raw[4]
+            covered[i1:i2, j1:j2] = True
         if openfile:
             file_in.close()
-        if data.mask.any():
+        if not covered.all():
             warn("Util2d.load_block(): blocks do not cover full array")
-        return data.data
+        return data
 
     @staticmethod
     def load_txt(shape, file_in, dtype, fmtin):
@@ -2478,12 +2515,14 @@ class Util2d(DataInterface):
         if openfile:
             file_in = open(file_in, "r")
         npl, fmt, width, decimal = ArrayFormat.decode_fortran_descriptor(fmtin)
-        items = []
-        while len(items) < num_items:
-            line = file_in.readline()
-            if len(line) == 0:
-                raise ValueError("Util2d.load_txt(): no data found")
-            if npl == "free":
+        if npl == "free":
+            # a file opened here only holds the array, so read it at once
+            read_text = file_in.read if openfile else file_in.readline
+            items = []
+            while len(items) < num_items:
+                line = read_text()
+                if len(line) == 0:
+                    raise ValueError("Util2d.load_txt(): no data found")
                 if "," in line:
                     line = line.replace(",", " ")
                 if "*" in line:  # use slower method for these types of lines
@@ -2496,19 +2535,11 @@ class Util2d(DataInterface):
                             items.append(item)
                 else:
                     items += line.split()
-            else:  # fixed width
-                pos = 0
-                for i in range(npl):
-                    try:
-                        item = line[pos : pos + width].strip()
-                        pos += width
-                        if item:
-                            items.append(item)
-                    except IndexError:
-                        break
+            data = np.fromiter(items, dtype=dtype, count=num_items)
+        else:  # fixed width
+            data = Util2d._load_fixed_width(file_in, num_items, dtype, npl, width)
         if openfile:
             file_in.close()
-        data = np.fromiter(items, dtype=dtype, count=num_items)
         if data.size != num_items:
             raise ValueError(
                 f"Util2d.load_txt(): expected array size {num_items}, "
@@ -2516,6 +2547,38 @@ class Util2d(DataInterface):
             )
         return data.reshape(shape)
 
+    @staticmethod
+    def _load_fixed_width(file_in, num_items, dtype, npl, width):
+        """Read num_items values from lines of npl fixed width values,
+        skipping blank values, into a 1-D array"""
+        line_width = npl * width
+        values = [np.empty(0, dtype=dtype)]
+        count = 0
+        while count < num_items:
+            # a line holds at most npl values, so all of these lines are read
+            lines = []
+            for _ in range(-(-(num_items - count) // npl)):
+                line = file_in.readline()
+                if len(line) == 0:
+                    raise ValueError("Util2d.load_txt(): no data found")
+                lines.append(line.rstrip().ljust(line_width)[:line_width])
+            # values after the last one needed are not converted
+            try:
+                items = np.frombuffer("".join(lines).encode("ascii"), dtype=f"S{width}")
+                items = items[np.char.strip(items) != b""][: num_items - count]
+                values.append(items.astype(dtype))
+            except (OverflowError, TypeError, ValueError):
+                # convert item by item, raising the error for the bad value
+                items = (
+                    line[pos : pos + width].strip()
+                    for line in lines
+                    for pos in range(0, line_width, width)
+                )
+                items = [item for item in items if item][: num_items - count]
+                values.append(np.fromiter(items, dtype))
+            count += len(values[-1])
+        return np.concatenate(values)
+
     @staticmethod
     def write_txt(shape, file_out, data, fortran_format="(FREE)", python_format=None):
         if fortran_format.upper() == "(FREE)" and python_format is None:
@@ -2792,14 +2855,13 @@ class Util2d(DataInterface):
                 fname
             ), f"Util2d.load() error: open/close file {fname} not found"
             if "binary" not in cr_dict["fmtin"].lower():
-                f = open(fname, "r")
                 data = Util2d.load_txt(
-                    shape=shape, file_in=f, dtype=dtype, fmtin=cr_dict["fmtin"]
+                    shape=shape, file_in=fname, dtype=dtype, fmtin=cr_dict["fmtin"]
                 )
             else:
                 f = open(fname, "rb")
                 header_data, data = Util2d.load_bin(shape, f, dtype, bintype="Head")
-            f.close()
+                f.close()
             u2d = cls(
                 model,
                 shape,
@@ -9,6 +9,7 @@ util_list module.  Contains the mflist class.
 """
 
 import os
+import re
 import warnings
 
 import numpy as np
@@ -29,6 +30,11 @@ class MfList(DataInterface, DataListInterface):
         this MfList will be added.
     data : varies
         the data of the transient list (optional). (the default is None)
+    binary : bool or int
+        write the lists to binary external files. If a positive int, only
+        the lists of stress periods with at least this many entries are
+        written to binary files, 0 is the same as False (the default is
+        False)
 
     Attributes
     ----------
@@ -84,6 +90,16 @@ class MfList(DataInterface, DataListInterface):
             self.__dtype = self.package.dtype
         else:
             self.__dtype = dtype
+        if isinstance(binary, (int, np.integer)) and not isinstance(
+            binary, (bool, np.bool_)
+        ):
+            if binary < 0:
+                raise ValueError(
+                    f"MfList error: binary entry threshold must be positive: {binary}"
+                )
+            binary = int(binary) if binary > 0 else False
+        else:
+            binary = bool(binary)
         self.__binary = binary
         self.__vtype = {}
         self.__data = {}
@@ -603,7 +619,7 @@ class MfList(DataInterface, DataListInterface):
 
     def get_filename(self, kper):
         ext = "dat"
-        if self.binary:
+        if self.__is_binary(kper):
             ext = "bin"
         return f"{self.package.name[0]}_{kper:04d}.{ext}"
 
@@ -611,6 +627,16 @@ class MfList(DataInterface, DataListInterface):
     def binary(self):
         return bool(self.__binary)
 
+    def __is_binary(self, kper):
+        # binary is either a flag for all stress periods or the number of
+        # entries from which a stress period list is written to a binary file
+        if isinstance(self.__binary, bool):
+            return self.__binary
+        # external files are not read to count their entries
+        if self.__vtype.get(kper) != np.recarray:
+            return False
+        return self.get_itmp(kper) >= self.__binary
+
     def write_transient(
         self,
         f,
@@ -638,6 +664,10 @@ class MfList(DataInterface, DataListInterface):
             if not isinstance(single_per, list):
                 single_per = [single_per]
             loop_over_kpers = single_per
+        # consecutive stress periods with the same list reuse it (itmp < 0),
+        # unless the caller writes the itmp values or only some periods
+        reuse = single_per is None and write_header and cln_data is None
+        previous_data = None
 
         for kper in loop_over_kpers:
             # Fill missing early kpers with 0
@@ -663,6 +693,19 @@ class MfList(DataInterface, DataListInterface):
                 itmp = -1
                 kper_vtype = int
 
+            if kper_vtype == np.recarray:
+                if (
+                    reuse
+                    and previous_data is not None
+                    and np.array_equal(previous_data, kper_data)
+                ):
+                    itmp = -1
+                    kper_vtype = int
+                else:
+                    previous_data = kper_data
+            elif itmp != -1:
+                previous_data = None
+
             if write_header:
                 if cln_data is None:
                     f.write(f" {itmp:9d} {0:9d} # stress period {kper + 1}\n")
@@ -674,6 +717,7 @@ class MfList(DataInterface, DataListInterface):
                         f" {itmp:9d} {0:9d} {itmpcln:9d} # stress period {kper + 1}\n"
                     )
 
+            binary = kper_vtype in (np.recarray, str) and self.__is_binary(kper)
             isExternal = False
             if (
                 self._model.array_free_format
@@ -681,7 +725,7 @@ class MfList(DataInterface, DataListInterface):
                 and forceInternal is False
             ):
                 isExternal = True
-            if self.__binary:
+            if binary:
                 isExternal = True
             if isExternal:
                 if kper_vtype == np.recarray:
@@ -699,24 +743,37 @@ class MfList(DataInterface, DataListInterface):
                         model_filepath = os.path.join(
                             self._model.external_path, filename
                         )
-                    self.__tofile(py_filepath, kper_data)
+                    # refer to the file of an identical list that was
+                    # already written by the model instead of writing it
+                    shared_filepath = model_filepath
+                    if not kper_data.dtype.hasobject:
+                        shared_filepath = self._model._shared_file_path(
+                            model_filepath,
+                            binary,
+                            self.fmt_string,
+                            kper_data.dtype.descr,
+                            np.ascontiguousarray(kper_data).tobytes(),
+                        )
+                    if shared_filepath == model_filepath:
+                        self.__tofile(py_filepath, kper_data, binary)
+                    model_filepath = shared_filepath
                     kper_vtype = str
                     kper_data = model_filepath
 
             if kper_vtype == np.recarray:
                 name = f.name
-                if self.__binary:
+                if binary:
                     f.close()
                     # switch file append mode to binary
                     with open(name, "ab+") as f:
-                        self.__tofile(f, kper_data)
+                        self.__tofile(f, kper_data, binary)
                     # continue back to non-binary
                     f = open(name, "a")
                 else:
-                    self.__tofile(f, kper_data)
+                    self.__tofile(f, kper_data, binary)
             elif kper_vtype == str:
                 f.write(f"         open/close {kper_data}")
-                if self.__binary:
+                if binary:
                     f.write(" (BINARY)")
                 f.write("\n")
 
@@ -724,7 +781,7 @@ class MfList(DataInterface, DataListInterface):
                 if cln_data.get_itmp(kper) is not None:
                     cln_data.write_transient(f, single_per=kper, write_header=False)
 
-    def __tofile(self, f, data):
+    def __tofile(self, f, data, binary):
         # Write the recarray (data) to the file (or file handle) f
         assert isinstance(
             data, np.recarray
@@ -737,15 +794,73 @@ class MfList(DataInterface, DataListInterface):
         for idx in ["k", "i", "j", "node"]:
             if idx in lnames:
                 d[idx] += 1
-        if self.__binary:
+        if binary:
             dtype2 = []
             for name in self.dtype.names:
                 dtype2.append((name, np.float32))
             dtype2 = np.dtype(dtype2)
             d = np.array(d, dtype=dtype2)
             d.tofile(f)
-        else:
+            return
+
+        text = self.__format_text(d)
+        if text is None:
             np.savetxt(f, d, fmt=self.fmt_string, delimiter="")
+        elif hasattr(f, "write"):
+            f.write(text)
+        else:
+            with open(f, "w") as fo:
+                fo.write(text)
+
+    def __format_text(self, data):
+        # Format the recarray (data) column by column, giving the same text
+        # as numpy.savetxt with fmt_string.  None is returned if the columns
+        # can not be formatted this way, when a value is wider than its
+        # field or a column holds objects.
+        if data.shape[0] == 0:
+            return ""
+        fmt_string = self.fmt_string
+        # free format fields are separated by a space
+        sep = 1 if fmt_string.startswith(" ") else 0
+        fields = []
+        for name, fmt in zip(data.dtype.names, fmt_string.split("%")[1:]):
+            match = re.fullmatch(r"(\d+)(?:\.\d+)?([dsG])", fmt.strip())
+            values = data[name]
+            if match is None or values.dtype.kind == "O":
+                return None
+            fmt = f"%{match.group(0)}"
+            width = int(match.group(1))
+            # format each distinct value once, floats are compared by their
+            # bits so that -0.0 and nan keep their own text
+            if values.dtype.kind == "f":
+                keys = values.view(f"u{values.dtype.itemsize}")
+            else:
+                keys = values
+            keys, inverse = np.unique(keys, return_inverse=True)
+            unique = keys.view(values.dtype)
+            if fmt.endswith("d"):
+                text = unique.astype(np.int64).astype(bytes)
+            elif fmt.endswith("s"):
+                text = unique.astype(bytes)
+            else:
+                text = np.char.mod(fmt, unique).astype(bytes)
+            text = np.char.rjust(text, width)
+            if text.dtype.itemsize != width:
+                return None
+            fields.append(np.char.rjust(text, width + sep)[inverse.ravel()])
+        if len(fields) != len(data.dtype.names):
+            return None
+
+        # a line is the fields and a newline, next to each other in memory
+        lines = np.empty(
+            data.shape[0],
+            dtype=[(f"f{i}", text.dtype) for i, text in enumerate(fields)]
+            + [("eol", "S1")],
+        )
+        for i, text in enumerate(fields):
+            lines[f"f{i}"] = text
+        lines["eol"] = b"\n"
+        return lines.tobytes().decode()
 
     def check_kij(self):
         names = self.dtype.names
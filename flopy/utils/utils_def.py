@@ -2,6 +2,7 @@
 Generic classes and utility functions
 """
 
+import time
 from datetime import timedelta
 
 import numpy as np
@@ -104,6 +105,52 @@ def totim_to_datetime(totim, start="1-1-1970", timeunit="D"):
     return out
 
 
+def follow_times(get_times, refresh, poll_interval=1.0, timeout=None, lag=False):
+    """
+    Generator yielding the simulation times in an output file as they are
+    written to the file, e.g. by a running model.
+
+    Parameters
+    ----------
+    get_times : callable
+        Function returning the list of simulation times in the file.
+    refresh : callable
+        Function updating the file index with new records, and returning
+        the list of simulation times added to the file.
+    poll_interval : float
+        Seconds to wait between calls to refresh (default is 1).
+    timeout : float
+        Stop if no new times are added for this many seconds. If None
+        (default), wait for new times indefinitely.
+    lag : bool
+        If True, the last time is only yielded once a later time has been
+        written, or on timeout, since more records may still be written for
+        it (default is False).
+
+    Yields
+    ------
+    totim : float
+        Simulation time.
+
+    """
+    nyielded = 0
+    last_update = time.monotonic()
+    while True:
+        times = get_times()
+        nready = len(times) - 1 if lag else len(times)
+        for totim in times[nyielded:nready]:
+            yield totim
+        nyielded = max(nyielded, nready)
+        if len(refresh()) > 0:
+            last_update = time.monotonic()
+            continue
+        if timeout is not None and time.monotonic() - last_update >= timeout:
+            for totim in get_times()[nyielded:]:
+                yield totim
+            return
+        time.sleep(poll_interval)
+
+
 def get_pak_vals_shape(model, vals):
     """Function to define shape of package input data for Util2d.
 
@@ -1,5 +1,6 @@
 import copy
 import os
+import pickle
 from itertools import groupby
 from typing import Union
 
@@ -32,6 +33,16 @@ class ZoneBudget:
         When using this option in conjunction with a list of zones, the
         zone(s) passed may either be all strings (aliases), all integers,
         or mixed.
+    batch_size : int
+        Number of time steps for which the budget is computed at once.
+        Larger batches can be faster for small models but use more memory.
+        (Default is 1.)
+    workers : int or None
+        Number of processes used to compute the budgets of different
+        batches of time steps in parallel. Each process reads the
+        cell-by-cell budget file with its own file handle, using the
+        record index of cbc_file. None or 1 computes the budgets in this
+        process. (Default is None.)
 
     Returns
     -------
@@ -55,6 +66,8 @@ class ZoneBudget:
         totim=None,
         aliases=None,
         verbose=False,
+        batch_size=1,
+        workers=None,
         **kwargs,
     ):
         from .binaryfile import CellBudgetFile
@@ -144,6 +157,11 @@ class ZoneBudget:
         self.allzones = np.unique(izone)
         self._zonenamedict = {z: f"ZONE_{z}" for z in self.allzones}
 
+        # Index of the zone of each cell in allzones, and a mask of the
+        # zones other than zone 0
+        self._izone_index = np.searchsorted(self.allzones, izone)
+        self._nonzero = self.allzones != 0
+
         if aliases is not None:
             s = (
                 "Input aliases not recognized. Please pass a dictionary "
@@ -192,59 +210,156 @@ class ZoneBudget:
         ]
 
         # Initialize budget recordarray
-        array_list = []
+        self._recnames = self._get_budget_record_names()
+        self._rowindex = {n: i for i, n in enumerate(self._recnames)}
+        self._fromzone_rows = [
+            self._rowindex["FROM_" + "_".join(n.split())]
+            for n in self._zonenamedict.values()
+        ]
+        self._tozone_rows = [
+            self._rowindex["TO_" + "_".join(n.split())]
+            for n in self._zonenamedict.values()
+        ]
+        times = self.kstpkper if self.kstpkper is not None else self.totim
+        self._blockindex = {t: i for i, t in enumerate(times)}
         if self.kstpkper is not None:
-            for kk in self.kstpkper:
-                recordarray = self._initialize_budget_recordarray(
-                    kstpkper=kk, totim=None
-                )
-                array_list.append(recordarray)
-        elif self.totim is not None:
-            for t in self.totim:
-                recordarray = self._initialize_budget_recordarray(
-                    kstpkper=None, totim=t
-                )
-                array_list.append(recordarray)
-        self._budget = np.concatenate(array_list, axis=0)
+            self._budget = self._initialize_budget_recordarray(kstpkper=times)
+        else:
+            self._budget = self._initialize_budget_recordarray(totim=times)
 
         # Update budget record array
-        if self.kstpkper is not None:
-            for kk in self.kstpkper:
+        batches = [times[i : i + batch_size] for i in range(0, len(times), batch_size)]
+        if workers is not None and workers > 1 and len(batches) > 1:
+            self._compute_budget_parallel(batches, workers, verbose)
+        else:
+            for batch in batches:
                 if verbose:
-                    s = (
-                        "Computing the budget for"
-                        " time step {} in stress period {}".format(kk[0] + 1, kk[1] + 1)
-                    )
-                    print(s)
-                self._compute_budget(kstpkper=kk)
-        elif self.totim is not None:
-            for t in self.totim:
+                    self._print_progress(batch)
+                if self.kstpkper is not None:
+                    self._compute_budget(kstpkper=batch)
+                else:
+                    self._compute_budget(totim=batch)
+
+    def _print_progress(self, times):
+        """
+        Print the time steps/stress periods or times being computed.
+
+        """
+        for t in times:
+            if self.kstpkper is not None:
+                kstp, kper = t[0] + 1, t[1] + 1
+                s = f"Computing the budget for time step {kstp} in stress period {kper}"
+            else:
+                s = f"Computing the budget for time {t}"
+            print(s)
+
+    def _compute_budget_parallel(self, batches, workers, verbose=False):
+        """
+        Compute the budgets of batches of times in a process pool and copy
+        them to the budget record array in order.
+
+        Parameters
+        ----------
+        batches : list of lists
+            Batches of kstpkper tuples or totims.
+        workers : int
+            Number of processes.
+        verbose : bool
+            Print each time step as its budget is copied (default is False).
+
+        Returns
+        -------
+        None
+
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Send the zone arrays and the budget file record index to each
+        # process once, without the budget record array and the model.
+        # Pickle them even if processes are forked, so each process opens
+        # its own handle to the budget file.
+        zb = copy.copy(self)
+        zb._budget = None
+        zb.__dict__.pop("model", None)
+        zb.dis = None
+        zb = pickle.dumps(zb)
+
+        key = "kstpkper" if self.kstpkper is not None else "totim"
+        chunksize = max(1, len(batches) // (4 * workers))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_budget_worker,
+            initargs=(zb,),
+        ) as pool:
+            results = pool.map(
+                _compute_budget_worker,
+                [{key: batch} for batch in batches],
+                chunksize=chunksize,
+            )
+            for batch, budget in zip(batches, results):
                 if verbose:
-                    s = f"Computing the budget for time {t}"
-                    print(s)
-                self._compute_budget(totim=t)
+                    self._print_progress(batch)
+                self._set_budget(batch, budget)
 
     def _compute_budget(self, kstpkper=None, totim=None):
         """
-        Creates a budget for the specified zone array. This function only
-        supports the use of a single time step/stress period or time.
+        Creates a budget for the specified zone array. All of the time
+        steps/stress periods or times passed are computed as one batch.
 
         Parameters
         ----------
-        kstpkper : tuple
-            Tuple of kstp and kper to compute budget for (default is None).
-        totim : float
-            Totim to compute budget for (default is None).
+        kstpkper : tuple or list of tuples
+            Tuple(s) of kstp and kper to compute budget for (default is None).
+        totim : float or list of floats
+            Totim(s) to compute budget for (default is None).
 
         Returns
         -------
         None
 
         """
+        if kstpkper is not None:
+            if isinstance(kstpkper, tuple):
+                kstpkper = [kstpkper]
+            budget = self._get_budget_terms(kstpkper=kstpkper)
+            self._set_budget(kstpkper, budget)
+        else:
+            if np.ndim(totim) == 0:
+                totim = [totim]
+            budget = self._get_budget_terms(totim=totim)
+            self._set_budget(totim, budget)
+        return
+
+    def _get_budget_terms(self, kstpkper=None, totim=None):
+        """
+        Compute the budget terms for a batch of time steps/stress periods
+        or times.
+
+        Parameters
+        ----------
+        kstpkper : list of tuples
+            Tuples of kstp and kper to compute budget for (default is None).
+        totim : list of floats
+            Totims to compute budget for (default is None).
+
+        Returns
+        -------
+        budget : np.ndarray
+            Budget terms of shape (ntimes, nrecnames, nzones).
+
+        """
+        if kstpkper is not None:
+            times = [{"kstpkper": kk} for kk in kstpkper]
+        else:
+            times = [{"totim": t} for t in totim]
+
+        # Budget terms of each time, record name and zone
+        budget = np.zeros((len(times), len(self._recnames), len(self.allzones)))
+
         # Initialize an array to track where the constant head cells
         # are located.
-        ich = np.zeros(self.cbc_shape, self.int_type)
-        swiich = np.zeros(self.cbc_shape, self.int_type)
+        ich = np.zeros((len(times),) + self.cbc_shape, bool)
+        swiich = np.zeros((len(times),) + self.cbc_shape, bool)
 
         if "CONSTANT HEAD" in self.record_names:
             """
@@ -254,74 +369,87 @@ class ZoneBudget:
             C-----HEAD CELLS ARE AND THEN USE FACE FLOWS TO DETERMINE THE AMOUNT OF
             C-----FLOW.  STORE CONSTANT-HEAD LOCATIONS IN ICH ARRAY.
             """
-            chd = self.cbc.get_data(
-                text="CONSTANT HEAD", full3D=True, kstpkper=kstpkper, totim=totim
-            )[0]
-            ich[np.ma.where(chd != 0.0)] = 1
+            ich = self._get_array_data("CONSTANT HEAD", times) != 0.0
         if "FLOW RIGHT FACE" in self.record_names:
-            self._accumulate_flow_frf("FLOW RIGHT FACE", ich, kstpkper, totim)
+            self._accumulate_flow_face(budget, "FLOW RIGHT FACE", ich, 2, times)
         if "FLOW FRONT FACE" in self.record_names:
-            self._accumulate_flow_fff("FLOW FRONT FACE", ich, kstpkper, totim)
+            self._accumulate_flow_face(budget, "FLOW FRONT FACE", ich, 1, times)
         if "FLOW LOWER FACE" in self.record_names:
-            self._accumulate_flow_flf("FLOW LOWER FACE", ich, kstpkper, totim)
+            self._accumulate_flow_face(budget, "FLOW LOWER FACE", ich, 0, times)
         if "SWIADDTOCH" in self.record_names:
-            swichd = self.cbc.get_data(
-                text="SWIADDTOCH", full3D=True, kstpkper=kstpkper, totim=totim
-            )[0]
-            swiich[swichd != 0] = 1
+            swiich = self._get_array_data("SWIADDTOCH", times) != 0.0
         if "SWIADDTOFRF" in self.record_names:
-            self._accumulate_flow_frf("SWIADDTOFRF", swiich, kstpkper, totim)
+            self._accumulate_flow_face(budget, "SWIADDTOFRF", swiich, 2, times)
         if "SWIADDTOFFF" in self.record_names:
-            self._accumulate_flow_fff("SWIADDTOFFF", swiich, kstpkper, totim)
+            self._accumulate_flow_face(budget, "SWIADDTOFFF", swiich, 1, times)
         if "SWIADDTOFLF" in self.record_names:
-            self._accumulate_flow_flf("SWIADDTOFLF", swiich, kstpkper, totim)
+            self._accumulate_flow_face(budget, "SWIADDTOFLF", swiich, 0, times)
 
         # NOT AN INTERNAL FLOW TERM, SO MUST BE A SOURCE TERM OR STORAGE
         # ACCUMULATE THE FLOW BY ZONE
         # iterate over remaining items in the list
         for recname in self.ssst_record_names:
-            self._accumulate_flow_ssst(recname, kstpkper, totim)
+            self._accumulate_flow_ssst(budget, recname, times)
 
         # Compute mass balance terms
-        self._compute_mass_balance(kstpkper, totim)
+        self._compute_mass_balance(budget)
 
-        return
+        return budget
 
-    def _add_empty_record(self, recordarray, recname, kstpkper=None, totim=None):
+    def _set_budget(self, times, budget):
         """
-        Build an empty records based on the specified flow direction and
-        record name for the given list of zones.
+        Copy the budget terms of a batch of times to the budget record array.
 
         Parameters
         ----------
-        recordarray :
-        recname :
-        kstpkper : tuple
-            Tuple of kstp and kper to compute budget for (default is None).
-        totim : float
-            Totim to compute budget for (default is None).
+        times : list
+            kstpkper tuples or totims of the batch.
+        budget : np.ndarray
+            Budget terms of shape (ntimes, nrecnames, nzones).
 
         Returns
         -------
-        recordarray : np.recarray
+        None
 
         """
-        if kstpkper is not None:
-            if len(self.cbc_times) > 0:
-                totim = self.cbc_times[self.cbc_kstpkper.index(kstpkper)]
-            else:
-                totim = 0.0
-        elif totim is not None:
-            if len(self.cbc_times) > 0:
-                kstpkper = self.cbc_kstpkper[self.cbc_times.index(totim)]
-            else:
-                kstpkper = (0, 0)
+        # Copy the batch to the budget record array, one zone at a time
+        iblock = [self._blockindex[t] for t in times]
+        nrec = len(self._recnames)
+        rows = (np.array(iblock)[:, np.newaxis] * nrec + np.arange(nrec)).ravel()
+        for izone, name in enumerate(self._zonenamedict.values()):
+            self._budget[name][rows] = budget[:, :, izone].ravel()
 
-        row = [totim, kstpkper[0], kstpkper[1], recname]
-        row += [0.0 for _ in self._zonenamedict.values()]
-        recs = np.array(tuple(row), dtype=recordarray.dtype)
-        recordarray = np.append(recordarray, recs)
-        return recordarray
+    def _get_budget_record_names(self):
+        """
+        Get the names of the budget records of a single time step, in the
+        order they are stored in the budget record array.
+
+        Returns
+        -------
+        recnames : list of str
+
+        """
+        fromnames = []
+        tonames = []
+        if "STORAGE" in self.record_names:
+            fromnames.append("FROM_STORAGE")
+            tonames.append("TO_STORAGE")
+        if "CONSTANT HEAD" in self.record_names:
+            fromnames.append("FROM_CONSTANT_HEAD")
+            tonames.append("TO_CONSTANT_HEAD")
+        for recname in self.ssst_record_names:
+            if recname != "STORAGE":
+                fromnames.append("FROM_" + "_".join(recname.split()))
+                tonames.append("TO_" + "_".join(recname.split()))
+        for n in self._zonenamedict.values():
+            fromnames.append("FROM_" + "_".join(n.split()))
+            tonames.append("TO_" + "_".join(n.split()))
+        return (
+            fromnames
+            + ["TOTAL_IN"]
+            + tonames
+            + ["TOTAL_OUT", "IN-OUT", "PERCENT_DISCREPANCY"]
+        )
 
     def _initialize_budget_recordarray(self, kstpkper=None, totim=None):
         """
@@ -330,13 +458,14 @@ class ZoneBudget:
 
         Parameters
         ----------
-        kstpkper : tuple
-            Tuple of kstp and kper to compute budget for (default is None).
-        totim : float
-            Totim to compute budget for (default is None).
+        kstpkper : list of tuples
+            Tuples of kstp and kper to compute budget for (default is None).
+        totim : list of floats
+            Totims to compute budget for (default is None).
 
         Returns
         -------
+        recordarray : np.recarray
 
         """
 
@@ -349,711 +478,241 @@ class ZoneBudget:
         ]
         dtype_list += [(n, self.float_type) for n in self._zonenamedict.values()]
         dtype = np.dtype(dtype_list)
-        recordarray = np.array([], dtype=dtype)
-
-        # Add "from" records
-        if "STORAGE" in self.record_names:
-            recordarray = self._add_empty_record(
-                recordarray, "FROM_STORAGE", kstpkper, totim
-            )
-        if "CONSTANT HEAD" in self.record_names:
-            recordarray = self._add_empty_record(
-                recordarray, "FROM_CONSTANT_HEAD", kstpkper, totim
-            )
-        for recname in self.ssst_record_names:
-            if recname != "STORAGE":
-                recordarray = self._add_empty_record(
-                    recordarray, "FROM_" + "_".join(recname.split()), kstpkper, totim
-                )
-
-        for z, n in self._zonenamedict.items():
-            if z == 0 and 0 not in self.allzones:
-                continue
-            else:
-                recordarray = self._add_empty_record(
-                    recordarray, "FROM_" + "_".join(n.split()), kstpkper, totim
-                )
-        recordarray = self._add_empty_record(recordarray, "TOTAL_IN", kstpkper, totim)
-
-        # Add "out" records
-        if "STORAGE" in self.record_names:
-            recordarray = self._add_empty_record(
-                recordarray, "TO_STORAGE", kstpkper, totim
-            )
-        if "CONSTANT HEAD" in self.record_names:
-            recordarray = self._add_empty_record(
-                recordarray, "TO_CONSTANT_HEAD", kstpkper, totim
-            )
-        for recname in self.ssst_record_names:
-            if recname != "STORAGE":
-                recordarray = self._add_empty_record(
-                    recordarray, "TO_" + "_".join(recname.split()), kstpkper, totim
-                )
-
-        for z, n in self._zonenamedict.items():
-            if z == 0 and 0 not in self.allzones:
-                continue
-            else:
-                recordarray = self._add_empty_record(
-                    recordarray, "TO_" + "_".join(n.split()), kstpkper, totim
-                )
-        recordarray = self._add_empty_record(recordarray, "TOTAL_OUT", kstpkper, totim)
 
-        recordarray = self._add_empty_record(recordarray, "IN-OUT", kstpkper, totim)
-        recordarray = self._add_empty_record(
-            recordarray, "PERCENT_DISCREPANCY", kstpkper, totim
-        )
+        # Get the simulation time and time step/stress period of each block
+        totims = []
+        kstpkpers = []
+        if kstpkper is not None:
+            for kk in kstpkper:
+                if len(self.cbc_times) > 0:
+                    totims.append(self.cbc_times[self.cbc_kstpkper.index(kk)])
+                else:
+                    totims.append(0.0)
+                kstpkpers.append(kk)
+        elif totim is not None:
+            for t in totim:
+                if len(self.cbc_times) > 0:
+                    kstpkpers.append(self.cbc_kstpkper[self.cbc_times.index(t)])
+                else:
+                    kstpkpers.append((0, 0))
+                totims.append(t)
+
+        nrec = len(self._recnames)
+        recordarray = np.zeros(len(totims) * nrec, dtype=dtype)
+        recordarray["totim"] = np.repeat(totims, nrec)
+        recordarray["time_step"] = np.repeat([kk[0] for kk in kstpkpers], nrec)
+        recordarray["stress_period"] = np.repeat([kk[1] for kk in kstpkpers], nrec)
+        recordarray["name"] = np.tile(self._recnames, len(totims))
         return recordarray
 
-    @staticmethod
-    def _filter_circular_flow(fz, tz, f):
+    def _get_array_data(self, recname, times):
         """
+        Get the data of a record for a batch of times as a full 3-D array.
 
         Parameters
         ----------
-        fz
-        tz
-        f
+        recname : str
+            Record name.
+        times : list of dicts
+            kstpkper or totim keyword argument of get_data() for each time.
 
         Returns
         -------
+        data : np.ndarray
+            Array of shape (ntimes, nlay, nrow, ncol). Masked values and
+            times without the record are zero.
 
         """
-        e = np.equal(fz, tz)
-        fz = fz[np.logical_not(e)]
-        tz = tz[np.logical_not(e)]
-        f = f[np.logical_not(e)]
-        return fz, tz, f
+        data = np.zeros((len(times),) + self.cbc_shape)
+        for n, kwargs in enumerate(times):
+            d = self.cbc.get_data(text=recname, full3D=True, **kwargs)
+            if len(d) > 0:
+                data[n] = np.ma.filled(d[0], 0.0)
+        return data
 
-    def _update_budget_fromfaceflow(self, fz, tz, f, kstpkper=None, totim=None):
+    def _accumulate_flow_face(self, budget, recname, ich, axis, times):
         """
+        Accumulate the flow across the cell faces between zones and to
+        and from constant-head cells for a batch of times.
 
         Parameters
         ----------
-        fz
-        tz
-        f
-        kstpkper
-        totim
+        budget : np.ndarray
+            Budget terms of shape (ntimes, nrecnames, nzones) to add to.
+        recname : str
+            Face flow record name.
+        ich : np.ndarray
+            Boolean array of shape (ntimes, nlay, nrow, ncol) that is True
+            for constant-head cells.
+        axis : int
+            Model axis of the face flows: 0 for lower face, 1 for front
+            face and 2 for right face flows.
+        times : list of dicts
+            kstpkper or totim keyword argument of get_data() for each time.
 
         Returns
         -------
+        None
 
         """
-
-        # No circular flow within zones
-        fz, tz, f = self._filter_circular_flow(fz, tz, f)
-
-        if len(f) == 0:
+        if self.cbc_shape[axis] < 2:
             return
+        ntimes = len(times)
+        nzones = len(self.allzones)
+        data = self._get_array_data(recname, times)
+
+        # The face flow of a cell is the flow to the next cell along axis,
+        # so pair each cell with the next cell
+        after = (slice(None),) * (len(self.cbc_shape) - axis - 1)
+        lo = (Ellipsis, slice(None, -1)) + after
+        hi = (Ellipsis, slice(1, None)) + after
+        zlo = self._izone_index[lo]
+        zhi = self._izone_index[hi]
+        q = data[lo]
+        chlo = ich[lo]
+        chhi = ich[hi]
+        itime = np.arange(ntimes).reshape((ntimes,) + (1,) * len(self.cbc_shape))
+
+        # FLOW BETWEEN ZONES -- Don't include CH to CH flow (can occur if
+        # CHTOCH option is used). Sum the flux by (from zone, to zone).
+        f = np.where(chlo & chhi, 0.0, np.abs(q))
+        fz = np.where(q > 0, zlo, zhi)
+        tz = np.where(q > 0, zhi, zlo)
+        flow = np.bincount(
+            ((itime * nzones + fz) * nzones + tz).ravel(),
+            weights=f.ravel(),
+            minlength=ntimes * nzones * nzones,
+        ).reshape((ntimes, nzones, nzones))
 
-        # Inflows
-        idx = tz != 0
-        fzi = fz[idx]
-        tzi = tz[idx]
-        rownames = ["FROM_" + self._zonenamedict[z] for z in fzi]
-        colnames = [self._zonenamedict[z] for z in tzi]
-        fluxes = f[idx]
-        self._update_budget_recordarray(rownames, colnames, fluxes, kstpkper, totim)
-
-        # Outflows
-        idx = fz != 0
-        fzi = fz[idx]
-        tzi = tz[idx]
-        rownames = ["TO_" + self._zonenamedict[z] for z in tzi]
-        colnames = [self._zonenamedict[z] for z in fzi]
-        fluxes = f[idx]
-        self._update_budget_recordarray(rownames, colnames, fluxes, kstpkper, totim)
-        return
-
-    def _update_budget_fromssst(self, fz, tz, f, kstpkper=None, totim=None):
-        """
-
-        Parameters
-        ----------
-        fz
-        tz
-        f
-        kstpkper
-        totim
+        # No circular flow within zones
+        flow[:, np.arange(nzones), np.arange(nzones)] = 0.0
 
-        Returns
-        -------
+        # Inflows, to all zones but zone 0
+        budget[:, self._fromzone_rows] += flow * self._nonzero
+        # Outflows, from all zones but zone 0
+        budget[:, self._tozone_rows] += flow.transpose((0, 2, 1)) * self._nonzero
 
-        """
-        if len(f) == 0:
+        # CALCULATE FLOW TO AND FROM CONSTANT-HEAD CELLS, which is added
+        # to the zone of the constant-head cell
+        if "TO_CONSTANT_HEAD" not in self._rowindex:
             return
-        self._update_budget_recordarray(fz, tz, f, kstpkper, totim)
-        return
+        chlo, chhi = chlo & ~chhi, chhi & ~chlo
+        chzone = np.where(chhi, zhi, zlo)
+        idx = (itime * nzones + chzone).ravel()
+        into = (chhi & (q > 0)) | (chlo & (q < 0))
+        outof = (chhi & (q < 0)) | (chlo & (q > 0))
+        for recname, mask in (
+            ("TO_CONSTANT_HEAD", into),
+            ("FROM_CONSTANT_HEAD", outof),
+        ):
+            f = np.where(mask, np.abs(q), 0.0)
+            budget[:, self._rowindex[recname]] += np.bincount(
+                idx, weights=f.ravel(), minlength=ntimes * nzones
+            ).reshape((ntimes, nzones))
 
-    def _update_budget_recordarray(
-        self, rownames, colnames, fluxes, kstpkper=None, totim=None
-    ):
+    def _accumulate_flow_ssst(self, budget, recname, times):
         """
-        Update the budget record array with the flux for the specified
-        flow direction (in/out), record name, and column.
+        Accumulate the flow of a source/sink or storage term by zone for a
+        batch of times.
 
         Parameters
         ----------
-        rownames
-        colnames
-        fluxes
-        kstpkper
-        totim
+        budget : np.ndarray
+            Budget terms of shape (ntimes, nrecnames, nzones) to add to.
+        recname : str
+            Record name.
+        times : list of dicts
+            kstpkper or totim keyword argument of get_data() for each time.
 
         Returns
         -------
         None
 
         """
-        try:
-            if kstpkper is not None:
-                for rn, cn, flux in zip(rownames, colnames, fluxes):
-                    rowidx = np.asarray(
-                        (self._budget["time_step"] == kstpkper[0])
-                        & (self._budget["stress_period"] == kstpkper[1])
-                        & (self._budget["name"] == rn)
-                    ).nonzero()
-                    self._budget[cn][rowidx] += flux
-            elif totim is not None:
-                for rn, cn, flux in zip(rownames, colnames, fluxes):
-                    rowidx = np.asarray(
-                        (self._budget["totim"] == totim) & (self._budget["name"] == rn)
-                    ).nonzero()
-                    self._budget[cn][rowidx] += flux
-
-        except Exception as e:
-            print(e)
-            raise
-        return
-
-    def _accumulate_flow_frf(self, recname, ich, kstpkper, totim):
-        """
-
-        Parameters
-        ----------
-        recname
-        ich
-        kstpkper
-        totim
-
-        Returns
-        -------
-
-        """
-        try:
-            if self.ncol >= 2:
-                data = self.cbc.get_data(text=recname, kstpkper=kstpkper, totim=totim)[
-                    0
-                ]
-
-                # "FLOW RIGHT FACE"  COMPUTE FLOW BETWEEN ZONES ACROSS COLUMNS.
-                # COMPUTE FLOW ONLY BETWEEN A ZONE AND A HIGHER ZONE -- FLOW FROM
-                # ZONE 4 TO 3 IS THE NEGATIVE OF FLOW FROM 3 TO 4.
-                # 1ST, CALCULATE FLOW BETWEEN NODE J,I,K AND J-1,I,K
-
-                k, i, j = np.asarray(
-                    self.izone[:, :, 1:] > self.izone[:, :, :-1]
-                ).nonzero()
-
-                # Adjust column values to account for the starting position of "nz"
-                j += 1
-
-                # Define the zone to which flow is going
-                nz = self.izone[k, i, j]
-
-                # Define the zone from which flow is coming
-                jl = j - 1
-                nzl = self.izone[k, i, jl]
-
-                # Get the face flow
-                q = data[k, i, jl]
-
-                # Get indices with positive flow face values (out of higher zone)
-                # Don't include CH to CH flow (can occur if CHTOCH option is used)
-                # Create an iterable tuple of (from zone, to zone, flux)
-                # Then group tuple by (from_zone, to_zone) and sum the flux values
-                idx = np.asarray(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[k, i, jl] != 1))
-                ).nonzero()
-                fzi, tzi, fi = sum_flux_tuples(nzl[idx], nz[idx], q[idx])
-                self._update_budget_fromfaceflow(fzi, tzi, np.abs(fi), kstpkper, totim)
-
-                # Get indices with negative flow face values (into higher zone)
-                # Don't include CH to CH flow (can occur if CHTOCH option is used)
-                # Create an iterable tuple of (from zone, to zone, flux)
-                # Then group tuple by (from_zone, to_zone) and sum the flux values
-                idx = np.asarray(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[k, i, jl] != 1))
-                ).nonzero()
-                fzi, tzi, fi = sum_flux_tuples(nz[idx], nzl[idx], q[idx])
-                self._update_budget_fromfaceflow(fzi, tzi, np.abs(fi), kstpkper, totim)
-
-                # FLOW BETWEEN NODE J,I,K AND J+1,I,K
-                k, i, j = np.asarray(
-                    self.izone[:, :, :-1] > self.izone[:, :, 1:]
-                ).nonzero()
-
-                # Define the zone from which flow is coming
-                nz = self.izone[k, i, j]
-
-                # Define the zone to which flow is going
-                jr = j + 1
-                nzr = self.izone[k, i, jr]
-
-                # Get the face flow
-                q = data[k, i, j]
-
-                # Get indices with positive flow face values (out of higher zone)
-                # Don't include CH to CH flow (can occur if CHTOCH option is used)
-                # Create an iterable tuple of (from zone, to zone, flux)
-                # Then group tuple by (from_zone, to_zone) and sum the flux values
-                idx = np.asarray(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[k, i, jr] != 1))
-                ).nonzero()
-                fzi, tzi, fi = sum_flux_tuples(nz[idx], nzr[idx], q[idx])
-                self._update_budget_fromfaceflow(fzi, tzi, np.abs(fi), kstpkper, totim)
-
-                # Get indices with negative flow face values (into higher zone)
-                # Don't include CH to CH flow (can occur if CHTOCH option is used)
-                # Create an iterable tuple of (from zone, to zone, flux)
-                # Then group tuple by (from_zone, to_zone) and sum the flux values
-                idx = np.asarray(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[k, i, jr] != 1))
-                ).nonzero()
-                fzi, tzi, fi = sum_flux_tuples(nzr[idx], nz[idx], q[idx])
-                self._update_budget_fromfaceflow(fzi, tzi, np.abs(fi), kstpkper, totim)
-
-                # CALCULATE FLOW TO CONSTANT-HEAD CELLS IN THIS DIRECTION
-                k, i, j = np.asarray(ich == 1).nonzero()
-                k, i, j = k[j > 0], i[j > 0], j[j > 0]
-                jl = j - 1
-                nzl = self.izone[k, i, jl]
-                nz = self.izone[k, i, j]
-                q = data[k, i, jl]
-                idx = np.asarray(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[k, i, jl] != 1))
-                ).nonzero()
-                fzi, tzi, f = sum_flux_tuples(nzl[idx], nz[idx], q[idx])
-                fz = ["TO_CONSTANT_HEAD"] * len(tzi)
-                tz = [self._zonenamedict[z] for z in tzi]
-                self._update_budget_fromssst(fz, tz, np.abs(f), kstpkper, totim)
-
-                idx = np.asarray(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[k, i, jl] != 1))
-                ).nonzero()
-                fzi, tzi, f = sum_flux_tuples(nzl[idx], nz[idx], q[idx])
-                fz = ["FROM_CONSTANT_HEAD"] * len(fzi)
-                tz = [self._zonenamedict[z] for z in tzi[tzi != 0]]
-                self._update_budget_fromssst(fz, tz, np.abs(f), kstpkper, totim)
-
-                k, i, j = np.asarray(ich == 1).nonzero()
-                k, i, j = (
-                    k[j < self.ncol - 1],
-                    i[j < self.ncol - 1],
-                    j[j < self.ncol - 1],
-                )
-                nz = self.izone[k, i, j]
-                jr = j + 1
-                nzr = self.izone[k, i, jr]
-                q = data[k, i, j]
-                idx = np.asarray(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[k, i, jr] != 1))
-                ).nonzero()
-                fzi, tzi, f = sum_flux_tuples(nzr[idx], nz[idx], q[idx])
-                fz = ["FROM_CONSTANT_HEAD"] * len(tzi)
-                tz = [self._zonenamedict[z] for z in tzi]
-                self._update_budget_fromssst(fz, tz, np.abs(f), kstpkper, totim)
-
-                idx = np.asarray(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[k, i, jr] != 1))
-                ).nonzero()
-                fzi, tzi, f = sum_flux_tuples(nzr[idx], nz[idx], q[idx])
-                fz = ["TO_CONSTANT_HEAD"] * len(fzi)
-                tz = [self._zonenamedict[z] for z in tzi]
-                self._update_budget_fromssst(fz, tz, np.abs(f), kstpkper, totim)
-
-        except Exception as e:
-            print(e)
-            raise
-
-    def _accumulate_flow_fff(self, recname, ich, kstpkper, totim):
-        """
-
-        Parameters
-        ----------
-        recname
-        ich
-        kstpkper
-        totim
-
-        Returns
-        -------
-
-        """
-        try:
-            if self.nrow >= 2:
-                data = self.cbc.get_data(text=recname, kstpkper=kstpkper, totim=totim)[
-                    0
-                ]
-
-                # "FLOW FRONT FACE"
-                # CALCULATE FLOW BETWEEN NODE J,I,K AND J,I-1,K
-                k, i, j = np.asarray(
-                    self.izone[:, 1:, :] < self.izone[:, :-1, :]
-                ).nonzero()
-                i += 1
-                ia = i - 1
-                nza = self.izone[k, ia, j]
-                nz = self.izone[k, i, j]
-                q = data[k, ia, j]
-                idx = np.asarray(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[k, ia, j] != 1))
-                ).nonzero()
-                fzi, tzi, fi = sum_flux_tuples(nza[idx], nz[idx], q[idx])
-                self._update_budget_fromfaceflow(fzi, tzi, np.abs(fi), kstpkper, totim)
-
-                idx = np.asarray(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[k, ia, j] != 1))
-                ).nonzero()
-                fzi, tzi, fi = sum_flux_tuples(nz[idx], nza[idx], q[idx])
-                self._update_budget_fromfaceflow(fzi, tzi, np.abs(fi), kstpkper, totim)
+        # NOT AN INTERNAL FLOW TERM, SO MUST BE A SOURCE TERM OR STORAGE
+        # ACCUMULATE THE FLOW BY ZONE
+        ntimes = len(times)
+        nzones = len(self.allzones)
+        imeth = self.imeth[recname]
 
-                # CALCULATE FLOW BETWEEN NODE J,I,K AND J,I+1,K.
-                k, i, j = np.asarray(
-                    self.izone[:, :-1, :] < self.izone[:, 1:, :]
-                ).nonzero()
-                nz = self.izone[k, i, j]
-                ib = i + 1
-                nzb = self.izone[k, ib, j]
-                q = data[k, i, j]
-                idx = np.asarray(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[k, ib, j] != 1))
-                ).nonzero()
-                fzi, tzi, fi = sum_flux_tuples(nz[idx], nzb[idx], q[idx])
-                self._update_budget_fromfaceflow(fzi, tzi, np.abs(fi), kstpkper, totim)
+        idx = []
+        fluxes = []
+        for n, kwargs in enumerate(times):
+            data = self.cbc.get_data(text=recname, **kwargs)
+            if len(data) == 0:
+                # Empty data, can occur during the first time step of a
+                # transient model when storage terms are zero and not in the
+                # cell-budget file.
+                continue
+            data = data[0]
 
-                idx = np.asarray(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[k, ib, j] != 1))
-                ).nonzero()
-                fzi, tzi, fi = sum_flux_tuples(nzb[idx], nz[idx], q[idx])
-                self._update_budget_fromfaceflow(fzi, tzi, np.abs(fi), kstpkper, totim)
-
-                # CALCULATE FLOW TO CONSTANT-HEAD CELLS IN THIS DIRECTION
-                k, i, j = np.asarray(ich == 1).nonzero()
-                k, i, j = k[i > 0], i[i > 0], j[i > 0]
-                ia = i - 1
-                nza = self.izone[k, ia, j]
-                nz = self.izone[k, i, j]
-                q = data[k, ia, j]
-                idx = np.asarray(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[k, ia, j] != 1))
-                ).nonzero()
-                fzi, tzi, f = sum_flux_tuples(nza[idx], nz[idx], q[idx])
-                fz = ["TO_CONSTANT_HEAD"] * len(tzi)
-                tz = [self._zonenamedict[z] for z in tzi]
-                self._update_budget_fromssst(fz, tz, np.abs(f), kstpkper, totim)
+            if imeth == 2 or imeth == 5:
+                # LIST
+                zone = self._izone_index.ravel()[data["node"] - 1]
+                q = data["q"]
+            elif imeth == 0 or imeth == 1:
+                # FULL 3-D ARRAY
+                zone = self._izone_index
+                q = data
+            elif imeth == 3:
+                # 1-LAYER ARRAY WITH LAYER INDICATOR ARRAY
+                rlay, q = data[0], data[1]
+                r, c = np.indices(rlay.shape)
+                zone = self._izone_index[rlay - 1, r, c]
+            elif imeth == 4:
+                # 1-LAYER ARRAY THAT DEFINES LAYER 1
+                zone = self._izone_index[0]
+                q = data
+            else:
+                # Should not happen
+                raise Exception(f'Unrecognized "imeth" for {recname} record: {imeth}')
+            idx.append(n * nzones + np.ravel(zone))
+            fluxes.append(np.ravel(np.ma.filled(q, 0.0)).astype(np.float64))
 
-                idx = np.asarray(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[k, ia, j] != 1))
-                ).nonzero()
-                fzi, tzi, f = sum_flux_tuples(nza[idx], nz[idx], q[idx])
-                fz = ["FROM_CONSTANT_HEAD"] * len(fzi)
-                tz = [self._zonenamedict[z] for z in tzi]
-                self._update_budget_fromssst(fz, tz, np.abs(f), kstpkper, totim)
-
-                k, i, j = np.asarray(ich == 1).nonzero()
-                k, i, j = (
-                    k[i < self.nrow - 1],
-                    i[i < self.nrow - 1],
-                    j[i < self.nrow - 1],
-                )
-                nz = self.izone[k, i, j]
-                ib = i + 1
-                nzb = self.izone[k, ib, j]
-                q = data[k, i, j]
-                idx = np.asarray(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[k, ib, j] != 1))
-                ).nonzero()
-                fzi, tzi, f = sum_flux_tuples(nzb[idx], nz[idx], q[idx])
-                fz = ["FROM_CONSTANT_HEAD"] * len(tzi)
-                tz = [self._zonenamedict[z] for z in tzi]
-                self._update_budget_fromssst(fz, tz, np.abs(f), kstpkper, totim)
+        if len(idx) == 0:
+            return
+        idx = np.concatenate(idx)
+        q = np.concatenate(fluxes)
+        name = "_".join(recname.split())
 
-                idx = np.asarray(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[k, ib, j] != 1))
-                ).nonzero()
-                fzi, tzi, f = sum_flux_tuples(nzb[idx], nz[idx], q[idx])
-                fz = ["TO_CONSTANT_HEAD"] * len(fzi)
-                tz = [self._zonenamedict[z] for z in tzi]
-                self._update_budget_fromssst(fz, tz, np.abs(f), kstpkper, totim)
-
-        except Exception as e:
-            print(e)
-            raise
-        return
+        # Inflows and outflows, for all zones but zone 0
+        for recname, f in (("FROM_" + name, q > 0), ("TO_" + name, q < 0)):
+            f = np.bincount(
+                idx, weights=np.where(f, np.abs(q), 0.0), minlength=ntimes * nzones
+            ).reshape((ntimes, nzones))
+            budget[:, self._rowindex[recname]] += f * self._nonzero
 
-    def _accumulate_flow_flf(self, recname, ich, kstpkper, totim):
+    def _compute_mass_balance(self, budget):
         """
+        Compute total inflow, total outflow, and percent error by zone for
+        a batch of times.
 
         Parameters
         ----------
-        recname
-        ich
-        kstpkper
-        totim
+        budget : np.ndarray
+            Budget terms of shape (ntimes, nrecnames, nzones) to update.
 
         Returns
         -------
+        None
 
         """
-        try:
-            if self.nlay >= 2:
-                data = self.cbc.get_data(text=recname, kstpkper=kstpkper, totim=totim)[
-                    0
-                ]
-
-                # "FLOW LOWER FACE"
-                # CALCULATE FLOW BETWEEN NODE J,I,K AND J,I,K-1
-                k, i, j = np.asarray(
-                    self.izone[1:, :, :] < self.izone[:-1, :, :]
-                ).nonzero()
-                k += 1
-                ka = k - 1
-                nza = self.izone[ka, i, j]
-                nz = self.izone[k, i, j]
-                q = data[ka, i, j]
-                idx = np.asarray(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[ka, i, j] != 1))
-                ).nonzero()
-                fzi, tzi, fi = sum_flux_tuples(nza[idx], nz[idx], q[idx])
-                self._update_budget_fromfaceflow(fzi, tzi, np.abs(fi), kstpkper, totim)
-
-                idx = np.asarray(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[ka, i, j] != 1))
-                ).nonzero()
-                fzi, tzi, fi = sum_flux_tuples(nz[idx], nza[idx], q[idx])
-                self._update_budget_fromfaceflow(fzi, tzi, np.abs(fi), kstpkper, totim)
-
-                # CALCULATE FLOW BETWEEN NODE J,I,K AND J,I,K+1
-                k, i, j = np.asarray(
-                    self.izone[:-1, :, :] < self.izone[1:, :, :]
-                ).nonzero()
-                nz = self.izone[k, i, j]
-                kb = k + 1
-                nzb = self.izone[kb, i, j]
-                q = data[k, i, j]
-                idx = np.asarray(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[kb, i, j] != 1))
-                ).nonzero()
-                fzi, tzi, fi = sum_flux_tuples(nz[idx], nzb[idx], q[idx])
-                self._update_budget_fromfaceflow(fzi, tzi, np.abs(fi), kstpkper, totim)
-
-                idx = np.asarray(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[kb, i, j] != 1))
-                ).nonzero()
-                fzi, tzi, fi = sum_flux_tuples(nzb[idx], nz[idx], q[idx])
-                self._update_budget_fromfaceflow(fzi, tzi, np.abs(fi), kstpkper, totim)
-
-                # CALCULATE FLOW TO CONSTANT-HEAD CELLS IN THIS DIRECTION
-                k, i, j = np.asarray(ich == 1).nonzero()
-                k, i, j = k[k > 0], i[k > 0], j[k > 0]
-                ka = k - 1
-                nza = self.izone[ka, i, j]
-                nz = self.izone[k, i, j]
-                q = data[ka, i, j]
-                idx = np.asarray(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[ka, i, j] != 1))
-                ).nonzero()
-                fzi, tzi, f = sum_flux_tuples(nza[idx], nz[idx], q[idx])
-                fz = ["TO_CONSTANT_HEAD"] * len(tzi)
-                tz = [self._zonenamedict[z] for z in tzi]
-                self._update_budget_fromssst(fz, tz, np.abs(f), kstpkper, totim)
-
-                idx = np.asarray(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[ka, i, j] != 1))
-                ).nonzero()
-                fzi, tzi, f = sum_flux_tuples(nza[idx], nz[idx], q[idx])
-                fz = ["FROM_CONSTANT_HEAD"] * len(fzi)
-                tz = [self._zonenamedict[z] for z in tzi]
-                self._update_budget_fromssst(fz, tz, np.abs(f), kstpkper, totim)
-
-                k, i, j = np.asarray(ich == 1).nonzero()
-                k, i, j = (
-                    k[k < self.nlay - 1],
-                    i[k < self.nlay - 1],
-                    j[k < self.nlay - 1],
-                )
-                nz = self.izone[k, i, j]
-                kb = k + 1
-                nzb = self.izone[kb, i, j]
-                q = data[k, i, j]
-                idx = np.asarray(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[kb, i, j] != 1))
-                ).nonzero()
-                fzi, tzi, f = sum_flux_tuples(nzb[idx], nz[idx], q[idx])
-                fz = ["FROM_CONSTANT_HEAD"] * len(tzi)
-                tz = [self._zonenamedict[z] for z in tzi]
-                self._update_budget_fromssst(fz, tz, np.abs(f), kstpkper, totim)
-
-                idx = np.asarray(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[kb, i, j] != 1))
-                ).nonzero()
-                fzi, tzi, f = sum_flux_tuples(nzb[idx], nz[idx], q[idx])
-                fz = ["TO_CONSTANT_HEAD"] * len(fzi)
-                tz = [self._zonenamedict[z] for z in tzi]
-                self._update_budget_fromssst(fz, tz, np.abs(f), kstpkper, totim)
-
-        except Exception as e:
-            print(e)
-            raise
-
-    def _accumulate_flow_ssst(self, recname, kstpkper, totim):
-        # NOT AN INTERNAL FLOW TERM, SO MUST BE A SOURCE TERM OR STORAGE
-        # ACCUMULATE THE FLOW BY ZONE
-
-        imeth = self.imeth[recname]
-
-        data = self.cbc.get_data(text=recname, kstpkper=kstpkper, totim=totim)
-        if len(data) == 0:
-            # Empty data, can occur during the first time step of a transient
-            # model when storage terms are zero and not in the cell-budget
-            # file.
-            return
-        else:
-            data = data[0]
-
-        if imeth == 2 or imeth == 5:
-            # LIST
-            qin = np.ma.zeros((self.nlay * self.nrow * self.ncol), self.float_type)
-            qout = np.ma.zeros((self.nlay * self.nrow * self.ncol), self.float_type)
-            for [node, q] in zip(data["node"], data["q"]):
-                idx = node - 1
-                if q > 0:
-                    qin.data[idx] += q
-                elif q < 0:
-                    qout.data[idx] += q
-            qin = np.ma.reshape(qin, (self.nlay, self.nrow, self.ncol))
-            qout = np.ma.reshape(qout, (self.nlay, self.nrow, self.ncol))
-        elif imeth == 0 or imeth == 1:
-            # FULL 3-D ARRAY
-            qin = np.ma.zeros(self.cbc_shape, self.float_type)
-            qout = np.ma.zeros(self.cbc_shape, self.float_type)
-            qin[data > 0] = data[data > 0]
-            qout[data < 0] = data[data < 0]
-        elif imeth == 3:
-            # 1-LAYER ARRAY WITH LAYER INDICATOR ARRAY
-            rlay, rdata = data[0], data[1]
-            data = np.ma.zeros(self.cbc_shape, self.float_type)
-            for (r, c), l in np.ndenumerate(rlay):
-                data[l - 1, r, c] = rdata[r, c]
-            qin = np.ma.zeros(self.cbc_shape, self.float_type)
-            qout = np.ma.zeros(self.cbc_shape, self.float_type)
-            qin[data > 0] = data[data > 0]
-            qout[data < 0] = data[data < 0]
-        elif imeth == 4:
-            # 1-LAYER ARRAY THAT DEFINES LAYER 1
-            qin = np.ma.zeros(self.cbc_shape, self.float_type)
-            qout = np.ma.zeros(self.cbc_shape, self.float_type)
-            r, c = np.asarray(data > 0).nonzero()
-            qin[0, r, c] = data[r, c]
-            r, c = np.asarray(data < 0).nonzero()
-            qout[0, r, c] = data[r, c]
-        else:
-            # Should not happen
-            raise Exception(f'Unrecognized "imeth" for {recname} record: {imeth}')
-
-        # Inflows
-        fz = []
-        tz = []
-        f = []
-        for z in self.allzones:
-            if z != 0:
-                flux = qin[(self.izone == z)].sum()
-                if type(flux) == np.ma.core.MaskedConstant:
-                    flux = 0.0
-                fz.append("FROM_" + "_".join(recname.split()))
-                tz.append(self._zonenamedict[z])
-                f.append(flux)
-        fz = np.array(fz)
-        tz = np.array(tz)
-        f = np.array(f)
-        self._update_budget_fromssst(fz, tz, np.abs(f), kstpkper, totim)
-
-        # Outflows
-        fz = []
-        tz = []
-        f = []
-        for z in self.allzones:
-            if z != 0:
-                flux = qout[(self.izone == z)].sum()
-                if type(flux) == np.ma.core.MaskedConstant:
-                    flux = 0.0
-                fz.append("TO_" + "_".join(recname.split()))
-                tz.append(self._zonenamedict[z])
-                f.append(flux)
-        fz = np.array(fz)
-        tz = np.array(tz)
-        f = np.array(f)
-        self._update_budget_fromssst(fz, tz, np.abs(f), kstpkper, totim)
-
-    def _compute_mass_balance(self, kstpkper, totim):
-        # Returns a record array with total inflow, total outflow,
-        # and percent error summed by column.
-        skipcols = ["time_step", "stress_period", "totim", "name"]
-
-        # Compute inflows
-        recnames = self.get_record_names()
-        innames = [n for n in recnames if n.startswith("FROM_")]
-        outnames = [n for n in recnames if n.startswith("TO_")]
-        if kstpkper is not None:
-            rowidx = np.asarray(
-                (self._budget["time_step"] == kstpkper[0])
-                & (self._budget["stress_period"] == kstpkper[1])
-                & np.in1d(self._budget["name"], innames)
-            ).nonzero()
-        elif totim is not None:
-            rowidx = np.asarray(
-                (self._budget["totim"] == totim)
-                & np.in1d(self._budget["name"], innames)
-            ).nonzero()
-        a = _numpyvoid2numeric(self._budget[list(self._zonenamedict.values())][rowidx])
-        intot = np.array(a.sum(axis=0))
-        tz = np.array([n for n in self._budget.dtype.names if n not in skipcols])
-        fz = np.array(["TOTAL_IN"] * len(tz))
-        self._update_budget_fromssst(fz, tz, intot, kstpkper, totim)
-
-        # Compute outflows
-        if kstpkper is not None:
-            rowidx = np.asarray(
-                (self._budget["time_step"] == kstpkper[0])
-                & (self._budget["stress_period"] == kstpkper[1])
-                & np.in1d(self._budget["name"], outnames)
-            ).nonzero()
-        elif totim is not None:
-            rowidx = np.asarray(
-                (self._budget["totim"] == totim)
-                & np.in1d(self._budget["name"], outnames)
-            ).nonzero()
-        a = _numpyvoid2numeric(self._budget[list(self._zonenamedict.values())][rowidx])
-        outot = np.array(a.sum(axis=0))
-        tz = np.array([n for n in self._budget.dtype.names if n not in skipcols])
-        fz = np.array(["TOTAL_OUT"] * len(tz))
-        self._update_budget_fromssst(fz, tz, outot, kstpkper, totim)
+        innames = [n for n in self._recnames if n.startswith("FROM_")]
+        outnames = [n for n in self._recnames if n.startswith("TO_")]
+        intot = budget[:, [self._rowindex[n] for n in innames]].sum(axis=1)
+        outot = budget[:, [self._rowindex[n] for n in outnames]].sum(axis=1)
+        budget[:, self._rowindex["TOTAL_IN"]] = intot
+        budget[:, self._rowindex["TOTAL_OUT"]] = outot
 
         # Compute IN-OUT
-        tz = np.array([n for n in self._budget.dtype.names if n not in skipcols])
-        f = intot - outot
-        fz = np.array(["IN-OUT"] * len(tz))
-        self._update_budget_fromssst(fz, tz, np.abs(f), kstpkper, totim)
+        in_minus_out = intot - outot
+        budget[:, self._rowindex["IN-OUT"]] = np.abs(in_minus_out)
 
         # Compute percent discrepancy
-        tz = np.array([n for n in self._budget.dtype.names if n not in skipcols])
-        fz = np.array(["PERCENT_DISCREPANCY"] * len(tz))
-        in_minus_out = intot - outot
         in_plus_out = intot + outot
-        f = 100 * in_minus_out / (in_plus_out / 2.0)
-        self._update_budget_fromssst(fz, tz, np.abs(f), kstpkper, totim)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            f = 100 * in_minus_out / (in_plus_out / 2.0)
+        budget[:, self._rowindex["PERCENT_DISCREPANCY"]] = np.abs(f)
 
     def get_model_shape(self):
         """Get model shape
@@ -2170,12 +1829,27 @@ class ZoneFile6:
         return zon
 
 
-def _numpyvoid2numeric(a):
-    # The budget record array has multiple dtypes and a slice returns
-    # the flexible-type numpy.void which must be converted to a numeric
-    # type prior to performing reducing functions such as sum() or
-    # mean()
-    return np.array([list(r) for r in a])
+# ZoneBudget of the current process of a ZoneBudget process pool
+_budget_worker = None
+
+
+def _init_budget_worker(zb):
+    """
+    Set the pickled ZoneBudget used by a process of a ZoneBudget process
+    pool.
+
+    """
+    global _budget_worker
+    _budget_worker = pickle.loads(zb)
+
+
+def _compute_budget_worker(kwargs):
+    """
+    Compute the budget terms for a batch of times in a process of a
+    ZoneBudget process pool.
+
+    """
+    return _budget_worker._get_budget_terms(**kwargs)
 
 
 def sum_flux_tuples(fromzones, tozones, fluxes):